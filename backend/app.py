@@ -1,10 +1,8 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-import os
+from starlette.concurrency import run_in_threadpool
 import logging
-from dotenv import load_dotenv
-import asyncio
 
 # Configure logging - use more detailed logging for Hugging Face debugging
 logging.basicConfig(
@@ -13,45 +11,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
-
 from src.api.auth_router import auth_router
 from src.api.task_router import task_router
+from src.api.metrics_router import metrics_router
+from src.api.health_router import health_router
+from src.middleware.metrics_middleware import MetricsMiddleware
+from src.config import settings
 from src.database import create_tables
+from src.services.password_hasher import password_hasher, PASSWORD_HASH_TARGET_MS
+from src.services.task_events import task_events
+from src.services.health import readiness_probe
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup logic - create database tables
     logger.info("Starting up FastAPI application...")
-    logger.info(f"DATABASE_URL environment variable exists: {'DATABASE_URL' in os.environ}")
-    logger.info(f"Database URL starts with postgresql: {os.getenv('DATABASE_URL', '').startswith('postgresql')}")
-    
+    logger.info(f"DATABASE_URL is set: {'database_url' in settings.model_fields_set}")
+    logger.info(f"Database URL starts with postgresql: {settings.database_url.startswith('postgresql')}")
+
     try:
-        # Add a retry mechanism for database initialization
-        max_retries = 5
-        for attempt in range(max_retries):
-            try:
-                create_tables()
-                logger.info("Database tables created/verified successfully")
-                break
-            except Exception as e:
-                logger.warning(f"Database initialization attempt {attempt + 1} failed: {str(e)}")
-                if attempt == max_retries - 1:
-                    logger.error(f"Failed to initialize database after {max_retries} attempts")
-                    raise
-                # Wait progressively longer between attempts
-                wait_time = 2 ** attempt  # Exponential backoff
-                logger.info(f"Waiting {wait_time}s before next attempt...")
-                await asyncio.sleep(wait_time)
-                
+        # Off the event loop; a current schema is confirmed with one query, and
+        # create_tables retries connection failures with backoff (DB_STARTUP_ATTEMPTS)
+        await run_in_threadpool(create_tables)
+        logger.info("Database tables created/verified successfully")
     except Exception as e:
         logger.error(f"Database connection error: {str(e)}")
         raise
+
+    # Start the argon2 worker pool, optionally tuning its cost to the latency budget
+    password_hasher.start()
+    if PASSWORD_HASH_TARGET_MS > 0:
+        await password_hasher.calibrate(PASSWORD_HASH_TARGET_MS)
+
+    # Start listening for task change events from other workers (no-op for the local bus)
+    await task_events.start()
+
     logger.info("FastAPI application started successfully")
     yield
     # Shutdown logic can go here
     logger.info("Shutting down FastAPI application...")
+    # Fail readiness so load balancers stop sending new requests
+    readiness_probe.draining = True
+    password_hasher.shutdown()
+    await task_events.stop()
 
 app = FastAPI(
     title="Todo Web Application API",
@@ -79,13 +81,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Last-Modified"],
 )
 
 logger.info("CORS middleware configured")
 
+# Outermost, so latency covers every other middleware
+app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(auth_router, prefix="/auth", tags=["Authentication"])
 app.include_router(task_router, prefix="/tasks", tags=["Tasks"])
+app.include_router(metrics_router, tags=["Monitoring"])
+app.include_router(health_router, tags=["Monitoring"])
 
 logger.info("Auth router mounted")
 logger.info("Task router mounted")
@@ -94,16 +102,12 @@ logger.info("Task router mounted")
 def read_root():
     return {"message": "Todo Web Application API"}
 
-@app.get("/health")
-def health_check():
-    return {"status": "healthy"}
-
 @app.get("/debug/env")
 def debug_env():
     """Debug endpoint to check environment variables"""
     return {
-        "database_url_set": "DATABASE_URL" in os.environ,
-        "database_url_preview": os.getenv("DATABASE_URL", "")[:50] + "..." if os.getenv("DATABASE_URL") else "Not set",
+        "database_url_set": "database_url" in settings.model_fields_set,
+        "database_url_preview": settings.database_url[:50] + "..." if "database_url" in settings.model_fields_set else "Not set",
     }
 
 # Log when the module is loaded
@@ -0,0 +1,73 @@
+"""
+Microbenchmark: per-request cost of MetricsMiddleware.
+
+Calls a minimal FastAPI app directly over ASGI (no sockets, no client),
+with and without the middleware, and reports the difference alongside the
+overhead the middleware attributes to itself
+(http_metrics_overhead_seconds_total).
+
+    python -m benchmarks.bench_metrics_overhead [iterations]
+"""
+import asyncio
+import json
+import sys
+import time
+
+from fastapi import FastAPI
+
+from src.middleware.metrics_middleware import MetricsMiddleware, OVERHEAD_SECONDS
+
+
+def _build_app(instrumented: bool):
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int):
+        return {"id": item_id}
+
+    return MetricsMiddleware(app) if instrumented else app
+
+
+async def _per_request_us(app, iterations: int) -> float:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/items/1", "raw_path": b"/items/1", "root_path": "",
+        "query_string": b"", "headers": [], "client": ("bench", 1), "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(200):  # warm up
+        await app(dict(scope), receive, send)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+async def _run(iterations: int) -> dict:
+    baseline = await _per_request_us(_build_app(False), iterations)
+    before = OVERHEAD_SECONDS.value()
+    instrumented = await _per_request_us(_build_app(True), iterations)
+    self_reported = (OVERHEAD_SECONDS.value() - before) / (iterations + 200) * 1e6
+
+    return {
+        "benchmark": "metrics_overhead",
+        "iterations": iterations,
+        "baseline_us_per_request": round(baseline, 2),
+        "instrumented_us_per_request": round(instrumented, 2),
+        "overhead_us_per_request": round(instrumented - baseline, 2),
+        "self_reported_overhead_us_per_request": round(self_reported, 2),
+    }
+
+
+def main(iterations: int = 20000) -> dict:
+    return asyncio.run(_run(iterations))
+
+
+if __name__ == "__main__":
+    print(json.dumps(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000), indent=2))
@@ -0,0 +1,115 @@
+"""
+Benchmark: cold-start cost of the API, as seen by a scale-to-zero platform.
+
+Each sample runs in a new interpreter:
+
+- import: time to `import src.main` (settings, models, routers, engine);
+- first response: from spawning `uvicorn src.main:app` to the first 200
+  from GET /health/live, i.e. imports plus the lifespan (schema bootstrap,
+  hashing pool, event bus). "new database" runs every migration; "current
+  schema" is the usual warm-database boot, where startup only confirms the
+  Alembic version.
+
+Runs against a SQLite file by default, or --database-url:
+
+    python -m benchmarks.bench_startup --samples 5
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SNIPPET = (
+    "import time; started = time.perf_counter(); import src.main; "
+    "print((time.perf_counter() - started) * 1000)"
+)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _import_ms(env: dict) -> float:
+    result = subprocess.run([sys.executable, "-c", IMPORT_SNIPPET], cwd=BACKEND_DIR, env=env,
+                            capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def _python_startup_ms(env: dict) -> float:
+    """Bare interpreter start, for reference"""
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], cwd=BACKEND_DIR, env=env, check=True)
+    return (time.perf_counter() - started) * 1000
+
+
+def _first_response_ms(env: dict, timeout: float = 60) -> float:
+    port = _free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health/live", timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - started) * 1000
+            except OSError:
+                if server.poll() is not None:
+                    raise RuntimeError(f"server exited with status {server.returncode}")
+                time.sleep(0.005)
+        raise TimeoutError("no response from the server")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def _summary(samples) -> dict:
+    return {"median_ms": round(statistics.median(samples), 1), "min_ms": round(min(samples), 1),
+            "samples": len(samples)}
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_startup")
+    parser.add_argument("--database-url", default=None,
+                        help="Database to run against (default: SQLite files in a temp dir)")
+    parser.add_argument("--samples", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        def env_for(database_url: str) -> dict:
+            return dict(os.environ, DATABASE_URL=database_url)
+
+        current = env_for(args.database_url or f"sqlite:///{os.path.join(tmp, 'current.db')}")
+        # Boot once so the schema is at head (and bytecode is cached) before timing
+        _first_response_ms(current)
+
+        import_samples = [_import_ms(current) for _ in range(args.samples)]
+        current_samples = [_first_response_ms(current) for _ in range(args.samples)]
+        results = {
+            "python_startup": _summary([_python_startup_ms(current) for _ in range(args.samples)]),
+            "import_src_main": _summary(import_samples),
+            "first_response_current_schema": _summary(current_samples),
+        }
+        if args.database_url is None:
+            fresh = [_first_response_ms(env_for(f"sqlite:///{os.path.join(tmp, f'new-{i}.db')}"))
+                     for i in range(args.samples)]
+            results["first_response_new_database"] = _summary(fresh)
+
+    return {"benchmark": "startup", "database": (args.database_url or "sqlite").split(":")[0],
+            "results": results}
+
+
+if __name__ == "__main__":
+    print(json.dumps(main(), indent=2))
@@ -0,0 +1,84 @@
+"""
+Benchmark: memory and time to first byte of the streaming task export
+against materializing the whole list.
+
+For each size, one user's tasks are written to an in-memory SQLite database
+and exported twice:
+
+- stream: task_export.export_stream, as served by GET /tasks/export
+- list: TaskService.get_tasks_by_user, then one JSON document for the list
+
+Peak Python heap (tracemalloc) should stay flat for the stream as the task
+count grows, while the list grows linearly.
+
+    python -m benchmarks.bench_task_export --sizes 10000,100000
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from benchmarks.bench_task_list_json import _seed
+
+
+def _measure(engine, user_id: str, count: int) -> dict:
+    from sqlmodel import Session
+
+    from src.api.task_router import task_list_adapter
+    from src.models.todo_task import TodoTaskRead
+    from src.services.task_export import export_stream
+    from src.services.task_service import TaskService
+
+    def stream():
+        with Session(engine) as session:
+            first_chunk_at, size = None, 0
+            for chunk in export_stream(user_id, session, "ndjson"):
+                if first_chunk_at is None:
+                    first_chunk_at = time.perf_counter()
+                size += len(chunk)
+            return first_chunk_at, size
+
+    def materialized():
+        with Session(engine) as session:
+            tasks = TaskService.get_tasks_by_user(user_id, session)
+            body = task_list_adapter.dump_json([TodoTaskRead.model_validate(task).model_dump() for task in tasks])
+            return time.perf_counter(), len(body)
+
+    results = {"tasks": count}
+    for name, fn in (("stream", stream), ("list", materialized)):
+        tracemalloc.start()
+        started = time.perf_counter()
+        first_byte_at, size = fn()
+        total = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name] = {
+            "first_byte_ms": round((first_byte_at - started) * 1000, 1),
+            "total_ms": round(total * 1000, 1),
+            "peak_heap_mb": round(peak / 2 ** 20, 2),
+            "body_bytes": size,
+        }
+    return results
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_task_export")
+    parser.add_argument("--sizes", default="10000,100000", help="Comma-separated task counts")
+    args = parser.parse_args(argv)
+
+    from sqlalchemy.pool import StaticPool
+    from sqlmodel import SQLModel, create_engine
+
+    import src.models.todo_task  # noqa: F401 - registers the tables
+
+    results = []
+    for count in (int(size) for size in args.sizes.split(",")):
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(engine)
+        results.append(_measure(engine, _seed(engine, count), count))
+        engine.dispose()
+    return {"benchmark": "task_export", "results": results}
+
+
+if __name__ == "__main__":
+    print(json.dumps(main(), indent=2))
@@ -0,0 +1,78 @@
+"""
+Benchmark: POST /tasks/import throughput against looping POST /tasks/.
+
+Runs src.main.app in-process behind httpx's ASGI transport, against a new
+SQLite file by default or --database-url (Postgres uses COPY):
+
+    python -m benchmarks.bench_task_import --tasks 20000 --single 500
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+
+
+async def _run(args) -> dict:
+    os.environ["DATABASE_URL"] = args.database_url
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    import httpx
+
+    from benchmarks.load_test import seed
+    from src.database import engine
+    from src.main import app
+
+    async with app.router.lifespan_context(app):
+        user = seed(engine, 1, 0)[0]
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            started = time.perf_counter()
+            for i in range(args.single):
+                response = await client.post("/tasks/", json={"title": f"Single {i}"}, headers=user.headers)
+                response.raise_for_status()
+            single_seconds = time.perf_counter() - started
+
+            body = "".join(json.dumps({"title": f"Imported {i}", "priority": "low"}) + "\n"
+                           for i in range(args.tasks)).encode()
+
+            async def chunks():
+                for offset in range(0, len(body), 65536):
+                    yield body[offset:offset + 65536]
+
+            started = time.perf_counter()
+            response = await client.post("/tasks/import", content=chunks(), headers=user.headers)
+            import_seconds = time.perf_counter() - started
+            response.raise_for_status()
+            result = response.json()
+
+    single_rate = args.single / single_seconds
+    import_rate = result["imported"] / import_seconds
+    return {
+        "benchmark": "task_import",
+        "database": engine.dialect.name,
+        "single_create": {"tasks": args.single, "seconds": round(single_seconds, 3),
+                          "tasks_per_second": round(single_rate, 1)},
+        "import": {"tasks": result["imported"], "failed": result["failed"], "body_bytes": len(body),
+                   "seconds": round(import_seconds, 3), "tasks_per_second": round(import_rate, 1)},
+        "speedup": round(import_rate / single_rate, 1),
+    }
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_task_import")
+    parser.add_argument("--database-url", default=None,
+                        help="Database to run against (default: a new SQLite file in a temp dir)")
+    parser.add_argument("--tasks", type=int, default=20000, help="Tasks in the import upload")
+    parser.add_argument("--single", type=int, default=500, help="Tasks created one request at a time")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.database_url is None:
+            args.database_url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        return asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    print(json.dumps(main(), indent=2))
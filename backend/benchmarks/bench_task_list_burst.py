@@ -0,0 +1,103 @@
+"""
+Benchmark: bursts of identical GET /tasks/ requests from one user (retries,
+several open tabs), with and without request coalescing.
+
+Runs src.main.app in-process behind httpx's ASGI transport against a new
+SQLite file (or --database-url). Each burst sends --burst concurrent
+identical list requests; the report gives list queries executed and
+wall time per burst. "uncoalesced" replaces the singleflight with a
+pass-through, i.e. the previous behaviour.
+
+    python -m benchmarks.bench_task_list_burst --tasks 500 --burst 16 --bursts 20
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import tempfile
+import time
+
+
+async def _run(args) -> dict:
+    os.environ["DATABASE_URL"] = args.database_url
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    import httpx
+
+    from benchmarks.load_test import seed
+    from src.database import engine
+    from src.main import app
+    from src.services.singleflight import task_list_flights
+    from src.services.task_service import TaskService
+
+    queries = []
+    original_page = TaskService.get_tasks_page
+
+    def counted_page(*a, **kw):
+        queries.append(1)
+        return original_page(*a, **kw)
+
+    TaskService.get_tasks_page = staticmethod(counted_page)
+    coalesced_do = task_list_flights.do
+
+    async def passthrough(owner_id, key, fn):
+        return await fn()
+
+    results = {}
+    async with app.router.lifespan_context(app):
+        user = seed(engine, 1, args.tasks)[0]
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            async def burst():
+                responses = await asyncio.gather(*[
+                    client.get("/tasks/", params={"limit": args.limit}, headers=user.headers)
+                    for _ in range(args.burst)
+                ])
+                for response in responses:
+                    response.raise_for_status()
+
+            for name, do in (("uncoalesced", passthrough), ("coalesced", coalesced_do)):
+                task_list_flights.do = do
+                await burst()  # warm up
+                queries.clear()
+                timings = []
+                for _ in range(args.bursts):
+                    started = time.perf_counter()
+                    await burst()
+                    timings.append(time.perf_counter() - started)
+                results[name] = {
+                    "queries_per_burst": round(len(queries) / args.bursts, 2),
+                    "burst_ms_median": round(statistics.median(timings) * 1000, 2),
+                }
+    task_list_flights.do = coalesced_do
+    TaskService.get_tasks_page = staticmethod(original_page)
+
+    return {
+        "benchmark": "task_list_burst",
+        "database": engine.dialect.name,
+        "tasks": args.tasks,
+        "burst": args.burst,
+        "results": results,
+        "speedup": round(results["uncoalesced"]["burst_ms_median"] / results["coalesced"]["burst_ms_median"], 2),
+    }
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_task_list_burst")
+    parser.add_argument("--database-url", default=None,
+                        help="Database to run against (default: a new SQLite file in a temp dir)")
+    parser.add_argument("--tasks", type=int, default=500, help="Tasks owned by the user")
+    parser.add_argument("--limit", type=int, default=500, help="Page size requested")
+    parser.add_argument("--burst", type=int, default=16, help="Concurrent identical requests per burst")
+    parser.add_argument("--bursts", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.database_url is None:
+            args.database_url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        return asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    print(json.dumps(main(), indent=2))
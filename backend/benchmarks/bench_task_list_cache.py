@@ -0,0 +1,95 @@
+"""
+Benchmark: repeat GET /tasks/ reads of an unchanged list, with and without
+the encoded page cache.
+
+Runs src.main.app in-process behind httpx's ASGI transport against a new
+SQLite file (or --database-url). Each round sends --requests sequential
+identical list requests; the report gives list queries executed and the
+median request latency. "uncached" disables the cache (TASK_LIST_CACHE_MAX_BYTES=0),
+i.e. the previous behaviour.
+
+    python -m benchmarks.bench_task_list_cache --tasks 500 --requests 200
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import tempfile
+import time
+
+
+async def _run(args) -> dict:
+    os.environ["DATABASE_URL"] = args.database_url
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    import httpx
+
+    from benchmarks.load_test import seed
+    from src.database import engine
+    from src.main import app
+    from src.services.task_list_cache import InProcessBackend, task_list_cache
+    from src.services.task_service import TaskService
+
+    queries = []
+    original_page = TaskService.get_tasks_page
+
+    def counted_page(*a, **kw):
+        queries.append(1)
+        return original_page(*a, **kw)
+
+    TaskService.get_tasks_page = staticmethod(counted_page)
+    cached_backend = task_list_cache.backend or InProcessBackend()
+
+    results = {}
+    async with app.router.lifespan_context(app):
+        user = seed(engine, 1, args.tasks)[0]
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            async def read():
+                response = await client.get("/tasks/", params={"limit": args.limit}, headers=user.headers)
+                response.raise_for_status()
+
+            for name, backend in (("uncached", None), ("cached", cached_backend)):
+                task_list_cache.backend = backend
+                await read()  # warm up
+                queries.clear()
+                timings = []
+                for _ in range(args.requests):
+                    started = time.perf_counter()
+                    await read()
+                    timings.append(time.perf_counter() - started)
+                results[name] = {
+                    "queries": len(queries),
+                    "request_ms_median": round(statistics.median(timings) * 1000, 2),
+                }
+    task_list_cache.backend = cached_backend
+    TaskService.get_tasks_page = staticmethod(original_page)
+
+    return {
+        "benchmark": "task_list_cache",
+        "database": engine.dialect.name,
+        "tasks": args.tasks,
+        "requests": args.requests,
+        "results": results,
+        "speedup": round(results["uncached"]["request_ms_median"] / results["cached"]["request_ms_median"], 2),
+    }
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_task_list_cache")
+    parser.add_argument("--database-url", default=None,
+                        help="Database to run against (default: a new SQLite file in a temp dir)")
+    parser.add_argument("--tasks", type=int, default=500, help="Tasks owned by the user")
+    parser.add_argument("--limit", type=int, default=500, help="Page size requested")
+    parser.add_argument("--requests", type=int, default=200, help="Sequential reads per variant")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.database_url is None:
+            args.database_url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        return asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    print(json.dumps(main(), indent=2))
@@ -0,0 +1,137 @@
+"""
+Benchmark: serializing a task list page, ORM + response_model against the
+column-row fast path used by GET /tasks/.
+
+For each list size, one user's tasks are loaded from an in-memory SQLite
+database and encoded to the response body both ways:
+
+- orm: TaskService.get_tasks_page loads TodoTask objects, then FastAPI's
+  serialize_response validates them against List[TodoTaskRead] and
+  JSONResponse encodes the result (the previous behaviour of the endpoint)
+- rows: get_tasks_page(as_rows=True) selects only the read columns and
+  task_list_adapter dumps the dicts to JSON in one pass
+
+Query and encode times are reported separately (best of --repeat runs).
+The list endpoint caps limit at 500; larger sizes show how the cost scales.
+
+    python -m benchmarks.bench_task_list_json --sizes 1000,10000,100000
+"""
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+
+def _seed(engine, count: int) -> str:
+    from sqlalchemy import insert
+    from sqlmodel import Session
+
+    from src.models.todo_task import TodoTask
+    from src.models.user import User
+
+    user_id = uuid.uuid4()
+    now = datetime.now(timezone.utc)
+    with Session(engine) as session:
+        session.execute(insert(User).values(
+            id=user_id, email=f"bench-{user_id.hex[:8]}@example.com", hashed_password="x",
+            is_active=True, created_at=now, updated_at=now,
+        ))
+        for start in range(0, count, 10000):
+            session.execute(insert(TodoTask), [{
+                "id": uuid.uuid4(), "owner_id": user_id, "title": f"Benchmark task {i}",
+                "description": "Some notes" if i % 2 else None, "completed": i % 3 == 0,
+                "priority": ("low", "medium", "high")[i % 3],
+                "created_at": now + timedelta(microseconds=i), "updated_at": now,
+            } for i in range(start, min(start + 10000, count))])
+        session.commit()
+    return str(user_id)
+
+
+def _list_route():
+    from fastapi.routing import APIRoute
+
+    from src.api.task_router import task_router
+
+    return next(route for route in task_router.routes
+                if isinstance(route, APIRoute) and route.path == "/" and "GET" in route.methods)
+
+
+def _best(fn, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def _measure(engine, user_id: str, count: int, repeat: int) -> dict:
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+    from sqlmodel import Session
+
+    from src.api.task_router import task_list_adapter
+    from src.services.task_service import TaskService
+
+    field = _list_route().secure_cloned_response_field
+
+    def orm_query():
+        # A fresh session per run, as per request; otherwise the identity map is already warm
+        with Session(engine) as session:
+            tasks, _ = TaskService.get_tasks_page(user_id, session, limit=count)
+            session.expunge_all()
+            return tasks
+
+    def orm_encode(tasks):
+        content = asyncio.run(serialize_response(field=field, response_content=tasks, is_coroutine=True))
+        return JSONResponse(content).body
+
+    def rows_query():
+        with Session(engine) as session:
+            rows, _ = TaskService.get_tasks_page(user_id, session, limit=count, as_rows=True)
+            return rows
+
+    orm_query_s, tasks = _best(orm_query, repeat)
+    orm_encode_s, orm_body = _best(lambda: orm_encode(tasks), repeat)
+    rows_query_s, rows = _best(rows_query, repeat)
+    rows_encode_s, rows_body = _best(lambda: task_list_adapter.dump_json(rows), repeat)
+
+    if json.loads(orm_body) != json.loads(rows_body):
+        raise SystemExit(f"Bodies differ at {count} tasks")
+
+    orm_total, rows_total = orm_query_s + orm_encode_s, rows_query_s + rows_encode_s
+    return {
+        "tasks": count,
+        "body_bytes": len(rows_body),
+        "orm": {"query_ms": round(orm_query_s * 1000, 2), "encode_ms": round(orm_encode_s * 1000, 2),
+                "total_ms": round(orm_total * 1000, 2)},
+        "rows": {"query_ms": round(rows_query_s * 1000, 2), "encode_ms": round(rows_encode_s * 1000, 2),
+                 "total_ms": round(rows_total * 1000, 2)},
+        "speedup": round(orm_total / rows_total, 2),
+    }
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_task_list_json")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated list sizes")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    from sqlalchemy.pool import StaticPool
+    from sqlmodel import SQLModel, create_engine
+
+    import src.models.todo_task  # noqa: F401 - registers the tables
+
+    results = []
+    for count in (int(size) for size in args.sizes.split(",")):
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(engine)
+        results.append(_measure(engine, _seed(engine, count), count, args.repeat))
+        engine.dispose()
+    return {"benchmark": "task_list_json", "repeat": args.repeat, "results": results}
+
+
+if __name__ == "__main__":
+    print(json.dumps(main(), indent=2))
@@ -0,0 +1,69 @@
+"""
+Benchmark: GET /tasks/search latency as one user's task count grows.
+
+Seeds an in-memory SQLite database (FTS5 index) per size and times
+TaskService.search_tasks for a selective query (one match) and a broad
+one (every task matches; only the first page is returned), next to the
+client-side alternative of downloading every task and filtering it.
+
+    python -m benchmarks.bench_task_search --sizes 1000,10000,100000
+"""
+import argparse
+import json
+import statistics
+import time
+
+from benchmarks.bench_task_list_json import _seed
+
+
+def _median_ms(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return round(statistics.median(timings) * 1000, 3)
+
+
+def _measure(engine, user_id: str, count: int, repeat: int) -> dict:
+    from sqlmodel import Session
+
+    from src.services.task_service import TaskService
+
+    target = str(count // 2)
+    with Session(engine) as session:
+        def download_and_filter():
+            rows, _ = TaskService.get_tasks_page(user_id, session, limit=count, as_rows=True)
+            return [row for row in rows if target in row["title"].split()]
+
+        return {
+            "tasks": count,
+            "selective_ms": _median_ms(lambda: TaskService.search_tasks(user_id, session, target), repeat),
+            "broad_first_page_ms": _median_ms(lambda: TaskService.search_tasks(user_id, session, "benchmark"),
+                                              repeat),
+            "download_and_filter_ms": _median_ms(download_and_filter, max(1, repeat // 10)),
+        }
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_task_search")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated task counts")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    from sqlalchemy.pool import StaticPool
+    from sqlmodel import SQLModel, create_engine
+
+    import src.models.todo_task  # noqa: F401 - registers the tables
+
+    results = []
+    for count in (int(size) for size in args.sizes.split(",")):
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(engine)
+        results.append(_measure(engine, _seed(engine, count), count, args.repeat))
+        engine.dispose()
+    return {"benchmark": "task_search", "database": "sqlite", "results": results}
+
+
+if __name__ == "__main__":
+    print(json.dumps(main(), indent=2))
@@ -0,0 +1,31 @@
+"""Composite indexes for owner-scoped task queries
+
+Revision ID: 0002_task_owner_indexes
+Revises: 0001_initial_schema
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_task_owner_indexes"
+down_revision: Union[str, None] = "0001_initial_schema"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_todotask_owner_created_id", "todotask",
+                    ["owner_id", "created_at", "id"])
+    op.create_index("ix_todotask_owner_completed_priority", "todotask",
+                    ["owner_id", "completed", "priority"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_todotask_owner_completed_priority", table_name="todotask")
+    op.drop_index("ix_todotask_owner_created_id", table_name="todotask")
@@ -0,0 +1,34 @@
+"""Per-user task list version table
+
+Revision ID: 0003_user_task_state
+Revises: 0002_task_owner_indexes
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_user_task_state"
+down_revision: Union[str, None] = "0002_task_owner_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "usertaskstate",
+        sa.Column("owner_id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["owner_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("owner_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("usertaskstate")
@@ -0,0 +1,42 @@
+"""Task versions and tombstones for the change feed
+
+Revision ID: 0004_task_change_feed
+Revises: 0003_user_task_state
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_task_change_feed"
+down_revision: Union[str, None] = "0003_user_task_state"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing tasks start at version 0 and are picked up by a client's initial sync
+    op.add_column("todotask", sa.Column("version", sa.Integer(), nullable=False, server_default="0"))
+    op.create_index("ix_todotask_owner_version", "todotask", ["owner_id", "version"])
+    op.create_table(
+        "tasktombstone",
+        sa.Column("task_id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("owner_id", sqlmodel.sql.sqltypes.GUID(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["owner_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("task_id"),
+    )
+    op.create_index("ix_tasktombstone_owner_version", "tasktombstone", ["owner_id", "version"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasktombstone_owner_version", table_name="tasktombstone")
+    op.drop_table("tasktombstone")
+    op.drop_index("ix_todotask_owner_version", table_name="todotask")
+    op.drop_column("todotask", "version")
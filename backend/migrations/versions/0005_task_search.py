@@ -0,0 +1,73 @@
+"""Full-text search index over task title and description
+
+Revision ID: 0005_task_search
+Revises: 0004_task_change_feed
+Create Date: 2026-10-18 00:00:00
+
+Postgres gets a generated tsvector column with a GIN index; SQLite an
+external-content FTS5 table kept in sync by triggers. Statements use IF NOT
+EXISTS because create_all (see TodoTask's after_create DDL) may already have
+created them.
+
+The FTS5 table refers to tasks by todotask's implicit rowid. todotask has no
+INTEGER PRIMARY KEY, so VACUUM may renumber those rowids and silently
+desynchronise the index: run `python -m src.maintenance rebuild-search-index`
+after every VACUUM.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_task_search"
+down_revision: Union[str, None] = "0004_task_change_feed"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+POSTGRES_UPGRADE = [
+    """ALTER TABLE todotask ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_todotask_search_vector ON todotask USING gin (search_vector)",
+]
+
+SQLITE_UPGRADE = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS todotask_fts USING fts5(
+        title, description, content='todotask', content_rowid='rowid', tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS todotask_fts_insert AFTER INSERT ON todotask BEGIN
+        INSERT INTO todotask_fts(rowid, title, description) VALUES (new.rowid, new.title, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS todotask_fts_delete AFTER DELETE ON todotask BEGIN
+        INSERT INTO todotask_fts(todotask_fts, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS todotask_fts_update AFTER UPDATE OF title, description ON todotask BEGIN
+        INSERT INTO todotask_fts(todotask_fts, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+        INSERT INTO todotask_fts(rowid, title, description) VALUES (new.rowid, new.title, new.description);
+    END""",
+    # Index the tasks that already exist
+    "INSERT INTO todotask_fts(todotask_fts) VALUES ('rebuild')",
+]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    statements = {"postgresql": POSTGRES_UPGRADE, "sqlite": SQLITE_UPGRADE}.get(dialect, [])
+    for statement in statements:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_todotask_search_vector")
+        op.execute("ALTER TABLE todotask DROP COLUMN IF EXISTS search_vector")
+    elif dialect == "sqlite":
+        for trigger in ("todotask_fts_insert", "todotask_fts_delete", "todotask_fts_update"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS todotask_fts")
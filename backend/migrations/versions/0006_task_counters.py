@@ -0,0 +1,50 @@
+"""Per-user task counters for GET /tasks/summary
+
+Revision ID: 0006_task_counters
+Revises: 0005_task_search
+Create Date: 2026-10-18 00:00:00
+
+Adds the counters to usertaskstate and fills them from the existing tasks,
+creating state rows (at version 0) for owners that have tasks but none yet.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006_task_counters"
+down_revision: Union[str, None] = "0005_task_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COUNTERS = {
+    "task_count": "1 = 1",
+    "completed_count": "completed",
+    "low_priority_count": "priority = 'low'",
+    "medium_priority_count": "priority = 'medium'",
+    "high_priority_count": "priority = 'high'",
+}
+
+
+def upgrade() -> None:
+    for name in COUNTERS:
+        op.add_column("usertaskstate", sa.Column(name, sa.Integer(), nullable=False, server_default="0"))
+
+    op.execute(
+        "INSERT INTO usertaskstate (owner_id, version, updated_at) "
+        "SELECT DISTINCT owner_id, 0, CURRENT_TIMESTAMP FROM todotask "
+        "WHERE owner_id NOT IN (SELECT owner_id FROM usertaskstate)"
+    )
+    assignments = ", ".join(
+        f"{name} = (SELECT count(*) FROM todotask WHERE todotask.owner_id = usertaskstate.owner_id AND {condition})"
+        for name, condition in COUNTERS.items()
+    )
+    op.execute(f"UPDATE usertaskstate SET {assignments}")
+
+
+def downgrade() -> None:
+    for name in reversed(list(COUNTERS)):
+        op.drop_column("usertaskstate", name)
@@ -1,7 +1,5 @@
-from src.main import app
-import uvicorn
-import os
+from src.server import main
 
 if __name__ == "__main__":
-    port = int(os.environ.get("PORT", 8000))  # Use PORT from environment, default to 8000
-    uvicorn.run(app, host="0.0.0.0", port=port, reload=False)  # Disable reload for production
\ No newline at end of file
+    # Supervisor with WEB_CONCURRENCY workers (default: one per CPU with shared backends, else one) on HOST:PORT (default 0.0.0.0:8000)
+    main()
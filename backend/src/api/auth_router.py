@@ -1,22 +1,34 @@
 from datetime import datetime, timedelta, timezone
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlmodel import Session, select
-from src.database import get_session
+from sqlmodel import Session
+from src.database import get_db_session, get_replica_db_session, run_db, run_db_read
 from src.models.user import User, UserCreate, UserLogin, UserResponse
 from src.services.auth_service import AuthService
-from src.middleware.auth_middleware import get_current_user_from_token
+from src.services.password_hasher import PasswordHasherBusy
+from src.middleware.auth_middleware import get_current_user_from_token, verify_token_cached
+from src.middleware.db_routing import get_read_db_session
+from src.services.token_cache import token_cache
+from src.services.user_cache import user_cache
 
 auth_router = APIRouter()
 security = HTTPBearer()
 
+def _hasher_busy() -> HTTPException:
+    """Response for register/login when the password hashing queue is full"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication service is busy, please retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
 @auth_router.post("/register")
-def register(user_create: UserCreate, db_session: Session = Depends(get_session)):
+async def register(user_create: UserCreate, db_session: Session = Depends(get_db_session)):
     """Register a new user and return JWT token"""
     # Check if user already exists
-    existing_user = db_session.exec(
-        select(User).where(User.email == user_create.email)
-    ).first()
+    existing_user = await run_db(
+        db_session, lambda session: AuthService.get_user_by_email(user_create.email, session)
+    )
 
     if existing_user:
         raise HTTPException(
@@ -25,7 +37,10 @@ def register(user_create: UserCreate, db_session: Session = Depends(get_session)
         )
 
     # Create the user
-    db_user = AuthService.create_user(user_create, db_session)
+    try:
+        db_user = await AuthService.create_user(user_create, db_session)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
 
     # Create access token for the newly registered user
     access_token_expires = timedelta(minutes=30)
@@ -50,13 +65,19 @@ def register(user_create: UserCreate, db_session: Session = Depends(get_session)
     }
 
 @auth_router.post("/login")
-def login(user_login: UserLogin, db_session: Session = Depends(get_session)):
+async def login(user_login: UserLogin,
+                db_session: Session = Depends(get_db_session),
+                replica_session: Session = Depends(get_replica_db_session)):
     """Authenticate user and return JWT token"""
-    user = AuthService.authenticate_user(
-        user_login.email,
-        user_login.password,
-        db_session
-    )
+    try:
+        user = await AuthService.authenticate_user(
+            user_login.email,
+            user_login.password,
+            replica_session,
+            primary_session=db_session
+        )
+    except PasswordHasherBusy:
+        raise _hasher_busy()
 
     if not user:
         raise HTTPException(
@@ -87,21 +108,28 @@ def login(user_login: UserLogin, db_session: Session = Depends(get_session)):
     }
 
 @auth_router.post("/logout")
-def logout(current_user: dict = Depends(get_current_user_from_token)):
+async def logout(current_user: dict = Depends(get_current_user_from_token),
+                 credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Logout user (client-side token removal)"""
     # In a stateless JWT system, logout is typically handled on the client side
     # This endpoint can be used to invalidate tokens in a more advanced system
+    token_cache.invalidate(credentials.credentials)
     return {"message": "Logged out successfully"}
 
 @auth_router.get("/me", response_model=UserResponse)
-def get_current_user(current_user: dict = Depends(get_current_user_from_token),
-                    db_session: Session = Depends(get_session)):
+async def get_current_user(current_user: dict = Depends(get_current_user_from_token),
+                           read_session: Session = Depends(get_read_db_session),
+                           db_session: Session = Depends(get_db_session)):
     """Get current user information"""
     user_id = current_user["user_id"]
 
+    # Serve the encoded profile from the cache when possible
+    cached = await user_cache.get(user_id)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     # Retrieve user from database
-    statement = select(User).where(User.id == user_id)
-    user = db_session.exec(statement).first()
+    user = await run_db_read(read_session, db_session, lambda session: AuthService.get_user_by_id(user_id, session))
 
     if not user:
         raise HTTPException(
@@ -109,7 +137,7 @@ def get_current_user(current_user: dict = Depends(get_current_user_from_token),
             detail="User not found"
         )
 
-    return UserResponse(
+    profile = UserResponse(
         id=user.id,
         email=user.email,
         first_name=user.first_name,
@@ -117,14 +145,17 @@ def get_current_user(current_user: dict = Depends(get_current_user_from_token),
         created_at=user.created_at,
         updated_at=user.updated_at,
         is_active=user.is_active
-    )
+    ).model_dump_json().encode()
+    await user_cache.set(user_id, profile)
+
+    return Response(content=profile, media_type="application/json")
 
 @auth_router.post("/verify")
-def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
+async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Verify if the provided JWT token is valid"""
     token = credentials.credentials
 
-    payload = AuthService.verify_token(token)
+    payload = verify_token_cached(token)
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -157,7 +188,7 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     }
 
 @auth_router.post("/refresh")
-def refresh_token():  # In a real implementation, this would use refresh tokens
+async def refresh_token():  # In a real implementation, this would use refresh tokens
     """Refresh JWT access token (simplified implementation)"""
     # This is a simplified version - a real implementation would require refresh tokens
     # For now, we'll return an error indicating this endpoint needs to be implemented
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Response, status
+
+from src.services.health import readiness_probe
+
+health_router = APIRouter()
+
+@health_router.get("/health")
+@health_router.get("/health/live")
+async def liveness():
+    """Liveness: the process is up and serving requests; never touches the database"""
+    return {"status": "healthy"}
+
+@health_router.get("/health/ready")
+async def readiness(response: Response):
+    """
+    Readiness: the database answers and the connection pool has headroom.
+
+    Answers 503 with the failing reasons otherwise, so load balancers stop
+    routing to this replica. The database check is cached briefly (see
+    src.services.health), so frequent probes are cheap.
+    """
+    report = await readiness_probe.check()
+    if not report["ready"]:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    response.headers["Cache-Control"] = "no-store"
+    return {"status": "ready" if report["ready"] else "not_ready", **report}
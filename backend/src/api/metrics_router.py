@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Header, HTTPException, Response, status
+from typing import Optional
+import hmac
+
+from src.config import settings
+from src.metrics import exposition
+
+# When set, scrapers must send "Authorization: Bearer <METRICS_TOKEN>"
+METRICS_TOKEN = settings.metrics_token
+
+metrics_router = APIRouter()
+
+@metrics_router.get("/metrics", include_in_schema=False)
+async def metrics(authorization: Optional[str] = Header(None)):
+    """Prometheus scrape endpoint"""
+    if METRICS_TOKEN and not hmac.compare_digest(authorization or "", f"Bearer {METRICS_TOKEN}"):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # Async so the threadpool collector reads this event loop's limiter
+    return Response(content=exposition(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,45 +1,373 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlmodel import Session
-from typing import List
-from jose import jwt
-import os
-from dotenv import load_dotenv
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Optional
+from pydantic import TypeAdapter
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+import hashlib
 
-from src.database import get_session
-from src.models.todo_task import TodoTaskCreate, TodoTaskUpdate, TodoTaskRead
-from src.services.task_service import TaskService
-from src.middleware.auth_middleware import get_current_user_from_token
-
-load_dotenv()
+from src.database import get_db_session, run_db, run_db_read
+from src.models.todo_task import (
+    TodoTaskCreate, TodoTaskUpdate, TodoTaskRead, TodoTaskRow,
+    TaskBatchRequest, TaskBatchResponse, TaskChangesResponse, TaskImportResponse, TaskSummary,
+)
+from src.services.task_service import TaskService, ChangeCursorExpired, TASK_BATCH_MAX_SIZE
+from src.services.task_import import import_stream
+from src.services.task_export import export_stream, aexport_stream, EXPORT_MEDIA_TYPES
+from src.services.singleflight import task_list_flights
+from src.services.task_list_cache import task_list_cache
+from src.services.task_events import task_events, Subscription, TooManyConnections, TASK_EVENTS_HEARTBEAT_SECONDS
+from src.config import settings
+from src.services.auth_service import AuthService
+from src.middleware.auth_middleware import get_current_user_from_token, get_current_user_for_events, EVENTS_TOKEN_SCOPE
+from src.middleware.db_routing import get_read_db_session
 
 task_router = APIRouter()
 security = HTTPBearer()
 
+# Serializes task list pages in one pass; the rows come from the database, so
+# there is nothing to validate (see GET /)
+task_list_adapter = TypeAdapter(List[TodoTaskRow])
+
+def _etag(*parts) -> str:
+    """Strong ETag over the given parts; always include the user id so browsers never share entries across users"""
+    return '"' + hashlib.sha256("|".join(str(part) for part in parts).encode()).hexdigest()[:32] + '"'
+
+def _validator_headers(etag: str, last_modified: Optional[datetime]) -> dict:
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "Authorization"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.replace(tzinfo=timezone.utc), usegmt=True)
+    return headers
+
+def _not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """Evaluate If-None-Match (which takes precedence) or If-Modified-Since"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in candidates or etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have one-second resolution
+        return last_modified.replace(tzinfo=timezone.utc, microsecond=0) <= since
+    return False
+
 @task_router.get("/", response_model=List[TodoTaskRead])
-def get_tasks(current_user: dict = Depends(get_current_user_from_token),
-              db_session: Session = Depends(get_session)):
-    """Get all tasks for the authenticated user"""
+async def get_tasks(request: Request,
+                    limit: int = Query(100, ge=1, le=500),
+                    cursor: Optional[str] = None,
+                    completed: Optional[bool] = None,
+                    priority: Optional[str] = Query(None, pattern="^(low|medium|high)$"),
+                    sort: str = Query("created_at", pattern="^-?(created_at|updated_at|title)$"),
+                    current_user: dict = Depends(get_current_user_from_token),
+                    db_session: Session = Depends(get_read_db_session)):
+    """
+    Get a page of tasks for the authenticated user.
+
+    The cursor for the next page is returned in the X-Next-Cursor header;
+    the header is absent on the last page. The ETag is derived from the
+    user's task list version, so a matching If-None-Match (or a fresh
+    If-Modified-Since) is answered with 304 without loading any tasks.
+
+    The page is loaded as plain column rows and encoded directly to JSON,
+    bypassing response_model validation (which stays for the OpenAPI schema).
+    Encoded pages are cached under the list version, so a repeat read is the
+    version lookup plus a copy of the cached bytes (see
+    src.services.task_list_cache); concurrent identical misses from the same
+    user are coalesced (see src.services.singleflight).
+    """
     user_id = current_user["user_id"]
-    tasks = TaskService.get_tasks_by_user(user_id, db_session)
-    return tasks
+    params = (limit, cursor, completed, priority, sort)
+
+    def list_state(session: Session):
+        return TaskService.get_task_list_state(user_id, session)
+
+    # Revalidation and cache lookups only need the list version
+    version, last_modified = await run_db(db_session, list_state)
+    etag = _etag("list", user_id, version, *params)
+    headers = _validator_headers(etag, last_modified)
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    cached = await task_list_cache.get(user_id, version, params)
+    if cached is not None:
+        body, next_cursor = cached
+    else:
+        # A write committing after the version lookup can only make the page
+        # newer than its key, never older, so the entry is safe to share
+        def load_page(session: Session):
+            return TaskService.get_tasks_page(
+                user_id, session, limit=limit, cursor=cursor,
+                completed=completed, priority=priority, sort=sort, as_rows=True
+            )
+
+        async def load_and_encode():
+            rows, next_cursor = await run_db(db_session, load_page)
+            body = task_list_adapter.dump_json(rows)
+            await task_list_cache.set(user_id, version, params, body, next_cursor)
+            return body, next_cursor
+
+        # Identical requests in flight at the same time share one query and one encoding
+        try:
+            body, next_cursor = await task_list_flights.do(user_id, (version, *params), load_and_encode)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return Response(content=body, media_type="application/json", headers=headers)
 
 @task_router.post("/", response_model=TodoTaskRead)
-def create_task(task_create: TodoTaskCreate,
-                current_user: dict = Depends(get_current_user_from_token),
-                db_session: Session = Depends(get_session)):
+async def create_task(task_create: TodoTaskCreate,
+                      current_user: dict = Depends(get_current_user_from_token),
+                      db_session: Session = Depends(get_db_session)):
     """Create a new task for the authenticated user"""
     user_id = current_user["user_id"]
-    task = TaskService.create_task(task_create, user_id, db_session)
+    task = await run_db(db_session, lambda session: TaskService.create_task(task_create, user_id, session))
     return task
 
+@task_router.post("/batch", response_model=TaskBatchResponse)
+async def apply_batch(batch: TaskBatchRequest,
+                      current_user: dict = Depends(get_current_user_from_token),
+                      db_session: Session = Depends(get_db_session)):
+    """
+    Apply many task creates, updates and deletes in a single transaction.
+
+    Each operation gets its own result (created, updated, deleted, not_found
+    or invalid) in request order.
+    """
+    user_id = current_user["user_id"]
+    if len(batch.operations) > TASK_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"A batch may contain at most {TASK_BATCH_MAX_SIZE} operations"
+        )
+
+    results = await run_db(db_session, lambda session: TaskService.apply_batch(batch.operations, user_id, session))
+    return TaskBatchResponse(results=results)
+
+@task_router.get("/summary", response_model=TaskSummary)
+async def get_task_summary(request: Request,
+                           response: Response,
+                           current_user: dict = Depends(get_current_user_from_token),
+                           db_session: Session = Depends(get_read_db_session)):
+    """
+    Get the authenticated user's task totals: open, completed and per priority.
+
+    Served from counters kept up to date by every task mutation, so it costs
+    one primary key lookup however many tasks the user has.
+    """
+    user_id = current_user["user_id"]
+    version, last_modified, summary = await run_db(
+        db_session, lambda session: TaskService.get_task_summary(user_id, session)
+    )
+
+    headers = _validator_headers(_etag("summary", user_id, version), last_modified)
+    if _not_modified(request, headers["ETag"], last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return summary
+
+@task_router.get("/search", response_model=List[TodoTaskRead])
+async def search_tasks(request: Request,
+                       q: str = Query(..., min_length=1, max_length=200),
+                       limit: int = Query(20, ge=1, le=100),
+                       cursor: Optional[str] = None,
+                       current_user: dict = Depends(get_current_user_from_token),
+                       db_session: Session = Depends(get_read_db_session)):
+    """
+    Search the authenticated user's task titles and descriptions, best match first.
+
+    Paginated like GET /tasks/: the next page's cursor is returned in the
+    X-Next-Cursor header. Revalidates with the same list-version ETag.
+    """
+    user_id = current_user["user_id"]
+
+    def load_results(session: Session):
+        version, last_modified = TaskService.get_task_list_state(user_id, session)
+        etag = _etag("search", user_id, version, q, limit, cursor)
+        if _not_modified(request, etag, last_modified):
+            return etag, last_modified, None
+        return etag, last_modified, TaskService.search_tasks(user_id, session, q, limit=limit, cursor=cursor)
+
+    try:
+        etag, last_modified, page = await run_db(db_session, load_results)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    headers = _validator_headers(etag, last_modified)
+    if page is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    rows, next_cursor = page
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return Response(content=task_list_adapter.dump_json(rows), media_type="application/json", headers=headers)
+
+@task_router.post("/import", response_model=TaskImportResponse)
+async def import_tasks(request: Request,
+                       format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+                       current_user: dict = Depends(get_current_user_from_token),
+                       db_session: Session = Depends(get_db_session)):
+    """
+    Create tasks in bulk from an NDJSON or CSV request body.
+
+    Send the file as the raw body (not multipart form data). NDJSON lines and
+    CSV rows (after a header row) hold TodoTaskCreate fields; other fields
+    are ignored, so a GET /tasks/export file can be imported as is. The
+    body is parsed as it streams in and committed in batches: lines that
+    fail are reported by line number and the rest are still imported.
+    """
+    try:
+        return await import_stream(request.stream(), format, current_user["user_id"], db_session)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@task_router.get("/changes", response_model=TaskChangesResponse)
+async def get_task_changes(since: Optional[str] = None,
+                           limit: int = Query(500, ge=1, le=1000),
+                           current_user: dict = Depends(get_current_user_from_token),
+                           db_session: Session = Depends(get_read_db_session)):
+    """
+    Get the tasks created or updated, and the ids of tasks deleted, since a cursor.
+
+    Call without `since` to get the full list and an initial cursor, then pass
+    the returned cursor on each poll. Keep polling while has_more is true.
+    A cursor older than the deletion history answers 410 Gone: the client
+    must discard its copy and start again without `since`.
+    """
+    user_id = current_user["user_id"]
+    try:
+        changed, deleted, cursor, has_more = await run_db(
+            db_session, lambda session: TaskService.get_changes(user_id, session, since=since, limit=limit)
+        )
+    except ChangeCursorExpired as e:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    return TaskChangesResponse(changed=changed, deleted=deleted, cursor=cursor, has_more=has_more)
+
+async def _sse_stream(subscription: Subscription):
+    try:
+        # Reconnect delay hint for EventSource clients
+        yield "retry: 5000\n\n"
+        while True:
+            task_event = await subscription.get(timeout=TASK_EVENTS_HEARTBEAT_SECONDS)
+            if task_event is None:
+                yield ": keepalive\n\n"
+                continue
+            yield f"event: {task_event.type}\nid: {task_event.version}\ndata: {task_event.data}\n\n"
+    finally:
+        subscription.close()
+
+@task_router.post("/events/token")
+async def create_task_events_token(current_user: dict = Depends(get_current_user_from_token)):
+    """
+    Issue a short-lived token for GET /tasks/events?token=.
+
+    Browsers' native EventSource cannot send an Authorization header; this
+    token is accepted only by the event stream and expires after
+    TASK_EVENTS_TOKEN_EXPIRE_SECONDS (it is checked when the stream opens,
+    so fetch a new one before reconnecting).
+    """
+    expires_in = settings.task_events_token_expire_seconds
+    token = AuthService.create_access_token(
+        data={"sub": current_user["email"], "user_id": current_user["user_id"], "scope": EVENTS_TOKEN_SCOPE},
+        expires_delta=timedelta(seconds=expires_in)
+    )
+    return {"token": token, "expires_in": expires_in}
+
+@task_router.get("/events")
+async def stream_task_events(current_user: dict = Depends(get_current_user_for_events)):
+    """
+    Stream the authenticated user's task changes as Server-Sent Events.
+
+    Authenticate with a bearer header or, from a browser EventSource, with
+    ?token= from POST /tasks/events/token.
+
+    Each "tasks" event carries the new list version with the changed tasks
+    and deleted ids, like GET /tasks/changes. A "resync" event means events
+    were dropped because the client fell behind; catch up with
+    GET /tasks/changes from the last cursor.
+    """
+    try:
+        subscription = task_events.subscribe(current_user["user_id"])
+    except TooManyConnections as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e)
+        )
+
+    return StreamingResponse(
+        _sse_stream(subscription),
+        media_type="text/event-stream",
+        # Disable proxy buffering so events are flushed immediately
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@task_router.get("/export")
+async def export_tasks(format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+                       current_user: dict = Depends(get_current_user_from_token),
+                       db_session: Session = Depends(get_read_db_session)):
+    """
+    Stream all of the authenticated user's tasks, oldest first, as NDJSON or CSV.
+
+    Rows are read through a server-side cursor and sent in batches, so memory
+    use does not grow with the number of tasks. The session dependency is
+    closed only after the response has been sent, so it outlives the stream.
+    """
+    user_id = current_user["user_id"]
+    if isinstance(db_session, AsyncSession):
+        body = aexport_stream(user_id, db_session, format)
+    else:
+        body = export_stream(user_id, db_session, format)
+
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="tasks.{format}"',
+            "Cache-Control": "private, no-store",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
 @task_router.get("/{task_id}", response_model=TodoTaskRead)
-def get_task(task_id: str,
-             current_user: dict = Depends(get_current_user_from_token),
-             db_session: Session = Depends(get_session)):
+async def get_task(task_id: str,
+                   request: Request,
+                   response: Response,
+                   current_user: dict = Depends(get_current_user_from_token),
+                   read_session: Session = Depends(get_read_db_session),
+                   db_session: Session = Depends(get_db_session)):
     """Get a specific task for the authenticated user"""
     user_id = current_user["user_id"]
-    task = TaskService.get_task_by_id_and_user(task_id, user_id, db_session)
+    task = await run_db_read(
+        read_session, db_session, lambda session: TaskService.get_task_by_id_and_user(task_id, user_id, session)
+    )
 
     if not task:
         raise HTTPException(
@@ -47,16 +375,21 @@ def get_task(task_id: str,
             detail="Task not found or you don't have permission to access it"
         )
 
+    headers = _validator_headers(_etag("task", user_id, task.id, task.updated_at.isoformat()), task.updated_at)
+    if _not_modified(request, headers["ETag"], task.updated_at):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
     return task
 
 @task_router.put("/{task_id}", response_model=TodoTaskRead)
-def update_task(task_id: str,
-                task_update: TodoTaskUpdate,
-                current_user: dict = Depends(get_current_user_from_token),
-                db_session: Session = Depends(get_session)):
+async def update_task(task_id: str,
+                      task_update: TodoTaskUpdate,
+                      current_user: dict = Depends(get_current_user_from_token),
+                      db_session: Session = Depends(get_db_session)):
     """Update a task for the authenticated user"""
     user_id = current_user["user_id"]
-    task = TaskService.update_task(task_id, user_id, task_update, db_session)
+    task = await run_db(db_session, lambda session: TaskService.update_task(task_id, user_id, task_update, session))
 
     if not task:
         raise HTTPException(
@@ -67,12 +400,12 @@ def update_task(task_id: str,
     return task
 
 @task_router.delete("/{task_id}")
-def delete_task(task_id: str,
-                current_user: dict = Depends(get_current_user_from_token),
-                db_session: Session = Depends(get_session)):
+async def delete_task(task_id: str,
+                      current_user: dict = Depends(get_current_user_from_token),
+                      db_session: Session = Depends(get_db_session)):
     """Delete a task for the authenticated user"""
     user_id = current_user["user_id"]
-    success = TaskService.delete_task(task_id, user_id, db_session)
+    success = await run_db(db_session, lambda session: TaskService.delete_task(task_id, user_id, session))
 
     if not success:
         raise HTTPException(
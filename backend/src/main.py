@@ -1,35 +1,51 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-import os
+from starlette.concurrency import run_in_threadpool
 import logging
-from dotenv import load_dotenv
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
-
 from src.api.auth_router import auth_router
 from src.api.task_router import task_router
+from src.api.metrics_router import metrics_router
+from src.api.health_router import health_router
+from src.middleware.metrics_middleware import MetricsMiddleware
 from src.database import create_tables
+from src.services.password_hasher import password_hasher, PASSWORD_HASH_TARGET_MS
+from src.services.task_events import task_events
+from src.services.health import readiness_probe
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup logic - create database tables
     logger.info("Starting up FastAPI application...")
     try:
-        create_tables()
+        # Off the event loop; a current schema is confirmed with one query
+        await run_in_threadpool(create_tables)
         logger.info("Database tables created/verified successfully")
     except Exception as e:
         logger.error(f"Database connection error: {str(e)}")
         raise
+
+    # Start the argon2 worker pool, optionally tuning its cost to the latency budget
+    password_hasher.start()
+    if PASSWORD_HASH_TARGET_MS > 0:
+        await password_hasher.calibrate(PASSWORD_HASH_TARGET_MS)
+
+    # Start listening for task change events from other workers (no-op for the local bus)
+    await task_events.start()
+
     logger.info("FastAPI application started successfully")
     yield
     # Shutdown logic can go here
     logger.info("Shutting down FastAPI application...")
+    # Fail readiness so load balancers stop sending new requests
+    readiness_probe.draining = True
+    password_hasher.shutdown()
+    await task_events.stop()
 
 app = FastAPI(
     title="Todo Web Application API",
@@ -55,13 +71,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Last-Modified"],
 )
 
 logger.info("CORS middleware configured")
 
+# Outermost, so latency covers every other middleware
+app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(auth_router, prefix="/auth", tags=["Authentication"])
 app.include_router(task_router, prefix="/tasks", tags=["Tasks"])
+app.include_router(metrics_router, tags=["Monitoring"])
+app.include_router(health_router, tags=["Monitoring"])
 
 logger.info("Auth router mounted")
 logger.info("Task router mounted")
@@ -70,9 +92,5 @@ logger.info("Task router mounted")
 def read_root():
     return {"message": "Todo Web Application API"}
 
-@app.get("/health")
-def health_check():
-    return {"status": "healthy"}
-
 # Log when the module is loaded
 logger.info("FastAPI application module loaded successfully")
\ No newline at end of file
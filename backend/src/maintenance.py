@@ -0,0 +1,69 @@
+"""
+Periodic maintenance jobs, meant to be run from cron or a scheduled task:
+
+    python -m src.maintenance prune-tombstones [--retention-days N]
+    python -m src.maintenance repair-task-counts [--owner-id ID]
+    python -m src.maintenance rebuild-search-index
+
+On SQLite, run rebuild-search-index after every VACUUM: the search index
+refers to tasks by rowid, which VACUUM may renumber.
+"""
+import argparse
+import logging
+from typing import Optional
+
+from sqlmodel import Session
+
+from src.database import engine
+from src.services.task_service import TaskService, TASK_TOMBSTONE_RETENTION_DAYS
+
+logger = logging.getLogger(__name__)
+
+
+def prune_tombstones(retention_days: int = TASK_TOMBSTONE_RETENTION_DAYS) -> int:
+    with Session(engine) as session:
+        removed = TaskService.prune_tombstones(session, retention_days)
+    logger.info(f"Pruned {removed} task tombstones older than {retention_days} days")
+    return removed
+
+
+def repair_task_counts(owner_id: Optional[str] = None) -> int:
+    with Session(engine) as session:
+        repaired = TaskService.repair_task_counts(session, owner_id)
+    logger.info(f"Repaired task counters for {repaired} users")
+    return repaired
+
+
+def rebuild_search_index() -> bool:
+    with Session(engine) as session:
+        rebuilt = TaskService.rebuild_search_index(session)
+    logger.info("Rebuilt the task search index" if rebuilt else "The search index needs no rebuild on this database")
+    return rebuilt
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.maintenance")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    prune = commands.add_parser("prune-tombstones", help="Delete change feed tombstones past retention")
+    prune.add_argument("--retention-days", type=int, default=TASK_TOMBSTONE_RETENTION_DAYS)
+
+    repair = commands.add_parser("repair-task-counts",
+                                 help="Recompute the per-user counters behind GET /tasks/summary")
+    repair.add_argument("--owner-id", help="Only check this user (default: every user)")
+
+    commands.add_parser("rebuild-search-index",
+                        help="Re-index task search (SQLite; run after VACUUM)")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    if args.command == "prune-tombstones":
+        prune_tombstones(args.retention_days)
+    elif args.command == "repair-task-counts":
+        repair_task_counts(args.owner_id)
+    elif args.command == "rebuild-search-index":
+        rebuild_search_index()
+
+
+if __name__ == "__main__":
+    main()
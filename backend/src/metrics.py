@@ -0,0 +1,180 @@
+"""
+Minimal in-process metrics (counters, gauges, histograms).
+
+The API mirrors prometheus_client closely enough that swapping it in later
+is mechanical, without adding a dependency. All metrics register
+themselves in REGISTRY; updates are guarded by a per-metric lock so they are
+safe to call from the threadpool as well as the event loop.
+
+Values that are cheaper to read on demand than to track (pool sizes,
+threadpool usage) are refreshed by collectors registered with
+register_collector, which run at the start of every exposition().
+"""
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, List, Sequence, Tuple
+
+# Default latency buckets in seconds, from 1ms to 10s
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+REGISTRY: List["_Metric"] = []
+COLLECTORS: List[Callable[[], None]] = []
+
+
+class _Metric:
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def labels(self, **labels) -> "_Child":
+        return _Child(self, self._key(labels))
+
+
+class _Child:
+    """A metric bound to one set of label values"""
+
+    def __init__(self, metric: _Metric, key: Tuple[str, ...]):
+        self._metric = metric
+        self._key = key
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._metric._inc(self._key, amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._metric._inc(self._key, -amount)
+
+    def set(self, value: float) -> None:
+        self._metric._set(self._key, value)
+
+    def observe(self, value: float) -> None:
+        self._metric._observe(self._key, value)
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def _inc(self, key: Tuple[str, ...], amount: float) -> None:
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._inc((), amount)
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, key, value) for key, value in self._values.items()]
+
+
+class Gauge(Counter):
+    type_name = "gauge"
+
+    def _set(self, key: Tuple[str, ...], value: float) -> None:
+        with self._lock:
+            self._values[key] = value
+
+    def set(self, value: float) -> None:
+        self._set((), value)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._inc((), -amount)
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> ([per-bucket counts], sum, count)
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def _observe(self, key: Tuple[str, ...], value: float) -> None:
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            i = bisect_left(self.buckets, value)
+            if i < len(self.buckets):
+                state[0][i] += 1
+            state[1] += value
+            state[2] += 1
+
+    def observe(self, value: float) -> None:
+        self._observe((), value)
+
+    def count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return state[2] if state else 0
+
+    def sum(self, **labels) -> float:
+        state = self._values.get(self._key(labels))
+        return state[1] if state else 0.0
+
+    def samples(self):
+        """Cumulative bucket, sum and count samples in Prometheus order"""
+        out = []
+        with self._lock:
+            for key, (counts, total, count) in self._values.items():
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    out.append((self.name + "_bucket", key + (repr(bound),), cumulative))
+                out.append((self.name + "_bucket", key + ("+Inf",), count))
+                out.append((self.name + "_sum", key, total))
+                out.append((self.name + "_count", key, count))
+        return out
+
+
+def register_collector(collector: Callable[[], None]) -> Callable[[], None]:
+    """Register a function that updates gauges just before each scrape; usable as a decorator"""
+    COLLECTORS.append(collector)
+    return collector
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def exposition() -> str:
+    """Render every registered metric in the Prometheus text format (version 0.0.4)"""
+    for collector in COLLECTORS:
+        collector()
+
+    lines = []
+    for metric in REGISTRY:
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.type_name}")
+        labelnames = metric.labelnames
+        for name, key, value in metric.samples():
+            # Histogram buckets carry the extra "le" label after the metric's own labels
+            names = labelnames + ("le",) if len(key) > len(labelnames) else labelnames
+            if names:
+                labels = ",".join(f'{label}="{_escape(v)}"' for label, v in zip(names, key))
+                lines.append(f"{name}{{{labels}}} {_format_value(value)}")
+            else:
+                lines.append(f"{name} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
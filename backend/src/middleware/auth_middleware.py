@@ -1,36 +1,64 @@
 from fastapi import HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi import Depends
-from jose import jwt
-import os
-from dotenv import load_dotenv
+from fastapi import Depends, Query
+from typing import Optional
 
 from src.services.auth_service import AuthService
-
-load_dotenv()
+from src.services.token_cache import token_cache
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
-def get_current_user_from_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
-    """Extract user information from JWT token"""
-    token = credentials.credentials
+# Scope claim of the short-lived tokens issued by POST /tasks/events/token.
+# They are only accepted by the event stream, so one leaked from a URL into
+# an access log cannot be used against the rest of the API.
+EVENTS_TOKEN_SCOPE = "task-events"
 
-    payload = AuthService.verify_token(token)
+def verify_token_cached(token: str) -> Optional[dict]:
+    """Verify a JWT, reusing the payload of a recently verified identical token"""
+    payload = token_cache.get(token)
     if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        payload = AuthService.verify_token(token)
+        if payload is not None:
+            token_cache.put(token, payload)
+    return payload
+
+def _credentials_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+def _user_from_payload(payload: Optional[dict], scope: Optional[str] = None) -> dict:
+    if payload is None or payload.get("scope") != scope:
+        raise _credentials_error()
 
     user_id = payload.get("user_id")
     email = payload.get("sub")
 
     if user_id is None or email is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _credentials_error()
+
+    return {"user_id": user_id, "email": email}
+
+def get_current_user_from_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+    """Extract user information from JWT token"""
+    return _user_from_payload(verify_token_cached(credentials.credentials))
+
+def get_current_user_for_events(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    token: Optional[str] = Query(None),
+) -> dict:
+    """
+    Authenticate GET /tasks/events by bearer header or by ?token=.
 
-    return {"user_id": user_id, "email": email}
\ No newline at end of file
+    The browser's EventSource cannot set headers, so the query parameter
+    takes a short-lived events-scoped token from POST /tasks/events/token;
+    regular access tokens are refused there to keep them out of URLs.
+    """
+    if credentials is not None:
+        return get_current_user_from_token(credentials)
+    if token is None:
+        raise _credentials_error()
+    return _user_from_payload(verify_token_cached(token), scope=EVENTS_TOKEN_SCOPE)
@@ -0,0 +1,20 @@
+from fastapi import Depends
+from sqlmodel import Session
+
+from src.database import get_db_session, get_replica_db_session
+from src.middleware.auth_middleware import get_current_user_from_token
+from src.services.read_routing import recent_writers
+
+async def get_read_db_session(current_user: dict = Depends(get_current_user_from_token),
+                              primary_session: Session = Depends(get_db_session),
+                              replica_session: Session = Depends(get_replica_db_session)) -> Session:
+    """
+    Session for a read-only endpoint: the replica, unless the user committed a
+    write within the read-your-writes window, in which case the primary.
+
+    Sessions connect lazily, so the one not returned never takes a connection.
+    Declared async so FastAPI does not dispatch it to the threadpool.
+    """
+    if recent_writers.wrote_recently(current_user["user_id"]):
+        return primary_session
+    return replica_session
@@ -0,0 +1,85 @@
+"""
+Request metrics for the /metrics endpoint.
+
+MetricsMiddleware is a plain ASGI middleware (no BaseHTTPMiddleware task and
+stream wrapping) that records per-route latency, request counts and
+in-flight requests. Routes are labelled by their template, e.g.
+/tasks/{task_id}, so label cardinality stays bounded. The time the
+middleware spends on its own bookkeeping is itself accumulated in
+http_metrics_overhead_seconds_total.
+"""
+from time import perf_counter
+
+from src.metrics import Counter, Gauge, Histogram, register_collector
+
+REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route", ["method", "route"]
+)
+REQUESTS = Counter("http_requests_total", "HTTP requests by route and status", ["method", "route", "status"])
+IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests currently being served")
+OVERHEAD_SECONDS = Counter(
+    "http_metrics_overhead_seconds_total", "Time spent recording request metrics"
+)
+
+THREADPOOL_BUSY = Gauge("threadpool_threads_busy", "Worker threads running sync endpoints, dependencies and DB calls")
+THREADPOOL_LIMIT = Gauge("threadpool_threads_limit", "Maximum threadpool worker threads")
+THREADPOOL_WAITING = Gauge("threadpool_tasks_waiting", "Calls queued for a free worker thread")
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+        # Bound metric children, so labels are validated once rather than per request
+        self._timers = {}
+        self._counters = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = perf_counter()
+        IN_FLIGHT.inc()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        overhead = perf_counter() - started
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            finished = perf_counter()
+            # FastAPI stores the matched route in the scope during routing
+            route = scope.get("route")
+            key = (scope["method"], route.path if route is not None else "unmatched")
+            timer = self._timers.get(key)
+            if timer is None:
+                timer = self._timers[key] = REQUEST_SECONDS.labels(method=key[0], route=key[1])
+            timer.observe(finished - started)
+            counter = self._counters.get(key + (status_code,))
+            if counter is None:
+                counter = self._counters[key + (status_code,)] = REQUESTS.labels(
+                    method=key[0], route=key[1], status=status_code
+                )
+            counter.inc()
+            IN_FLIGHT.dec()
+            OVERHEAD_SECONDS.inc(overhead + perf_counter() - finished)
+
+
+@register_collector
+def _collect_threadpool() -> None:
+    import anyio.to_thread
+
+    try:
+        limiter = anyio.to_thread.current_default_thread_limiter()
+    except RuntimeError:
+        # Not called from the event loop (e.g. in a test); nothing to read
+        return
+    statistics = limiter.statistics()
+    THREADPOOL_BUSY.set(statistics.borrowed_tokens)
+    THREADPOOL_LIMIT.set(statistics.total_tokens)
+    THREADPOOL_WAITING.set(statistics.tasks_waiting)
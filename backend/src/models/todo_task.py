@@ -1,8 +1,10 @@
 from sqlmodel import SQLModel, Field
+from pydantic import field_validator
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, List, Optional
+from typing_extensions import TypedDict
 import uuid
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import DDL, Column, ForeignKey, Index, event
 from .user import User
 
 class TodoTaskBase(SQLModel):
@@ -12,10 +14,87 @@ class TodoTaskBase(SQLModel):
     priority: str = Field(default="medium", regex="^(low|medium|high)$")
 
 class TodoTask(TodoTaskBase, table=True):
+    # Every task query is scoped to owner_id; these back the keyset-paginated
+    # list (ordered by created_at, id) and the completed/priority filters.
+    __table_args__ = (
+        Index("ix_todotask_owner_created_id", "owner_id", "created_at", "id"),
+        Index("ix_todotask_owner_completed_priority", "owner_id", "completed", "priority"),
+        Index("ix_todotask_owner_version", "owner_id", "version"),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     owner_id: uuid.UUID = Field(default=None, foreign_key="user.id")
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Owner's task list version at this task's last change (see UserTaskState)
+    version: int = Field(default=0)
+
+# Full-text search over title and description (TaskService.search_tasks).
+# On Postgres this is a generated tsvector column with a GIN index, added by
+# migration 0005 and deliberately not mapped, so it never appears in ORM
+# statements. SQLite uses an external-content FTS5 table that triggers keep in
+# sync. Both are also created with the table, so that schemas built by
+# SQLModel.metadata.create_all (the tests) have them too.
+TASK_SEARCH_DDL = {
+    "postgresql": [
+        """ALTER TABLE todotask ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        ) STORED""",
+        "CREATE INDEX IF NOT EXISTS ix_todotask_search_vector ON todotask USING gin (search_vector)",
+    ],
+    "sqlite": [
+        """CREATE VIRTUAL TABLE IF NOT EXISTS todotask_fts USING fts5(
+            title, description, content='todotask', content_rowid='rowid', tokenize='porter unicode61'
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS todotask_fts_insert AFTER INSERT ON todotask BEGIN
+            INSERT INTO todotask_fts(rowid, title, description) VALUES (new.rowid, new.title, new.description);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS todotask_fts_delete AFTER DELETE ON todotask BEGIN
+            INSERT INTO todotask_fts(todotask_fts, rowid, title, description)
+            VALUES ('delete', old.rowid, old.title, old.description);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS todotask_fts_update AFTER UPDATE OF title, description ON todotask BEGIN
+            INSERT INTO todotask_fts(todotask_fts, rowid, title, description)
+            VALUES ('delete', old.rowid, old.title, old.description);
+            INSERT INTO todotask_fts(rowid, title, description) VALUES (new.rowid, new.title, new.description);
+        END""",
+    ],
+}
+
+for _dialect, _statements in TASK_SEARCH_DDL.items():
+    for _statement in _statements:
+        event.listen(TodoTask.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect))
+
+class TaskTombstone(SQLModel, table=True):
+    """Record of a deleted task, so the change feed can report deletions"""
+    __table_args__ = (
+        Index("ix_tasktombstone_owner_version", "owner_id", "version"),
+    )
+
+    task_id: uuid.UUID = Field(primary_key=True)
+    owner_id: uuid.UUID = Field(foreign_key="user.id")
+    version: int
+    deleted_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class UserTaskState(SQLModel, table=True):
+    """
+    Per-user task list version and counters.
+
+    Every task mutation bumps version in the same transaction, so the value
+    identifies the current state of a user's whole task list (used for ETags).
+    The counters are adjusted in that transaction too, so GET /tasks/summary
+    is a primary key lookup; `python -m src.maintenance repair-task-counts`
+    recomputes them from the tasks.
+    """
+    owner_id: uuid.UUID = Field(primary_key=True, foreign_key="user.id")
+    version: int = Field(default=0)
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    task_count: int = Field(default=0)
+    completed_count: int = Field(default=0)
+    low_priority_count: int = Field(default=0)
+    medium_priority_count: int = Field(default=0)
+    high_priority_count: int = Field(default=0)
 
 class TodoTaskRead(TodoTaskBase):
     id: uuid.UUID
@@ -23,6 +102,21 @@ class TodoTaskRead(TodoTaskBase):
     created_at: datetime
     updated_at: datetime
 
+class TodoTaskRow(TypedDict):
+    """
+    TodoTaskRead as a plain dict, for serializing column-only query results.
+
+    Keys are in TodoTaskRead's field order so both produce identical JSON.
+    """
+    title: str
+    description: Optional[str]
+    completed: bool
+    priority: str
+    id: uuid.UUID
+    owner_id: uuid.UUID
+    created_at: datetime
+    updated_at: datetime
+
 class TodoTaskCreate(TodoTaskBase):
     pass
 
@@ -30,4 +124,71 @@ class TodoTaskUpdate(SQLModel):
     title: Optional[str] = Field(default=None, min_length=1, max_length=200)
     description: Optional[str] = Field(default=None, max_length=1000)
     completed: Optional[bool] = None
-    priority: Optional[str] = Field(default=None, regex="^(low|medium|high)$")
\ No newline at end of file
+    priority: Optional[str] = Field(default=None, regex="^(low|medium|high)$")
+
+    # Optional only so they can be left out; the columns are NOT NULL
+    @field_validator('title', 'completed', 'priority')
+    @classmethod
+    def reject_null(cls, v):
+        if v is None:
+            raise ValueError('May be omitted but not null')
+        return v
+
+class TaskBatchOperation(SQLModel):
+    """One create, update or delete in a POST /tasks/batch request"""
+    op: str = Field(regex="^(create|update|delete)$")
+    # Target task for update/delete
+    id: Optional[uuid.UUID] = None
+    # TodoTaskCreate fields for create, TodoTaskUpdate fields for update
+    data: Optional[Dict[str, Any]] = None
+
+class TaskBatchRequest(SQLModel):
+    operations: List[TaskBatchOperation]
+
+class TaskBatchResult(SQLModel):
+    index: int
+    op: str
+    # created | updated | deleted | not_found | invalid
+    status: str
+    id: Optional[uuid.UUID] = None
+    task: Optional[TodoTaskRead] = None
+    error: Optional[str] = None
+
+class TaskBatchResponse(SQLModel):
+    results: List[TaskBatchResult]
+
+class TaskPriorityCounts(SQLModel):
+    low: int
+    medium: int
+    high: int
+
+class TaskSummary(SQLModel):
+    """Task totals for GET /tasks/summary"""
+    total: int
+    open: int
+    completed: int
+    by_priority: TaskPriorityCounts
+
+class TaskImportError(SQLModel):
+    """A line of a POST /tasks/import upload that was not imported"""
+    # 1-based line number in the upload (for CSV, the line the record starts on)
+    line: int
+    error: str
+
+class TaskImportResponse(SQLModel):
+    imported: int
+    failed: int
+    # The first TASK_IMPORT_MAX_ERRORS failures; errors_truncated is set when there were more
+    errors: List[TaskImportError]
+    errors_truncated: bool = False
+
+class TaskChangesResponse(SQLModel):
+    """A page of the GET /tasks/changes feed"""
+    # Tasks created or updated since the cursor, in their current state
+    changed: List[TodoTaskRead]
+    # Ids of tasks deleted since the cursor
+    deleted: List[uuid.UUID]
+    # Pass as ?since= on the next call
+    cursor: str
+    # True when more changes are waiting; fetch again immediately
+    has_more: bool
@@ -0,0 +1,290 @@
+"""
+Production server: a supervisor process running several uvicorn workers.
+
+    python -m src.server [--workers N] [--host H] [--port P]
+
+Each worker is a separate process (spawned, so it imports the app fresh and
+picks up new code on restart) serving src.main:app with uvloop and
+httptools when they are installed. Workers share the port either by each
+binding their own SO_REUSEPORT socket, so the kernel spreads connections
+evenly, or, where SO_REUSEPORT is missing or SERVER_REUSE_PORT is off,
+through one socket bound here and inherited by every worker.
+
+The supervisor respawns workers that exit unexpectedly (backing off when
+they keep dying right after start), and handles signals:
+
+- SIGTERM / SIGINT: stop accepting, let workers finish in-flight requests
+  (WORKER_GRACEFUL_TIMEOUT) and exit;
+- SIGHUP: rolling restart, one worker at a time; the old worker is only
+  stopped once its replacement has finished startup, and the rollout stops
+  if a replacement fails to start. With SO_REUSEPORT, connections still
+  queued on the old worker's own socket when it closes are reset.
+
+WEB_CONCURRENCY (default: one per CPU) is passed on to the workers, which
+use it with DB_MAX_CONNECTIONS to size their connection pools, leaving room
+for the extra worker a rolling restart runs (see
+src.database.fit_pool_to_budget).
+
+Several workers need the backends that share state across processes
+(TASK_EVENTS_BACKEND=postgres, USER_CACHE_BACKEND=redis): with the
+process-local defaults, event streams would miss other workers' changes and
+/auth/me invalidations would only reach one worker. Without them the
+default is a single worker, and asking for more is refused unless
+SERVER_ALLOW_PROCESS_LOCAL_STATE is set.
+
+This module is imported by the supervisor only; it must not import the
+application at module level (it only loads src.database to apply pending
+migrations before the workers start).
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import time
+from typing import List, Optional
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+APP = "src.main:app"
+# A worker that exits sooner than this after starting counts as a crash loop
+WORKER_MIN_UPTIME_SECONDS = 5
+WORKER_MAX_RESPAWN_DELAY_SECONDS = 30
+
+
+def process_local_backends() -> List[str]:
+    """Configured backends whose state only one worker process sees"""
+    local = []
+    if settings.task_events_backend != "postgres":
+        local.append(f"TASK_EVENTS_BACKEND={settings.task_events_backend}")
+    if settings.user_cache_backend != "redis":
+        local.append(f"USER_CACHE_BACKEND={settings.user_cache_backend}")
+    return local
+
+
+def default_workers() -> int:
+    if settings.web_concurrency:
+        return settings.web_concurrency
+    if process_local_backends():
+        return 1
+    return os.cpu_count() or 1
+
+
+def bind_socket(host: str, port: int, reuse_port: bool = False) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    return sock
+
+
+def _run_worker(host: str, port: int, sock: Optional[socket.socket], ready) -> None:
+    """Worker process entry point: serve the app until told to stop"""
+    import uvicorn
+
+    class WorkerServer(uvicorn.Server):
+        async def startup(self, sockets=None) -> None:
+            await super().startup(sockets=sockets)
+            if not self.should_exit:
+                ready.set()
+
+    config = uvicorn.Config(
+        APP, host=host, port=port, loop="auto", http="auto", lifespan="on", proxy_headers=True,
+        timeout_graceful_shutdown=settings.worker_graceful_timeout,
+    )
+    server = WorkerServer(config)
+    if sock is None:
+        sock = bind_socket(host, port, reuse_port=True)
+    server.run(sockets=[sock])
+    # uvicorn's exit status for a failed lifespan startup
+    sys.exit(0 if server.started else 3)
+
+
+class Worker:
+    def __init__(self, process, ready):
+        self.process = process
+        self.ready = ready
+        self.started_at = time.monotonic()
+
+    def stop(self, timeout: float) -> None:
+        """SIGTERM (uvicorn's graceful shutdown), then SIGKILL after timeout"""
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join(timeout)
+        if self.process.is_alive():
+            logger.warning(f"Worker {self.process.pid} did not stop within {timeout}s; killing it")
+            self.process.kill()
+            self.process.join()
+
+
+class Supervisor:
+    def __init__(self, workers: int, host: str, port: int, reuse_port: Optional[bool] = None,
+                 graceful_timeout: Optional[float] = None, start_timeout: Optional[float] = None):
+        self.workers = max(1, workers)
+        self.host = host
+        self.port = port
+        if reuse_port is None:
+            reuse_port = settings.server_reuse_port
+        self.reuse_port = reuse_port and hasattr(socket, "SO_REUSEPORT")
+        self.graceful_timeout = graceful_timeout or settings.worker_graceful_timeout
+        self.start_timeout = start_timeout or settings.worker_start_timeout
+        self.context = multiprocessing.get_context("spawn")
+        self.socket: Optional[socket.socket] = None
+        self.slots: List[Optional[Worker]] = [None] * self.workers
+        self.failures = [0] * self.workers
+        self.respawn_at = [0.0] * self.workers
+        self.stopping = False
+        self.restart_requested = False
+
+    # --- Signals ---
+
+    def _on_stop(self, signum, frame) -> None:
+        self.stopping = True
+
+    def _on_restart(self, signum, frame) -> None:
+        self.restart_requested = True
+
+    def install_signal_handlers(self) -> None:
+        signal.signal(signal.SIGTERM, self._on_stop)
+        signal.signal(signal.SIGINT, self._on_stop)
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, self._on_restart)
+
+    # --- Workers ---
+
+    def spawn(self) -> Worker:
+        ready = self.context.Event()
+        process = self.context.Process(
+            target=_run_worker, args=(self.host, self.port, self.socket, ready), name="todo-api-worker",
+        )
+        process.start()
+        logger.info(f"Started worker {process.pid}")
+        return Worker(process, ready)
+
+    def reap(self) -> None:
+        """Respawn workers that exited without being asked to"""
+        now = time.monotonic()
+        for index, worker in enumerate(self.slots):
+            if worker is not None and worker.process.is_alive():
+                continue
+            if worker is not None:
+                uptime = now - worker.started_at
+                logger.warning(f"Worker {worker.process.pid} exited with status {worker.process.exitcode} "
+                               f"after {uptime:.1f}s")
+                self.failures[index] = self.failures[index] + 1 if uptime < WORKER_MIN_UPTIME_SECONDS else 0
+                delay = min(WORKER_MAX_RESPAWN_DELAY_SECONDS, 2 ** self.failures[index] - 1)
+                self.respawn_at[index] = now + delay
+                self.slots[index] = None
+            if now >= self.respawn_at[index] and not self.stopping:
+                self.slots[index] = self.spawn()
+
+    def rolling_restart(self) -> bool:
+        """Replace the workers one at a time; False if a replacement failed to start"""
+        logger.info(f"Rolling restart of {self.workers} workers")
+        for index, old in enumerate(self.slots):
+            if self.stopping:
+                return False
+            new = self.spawn()
+            if not self._wait_ready(new):
+                logger.error(f"Worker {new.process.pid} failed to start; keeping the remaining workers")
+                new.stop(self.graceful_timeout)
+                return False
+            self.slots[index] = new
+            self.failures[index] = 0
+            if old is not None:
+                old.stop(self.graceful_timeout)
+        logger.info("Rolling restart complete")
+        return True
+
+    def _wait_ready(self, worker: Worker) -> bool:
+        deadline = time.monotonic() + self.start_timeout
+        while time.monotonic() < deadline and not self.stopping:
+            if worker.ready.wait(0.1):
+                return True
+            if not worker.process.is_alive():
+                return False
+        return False
+
+    # --- Main loop ---
+
+    def prepare_schema(self) -> None:
+        """
+        Apply pending migrations once, before any worker starts; workers that
+        started together would otherwise race to run them. Each worker's
+        lifespan then only confirms the version.
+        """
+        from src.database import create_tables, engine
+
+        create_tables()
+        # The workers open their own connections
+        engine.dispose()
+
+    def run(self) -> None:
+        # Workers size their connection pools by the number of processes
+        os.environ["WEB_CONCURRENCY"] = str(self.workers)
+        if self.reuse_port:
+            # Fail fast if the port is taken; each worker binds its own socket. Keeping
+            # this one open would let the kernel route connections to a socket nobody accepts on.
+            bind_socket(self.host, self.port, reuse_port=True).close()
+        else:
+            self.socket = bind_socket(self.host, self.port)
+        logger.info(f"Serving on {self.host}:{self.port} with {self.workers} workers "
+                    f"({'SO_REUSEPORT' if self.reuse_port else 'shared socket'})")
+
+        self.prepare_schema()
+        self.install_signal_handlers()
+        try:
+            self.slots = [self.spawn() for _ in range(self.workers)]
+            while not self.stopping:
+                # Signal handlers only set flags; they are acted on here
+                time.sleep(0.5)
+                if self.restart_requested and not self.stopping:
+                    self.restart_requested = False
+                    self.rolling_restart()
+                self.reap()
+        finally:
+            self.stopping = True
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        logger.info("Stopping workers")
+        workers = [worker for worker in self.slots if worker is not None]
+        for worker in workers:
+            if worker.process.is_alive():
+                worker.process.terminate()
+        for worker in workers:
+            worker.stop(self.graceful_timeout)
+        if self.socket is not None:
+            self.socket.close()
+
+
+def main(argv=None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(prog="python -m src.server")
+    parser.add_argument("--workers", type=int, default=default_workers(),
+                        help="Worker processes (default: WEB_CONCURRENCY, else one per CPU "
+                             "with shared backends and one without)")
+    parser.add_argument("--host", default=settings.host)
+    parser.add_argument("--port", type=int, default=settings.port)
+    args = parser.parse_args(argv)
+
+    local = process_local_backends()
+    if args.workers > 1 and local:
+        message = (f"{args.workers} workers with process-local {', '.join(local)}: event streams and "
+                   f"profile cache invalidations would not reach other workers")
+        if not settings.server_allow_process_local_state:
+            parser.error(f"{message}. Use TASK_EVENTS_BACKEND=postgres and USER_CACHE_BACKEND=redis, "
+                         f"run one worker, or set SERVER_ALLOW_PROCESS_LOCAL_STATE=true")
+        logger.warning(message)
+
+    Supervisor(args.workers, args.host, args.port).run()
+
+
+if __name__ == "__main__":
+    main()
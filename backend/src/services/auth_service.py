@@ -1,30 +1,34 @@
 from sqlmodel import Session, select
-from passlib.context import CryptContext
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
-from jose import JWTError, jwt
+from src.config import settings
 from src.models.user import User, UserCreate, UserLogin
-from src.database import get_session
-import os
-from dotenv import load_dotenv
+from src.database import get_session, run_db, run_db_read
+from src.services.password_hasher import password_hasher
 
-load_dotenv()
+SECRET_KEY = settings.jwt_secret_key
+ALGORITHM = settings.jwt_algorithm
+ACCESS_TOKEN_EXPIRE_MINUTES = settings.jwt_access_token_expire_minutes
 
-# Use argon2 instead of bcrypt to avoid compatibility issues
-pwd_context = CryptContext(
-    schemes=["argon2"],
-    deprecated="auto"
-)
+# passlib and jose (with the cryptography backend) are imported on first use
+# rather than at startup; together they add tens of milliseconds to a cold start.
 
-SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-default-secret-key-change-in-production")
-ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+@lru_cache(maxsize=None)
+def _pwd_context():
+    from passlib.context import CryptContext
+
+    # Use argon2 instead of bcrypt to avoid compatibility issues
+    return CryptContext(
+        schemes=["argon2"],
+        deprecated="auto"
+    )
 
 class AuthService:
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         try:
-            return pwd_context.verify(plain_password, hashed_password)
+            return _pwd_context().verify(plain_password, hashed_password)
         except Exception as e:
             print(f"Password verification error: {e}")
             return False
@@ -32,51 +36,68 @@ class AuthService:
     @staticmethod
     def get_password_hash(password: str) -> str:
         try:
-            return pwd_context.hash(password)
+            return _pwd_context().hash(password)
         except Exception as e:
             print(f"Error hashing password: {e}")
             raise
 
     @staticmethod
-    def create_user(user_create: UserCreate, db_session: Session) -> User:
-        # Check if user already exists
-        existing_user = db_session.exec(select(User).where(User.email == user_create.email)).first()
-        if existing_user:
-            raise ValueError("Email already registered")
-
-        # Hash the password
-        hashed_password = AuthService.get_password_hash(user_create.password)
-
-        # Create user object
-        db_user = User(
-            email=user_create.email,
-            first_name=user_create.first_name,
-            last_name=user_create.last_name,
-            hashed_password=hashed_password
-        )
-
-        # Add to database
-        db_session.add(db_user)
-        db_session.commit()
-        db_session.refresh(db_user)
-
-        return db_user
+    def get_user_by_email(email: str, db_session: Session) -> Optional[User]:
+        statement = select(User).where(User.email == email)
+        return db_session.exec(statement).first()
 
     @staticmethod
-    def authenticate_user(email: str, password: str, db_session: Session) -> Optional[User]:
-        statement = select(User).where(User.email == email)
-        user = db_session.exec(statement).first()
+    def get_user_by_id(user_id: str, db_session: Session) -> Optional[User]:
+        statement = select(User).where(User.id == user_id)
+        return db_session.exec(statement).first()
+
+    @staticmethod
+    async def create_user(user_create: UserCreate, db_session) -> User:
+        # Hash the password on the hashing pool, outside the database session, so
+        # the (slow) argon2 work never runs on the event loop or holds a connection.
+        # Raises PasswordHasherBusy when the pool's queue is full.
+        hashed_password = await password_hasher.hash(user_create.password)
+
+        def insert_user(session: Session) -> User:
+            # Check if user already exists
+            if AuthService.get_user_by_email(user_create.email, session):
+                raise ValueError("Email already registered")
+
+            # Create user object
+            db_user = User(
+                email=user_create.email,
+                first_name=user_create.first_name,
+                last_name=user_create.last_name,
+                hashed_password=hashed_password
+            )
+
+            # Add to database
+            session.add(db_user)
+            session.commit()
+            session.refresh(db_user)
+
+            return db_user
+
+        return await run_db(db_session, insert_user)
+
+    @staticmethod
+    async def authenticate_user(email: str, password: str, db_session, primary_session=None) -> Optional[User]:
+        # The lookup may run on a replica; primary_session covers a user the replica has not seen yet
+        user = await run_db_read(db_session, primary_session or db_session,
+                                 lambda session: AuthService.get_user_by_email(email, session))
 
         if not user:
             return None
 
-        if not AuthService.verify_password(password, user.hashed_password):
+        if not await password_hasher.verify(password, user.hashed_password):
             return None
 
         return user
 
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+        from jose import jwt
+
         to_encode = data.copy()
 
         if expires_delta:
@@ -91,6 +112,8 @@ class AuthService:
 
     @staticmethod
     def verify_token(token: str) -> Optional[dict]:
+        from jose import JWTError, jwt
+
         try:
             payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
             email: str = payload.get("sub")
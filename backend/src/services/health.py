@@ -0,0 +1,134 @@
+"""
+Readiness checks for load balancer probes.
+
+A probe reports ready when the database answers SELECT 1 within a timeout
+and the connection pool is not saturated. The database result is cached
+for HEALTH_CHECK_CACHE_SECONDS and concurrent probes share one in-flight
+check, so a thousand probes per second still cost about one query per
+interval. Pool usage is read on every probe since it costs no I/O.
+"""
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from sqlalchemy import text
+from starlette.concurrency import run_in_threadpool
+
+from src.config import settings
+from src.database import async_engine, engine
+from src.metrics import Gauge
+
+logger = logging.getLogger(__name__)
+
+HEALTH_CHECK_CACHE_SECONDS = settings.health_check_cache_seconds
+HEALTH_CHECK_TIMEOUT_SECONDS = settings.health_check_timeout_seconds
+# Share of pool_size + max_overflow checked out at which the replica reports not ready
+HEALTH_POOL_SATURATION_THRESHOLD = settings.health_pool_saturation_threshold
+
+READY = Gauge("readiness_ready", "1 when the last readiness probe passed")
+DB_CHECK_SECONDS = Gauge("readiness_db_check_seconds", "Latency of the last readiness SELECT 1")
+
+
+def pool_status(engine) -> dict:
+    """Checked-out connections against the pool's capacity"""
+    pool = getattr(engine, "sync_engine", engine).pool
+    if not hasattr(pool, "checkedout"):
+        # SQLite's pools have no fixed capacity
+        return {"checked_out": None, "capacity": None, "saturation": None}
+    capacity = pool.size() + max(0, getattr(pool, "_max_overflow", 0))
+    checked_out = pool.checkedout()
+    return {
+        "checked_out": checked_out,
+        "capacity": capacity,
+        "saturation": round(checked_out / capacity, 3) if capacity else None,
+    }
+
+
+class ReadinessProbe:
+    def __init__(self, engine, async_engine=None,
+                 cache_seconds: float = HEALTH_CHECK_CACHE_SECONDS,
+                 timeout: float = HEALTH_CHECK_TIMEOUT_SECONDS,
+                 saturation_threshold: float = HEALTH_POOL_SATURATION_THRESHOLD):
+        self.engine = engine
+        self.async_engine = async_engine
+        self.cache_seconds = cache_seconds
+        self.timeout = timeout
+        self.saturation_threshold = saturation_threshold
+        self.draining = False
+        self._result: Optional[dict] = None
+        self._checked_at = 0.0
+        self._pending: Optional[asyncio.Future] = None
+        self._sync_check_running = False
+
+    async def check(self) -> dict:
+        """Return the readiness report; report["ready"] decides the status code"""
+        database = await self._database_status()
+        pool = pool_status(self.async_engine or self.engine)
+
+        reasons = []
+        if self.draining:
+            reasons.append("shutting down")
+        if not database["ok"]:
+            reasons.append("database unavailable")
+        if pool["saturation"] is not None and pool["saturation"] >= self.saturation_threshold:
+            reasons.append("connection pool saturated")
+
+        READY.set(0 if reasons else 1)
+        return {"ready": not reasons, "reasons": reasons, "database": database, "pool": pool}
+
+    async def _database_status(self) -> dict:
+        if self._result is not None and time.monotonic() - self._checked_at < self.cache_seconds:
+            return dict(self._result, cached=True)
+
+        # Probes arriving while a check runs wait for it rather than issuing their own
+        if self._pending is None:
+            self._pending = asyncio.ensure_future(self._run_check())
+        pending = self._pending
+        try:
+            return dict(await asyncio.shield(pending), cached=False)
+        finally:
+            if pending.done() and self._pending is pending:
+                self._pending = None
+
+    async def _run_check(self) -> dict:
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(self._select_one(), self.timeout)
+            result = {"ok": True, "error": None}
+        except asyncio.TimeoutError:
+            result = {"ok": False, "error": f"SELECT 1 timed out after {self.timeout:g}s"}
+        except Exception as e:
+            result = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        elapsed = time.monotonic() - started
+        if not result["ok"]:
+            logger.warning(f"Readiness check failed: {result['error']}")
+
+        DB_CHECK_SECONDS.set(elapsed)
+        result["latency_ms"] = round(elapsed * 1000, 2)
+        self._result, self._checked_at = result, time.monotonic()
+        return result
+
+    async def _select_one(self) -> None:
+        if self.async_engine is not None:
+            async with self.async_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            return
+
+        # A threadpool check cannot be cancelled: after a timeout the thread runs on, and
+        # no new one is started until it returns, so a hung database ties up one thread
+        if self._sync_check_running:
+            raise RuntimeError("previous SELECT 1 has not returned")
+
+        def select_one():
+            try:
+                with self.engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+            finally:
+                self._sync_check_running = False
+
+        self._sync_check_running = True
+        await run_in_threadpool(select_one)
+
+
+readiness_probe = ReadinessProbe(engine, async_engine)
@@ -0,0 +1,184 @@
+"""
+Argon2 password hashing on a dedicated, bounded process pool.
+
+Argon2 is deliberately CPU- and memory-heavy, so hashing in the request
+thread lets a burst of logins stall every other endpoint. PasswordHasher
+runs hash/verify in a small ProcessPoolExecutor, refuses new work once
+max_pending jobs are queued (PasswordHasherBusy, surfaced as 503) and
+records hash latency and queue wait.
+
+This module is imported by the pool's worker processes, so it must not
+import the application (database, routers) at module level.
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from src.config import settings
+from src.metrics import Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+# Worker processes (0 runs hashing in the threadpool instead, e.g. on platforms without fork/spawn).
+# By default up to 2, sharing the CPUs with the other server workers (WEB_CONCURRENCY).
+PASSWORD_HASH_WORKERS = settings.password_hash_workers
+if PASSWORD_HASH_WORKERS is None:
+    PASSWORD_HASH_WORKERS = max(1, min(2, (os.cpu_count() or 1) // (settings.web_concurrency or 1)))
+# Jobs allowed to wait or run before new requests are rejected
+PASSWORD_HASH_MAX_PENDING = settings.password_hash_max_pending or max(1, PASSWORD_HASH_WORKERS) * 8
+# Latency budget for a single hash; when set, argon2 costs are calibrated at startup
+PASSWORD_HASH_TARGET_MS = settings.password_hash_target_ms
+
+# passlib's argon2 defaults; calibration may lower time/memory cost to fit the budget
+DEFAULT_ARGON2_PARAMS = {"time_cost": 2, "memory_cost": 102400, "parallelism": 8}
+# OWASP minimum (19 MiB, 2 iterations); calibration never goes below this
+MIN_ARGON2_MEMORY_COST = 19456
+MIN_ARGON2_TIME_COST = 2
+MAX_ARGON2_TIME_COST = 10
+
+HASH_SECONDS = Histogram(
+    "password_hash_seconds", "Time spent computing argon2 hashes", ["operation"]
+)
+HASH_QUEUE_WAIT_SECONDS = Histogram(
+    "password_hash_queue_wait_seconds", "Time argon2 jobs waited for a free worker", ["operation"]
+)
+HASH_PENDING = Gauge("password_hash_pending", "Argon2 jobs queued or running")
+HASH_REJECTED = Counter("password_hash_rejected_total", "Argon2 jobs rejected because the queue was full")
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing queue is full; callers should answer 503"""
+
+
+# --- Worker-side functions (run inside the pool processes) ---
+
+_contexts: Dict[Tuple[int, int, int], object] = {}
+
+
+def _context(params: dict):
+    key = (params["time_cost"], params["memory_cost"], params["parallelism"])
+    ctx = _contexts.get(key)
+    if ctx is None:
+        from passlib.context import CryptContext
+
+        ctx = _contexts[key] = CryptContext(
+            schemes=["argon2"],
+            deprecated="auto",
+            argon2__time_cost=params["time_cost"],
+            argon2__memory_cost=params["memory_cost"],
+            argon2__parallelism=params["parallelism"],
+        )
+    return ctx
+
+
+def _run_hash(password: str, params: dict):
+    started = time.monotonic()
+    result = _context(params).hash(password)
+    return result, started, time.monotonic()
+
+
+def _run_verify(password: str, hashed_password: str, params: dict):
+    started = time.monotonic()
+    try:
+        result = _context(params).verify(password, hashed_password)
+    except Exception as e:
+        logger.warning(f"Password verification error: {e}")
+        result = False
+    return result, started, time.monotonic()
+
+
+def _time_hash(params: dict, samples: int = 2) -> float:
+    ctx = _context(params)
+    ctx.hash("calibration")  # warm up
+    started = time.monotonic()
+    for _ in range(samples):
+        ctx.hash("calibration")
+    return (time.monotonic() - started) / samples
+
+
+def calibrate_argon2(target_seconds: float, params: Optional[dict] = None) -> dict:
+    """
+    Pick argon2 costs that hash within target_seconds on this machine.
+
+    Memory cost is halved (down to the OWASP floor) until the minimum time
+    cost fits the budget; time cost is then raised while it still fits.
+    """
+    params = dict(params or DEFAULT_ARGON2_PARAMS)
+    params["time_cost"] = MIN_ARGON2_TIME_COST
+    while _time_hash(params) > target_seconds and params["memory_cost"] > MIN_ARGON2_MEMORY_COST:
+        params["memory_cost"] = max(MIN_ARGON2_MEMORY_COST, params["memory_cost"] // 2)
+
+    while params["time_cost"] < MAX_ARGON2_TIME_COST:
+        candidate = dict(params, time_cost=params["time_cost"] + 1)
+        if _time_hash(candidate) > target_seconds:
+            break
+        params = candidate
+    return params
+
+
+# --- Application-side API ---
+
+class PasswordHasher:
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS,
+                 max_pending: int = PASSWORD_HASH_MAX_PENDING,
+                 params: Optional[dict] = None):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.params = dict(params or DEFAULT_ARGON2_PARAMS)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+
+    def start(self) -> None:
+        if self._executor is None and self.workers > 0:
+            # spawn rather than fork: the server process has threads running
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def calibrate(self, target_ms: float) -> dict:
+        """Calibrate argon2 costs on a pool worker and use them for new hashes"""
+        self.params = await self._submit(calibrate_argon2, target_ms / 1000.0, self.params)
+        logger.info(f"Calibrated argon2 parameters for {target_ms:.0f}ms: {self.params}")
+        return self.params
+
+    async def hash(self, password: str) -> str:
+        return await self._timed("hash", _run_hash, password, self.params)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._timed("verify", _run_verify, password, hashed_password, self.params)
+
+    async def _timed(self, operation: str, fn, *args):
+        submitted = time.monotonic()
+        result, started, finished = await self._submit(fn, *args)
+        HASH_QUEUE_WAIT_SECONDS.labels(operation=operation).observe(max(0.0, started - submitted))
+        HASH_SECONDS.labels(operation=operation).observe(finished - started)
+        return result
+
+    async def _submit(self, fn, *args):
+        if self._pending >= self.max_pending:
+            HASH_REJECTED.inc()
+            raise PasswordHasherBusy("Password hashing queue is full")
+
+        self._pending += 1
+        HASH_PENDING.set(self._pending)
+        try:
+            loop = asyncio.get_running_loop()
+            self.start()
+            # With workers=0 the executor is None and the loop's default threadpool is used
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+            HASH_PENDING.set(self._pending)
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,63 @@
+"""
+Read-your-writes tracking for replica routing.
+
+Replicas lag the primary, so a user who just changed their tasks could read
+the old list back from a replica. Every committed task mutation records its
+owner here, and for READ_YOUR_WRITES_SECONDS afterwards that user's reads
+are pinned to the primary (see get_read_db_session).
+
+The record is per process. With several workers and no sticky load
+balancing, a read landing on another worker can still reach the replica
+inside the window; set the window to cover the replica's typical lag.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session as SASession
+
+from src.config import settings
+
+READ_YOUR_WRITES_SECONDS = settings.read_your_writes_seconds
+# Users tracked at once; the oldest records are dropped first
+RECENT_WRITERS_SIZE = 100000
+
+
+class RecentWriters:
+    def __init__(self, window: float = READ_YOUR_WRITES_SECONDS, maxsize: int = RECENT_WRITERS_SIZE):
+        self.window = window
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        # user_id -> monotonic time of the last committed write
+        self._writes: "OrderedDict[str, float]" = OrderedDict()
+
+    def mark(self, user_id) -> None:
+        with self._lock:
+            self._writes[str(user_id)] = time.monotonic()
+            self._writes.move_to_end(str(user_id))
+            while len(self._writes) > self.maxsize:
+                self._writes.popitem(last=False)
+
+    def wrote_recently(self, user_id) -> bool:
+        written_at = self._writes.get(str(user_id))
+        return written_at is not None and time.monotonic() - written_at < self.window
+
+
+recent_writers = RecentWriters()
+
+
+def mark_written(session, owner_id) -> None:
+    """Record that owner_id's data changes if the session's transaction commits"""
+    session.info.setdefault("written_owner_ids", set()).add(str(owner_id))
+
+
+@event.listens_for(SASession, "after_commit")
+def _record_writers(session) -> None:
+    for owner_id in session.info.pop("written_owner_ids", ()):
+        recent_writers.mark(owner_id)
+
+
+@event.listens_for(SASession, "after_rollback")
+def _discard_writers(session) -> None:
+    session.info.pop("written_owner_ids", None)
@@ -0,0 +1,107 @@
+"""
+Request coalescing ("singleflight") for task list reads.
+
+Retries and several open tabs send bursts of identical GET /tasks/ requests
+for the same user. The first request of a burst runs the query and encodes
+the page; identical requests arriving while it is in flight wait for and
+share that result instead of running their own.
+
+Nothing is kept once a flight lands, so results are never served after the
+fact; the only risk is joining a flight that started before a write. Every
+committed task mutation therefore drops its owner's in-flight entries (see
+forget_on_commit), and reads arriving after the commit start a new flight.
+
+Flights are per process, like the read-your-writes record: a write on one
+worker does not detach readers waiting on another worker's flight.
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session as SASession
+
+from src.metrics import Counter
+
+READS_COALESCED = Counter(
+    "task_list_reads_coalesced_total", "Task list reads served by another request's in-flight query"
+)
+
+
+class _LeaderCancelled(Exception):
+    """The request running a flight was cancelled; waiters start their own"""
+
+
+class SingleFlight:
+    def __init__(self):
+        # Writes commit on threadpool threads; flights live on the event loop
+        self._lock = threading.Lock()
+        # owner_id -> key -> future of the flight's result
+        self._flights: Dict[str, Dict[Hashable, asyncio.Future]] = {}
+
+    async def do(self, owner_id, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fn, or wait for the identical call already in flight for owner_id"""
+        owner_id = str(owner_id)
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                flights = self._flights.setdefault(owner_id, {})
+                future = flights.get(key)
+                if future is None or future.get_loop() is not loop:
+                    future = flights[key] = loop.create_future()
+                    break
+            try:
+                # shield: a waiter going away must not cancel the shared result
+                result = await asyncio.shield(future)
+            except _LeaderCancelled:
+                continue
+            READS_COALESCED.inc()
+            return result
+
+        # Mark failures as retrieved so a flight nobody joined doesn't log them
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                flights = self._flights.get(owner_id)
+                if flights is not None and flights.get(key) is future:
+                    del flights[key]
+                    if not flights:
+                        del self._flights[owner_id]
+
+    def forget(self, owner_id) -> None:
+        """Detach owner_id's flights; callers already waiting keep their result"""
+        with self._lock:
+            self._flights.pop(str(owner_id), None)
+
+    def in_flight(self, owner_id) -> int:
+        return len(self._flights.get(str(owner_id), ()))
+
+
+task_list_flights = SingleFlight()
+
+
+def forget_on_commit(session, owner_id) -> None:
+    """Detach owner_id's in-flight list reads once the session's transaction commits"""
+    session.info.setdefault("singleflight_owner_ids", set()).add(str(owner_id))
+
+
+@event.listens_for(SASession, "after_commit")
+def _forget_flights(session) -> None:
+    for owner_id in session.info.pop("singleflight_owner_ids", ()):
+        task_list_flights.forget(owner_id)
+
+
+@event.listens_for(SASession, "after_rollback")
+def _discard_flights(session) -> None:
+    session.info.pop("singleflight_owner_ids", None)
@@ -0,0 +1,286 @@
+"""
+Per-user push of task changes (served as Server-Sent Events by GET /tasks/events).
+
+TaskService publishes one event per committed mutation: the owner's new
+list version plus the changed tasks and deleted ids, the same delta shape
+as GET /tasks/changes. Delivery goes through a pluggable backend:
+
+- LocalBackend (default): events are held on the SQLAlchemy session and
+  fanned out to this process's subscribers after the transaction commits.
+- PostgresNotifyBackend: events are sent with pg_notify inside the
+  mutation's transaction (so Postgres delivers them only on commit) and
+  every worker LISTENs, so subscribers on any process receive them.
+
+Each subscriber has a bounded queue. A subscriber that falls behind has its
+backlog dropped and receives a single "resync" event instead, after which it
+should catch up through GET /tasks/changes. Connections per user are capped.
+"""
+import asyncio
+import json
+import logging
+import threading
+from collections import namedtuple
+from typing import Dict, Iterable, Optional, Set
+
+from sqlalchemy import event, select, func
+from sqlalchemy.orm import Session as SASession
+
+from src.config import settings
+from src.metrics import Counter, Gauge
+from src.models.todo_task import TodoTaskRead
+
+logger = logging.getLogger(__name__)
+
+# "local" (this process only) or "postgres" (LISTEN/NOTIFY across workers)
+TASK_EVENTS_BACKEND = settings.task_events_backend
+# Events buffered per connection before it is considered lagging
+TASK_EVENTS_QUEUE_SIZE = settings.task_events_queue_size
+TASK_EVENTS_MAX_CONNECTIONS_PER_USER = settings.task_events_max_connections_per_user
+# Idle streams get a comment line this often so proxies keep them open
+TASK_EVENTS_HEARTBEAT_SECONDS = settings.task_events_heartbeat_seconds
+
+NOTIFY_CHANNEL = "task_events"
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+NOTIFY_MAX_PAYLOAD = 7900
+
+EVENTS_PUBLISHED = Counter("task_events_published_total", "Task change events published")
+EVENTS_DROPPED = Counter("task_events_dropped_total", "Subscriber backlogs dropped because the client fell behind")
+CONNECTIONS_REJECTED = Counter("task_events_rejected_total", "Event streams refused by the per-user connection cap")
+SUBSCRIBERS = Gauge("task_events_subscribers", "Open task event streams")
+
+# data is the JSON-encoded event, encoded once and shared by every subscriber
+TaskEvent = namedtuple("TaskEvent", ["owner_id", "type", "version", "data"])
+
+
+class TooManyConnections(Exception):
+    """Raised when a user already has the maximum number of open event streams"""
+
+
+def _encode(owner_id, event_type: str, version: int, **fields) -> TaskEvent:
+    body = {"type": event_type, "version": version, **fields}
+    return TaskEvent(str(owner_id), event_type, version, json.dumps(body, separators=(",", ":")))
+
+
+class Subscription:
+    def __init__(self, bus: "TaskEventBus", user_id: str, maxsize: int):
+        self.bus = bus
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self._queue: "asyncio.Queue[TaskEvent]" = asyncio.Queue(maxsize)
+        self._lagging = False
+
+    def _deliver(self, task_event: TaskEvent) -> None:
+        # Runs on the subscriber's event loop
+        if self._lagging:
+            return
+        try:
+            self._queue.put_nowait(task_event)
+        except asyncio.QueueFull:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(_encode(self.user_id, "resync", task_event.version))
+            self._lagging = True
+            EVENTS_DROPPED.inc()
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[TaskEvent]:
+        """Next event, or None if nothing arrives within timeout"""
+        try:
+            task_event = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if task_event.type == "resync":
+            self._lagging = False
+        return task_event
+
+    def close(self) -> None:
+        self.bus._unsubscribe(self)
+
+
+class LocalBackend:
+    """Delivers committed events to subscribers in this process only"""
+
+    process_local = True
+
+    def attach(self, dispatch) -> None:
+        self.dispatch = dispatch
+
+    def publish(self, session: SASession, task_event: TaskEvent) -> None:
+        # Held until after_commit (see the hooks at the bottom of this module)
+        session.info.setdefault("task_events", []).append(task_event)
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class PostgresNotifyBackend:
+    """Fans events out to every worker through Postgres LISTEN/NOTIFY"""
+
+    process_local = False
+
+    def __init__(self, database_url: str):
+        # psycopg wants a plain libpq URL
+        self.database_url = database_url.replace("postgresql+psycopg://", "postgresql://", 1)
+        self._listener: Optional[asyncio.Task] = None
+
+    def attach(self, dispatch) -> None:
+        self.dispatch = dispatch
+
+    @staticmethod
+    def _payload(task_event: TaskEvent) -> str:
+        # "<owner_id>\n<event JSON>": the event is sent as encoded, not re-escaped inside another document
+        return f"{task_event.owner_id}\n{task_event.data}"
+
+    def publish(self, session: SASession, task_event: TaskEvent) -> None:
+        payload = self._payload(task_event)
+        if len(payload.encode()) > NOTIFY_MAX_PAYLOAD:
+            # Too large to inline (e.g. a big batch): tell clients to fetch the delta
+            payload = self._payload(_encode(task_event.owner_id, "resync", task_event.version))
+        session.execute(select(func.pg_notify(NOTIFY_CHANNEL, payload)))
+
+    async def start(self) -> None:
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def _listen(self) -> None:
+        import psycopg
+
+        delay = 1.0
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(self.database_url, autocommit=True) as conn:
+                    await conn.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                    delay = 1.0
+                    async for notify in conn.notifies():
+                        owner_id, _, data = notify.payload.partition("\n")
+                        body = json.loads(data)
+                        self.dispatch(TaskEvent(owner_id, body["type"], body["version"], data))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Events sent while disconnected are lost; clients recover via /tasks/changes
+                logger.warning(f"Task event listener disconnected: {e}; reconnecting in {delay:.0f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+
+
+class TaskEventBus:
+    def __init__(self, backend, queue_size: int = TASK_EVENTS_QUEUE_SIZE,
+                 max_connections_per_user: int = TASK_EVENTS_MAX_CONNECTIONS_PER_USER):
+        self.backend = backend
+        self.queue_size = queue_size
+        self.max_connections_per_user = max_connections_per_user
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        backend.attach(self.dispatch)
+
+    async def start(self) -> None:
+        await self.backend.start()
+
+    async def stop(self) -> None:
+        await self.backend.stop()
+
+    def subscribe(self, user_id) -> Subscription:
+        """Open a stream for a user; must be called on the event loop that will read it"""
+        user_id = str(user_id)
+        with self._lock:
+            streams = self._subscribers.setdefault(user_id, set())
+            if len(streams) >= self.max_connections_per_user:
+                CONNECTIONS_REJECTED.inc()
+                raise TooManyConnections(
+                    f"At most {self.max_connections_per_user} event streams may be open per user"
+                )
+            subscription = Subscription(self, user_id, self.queue_size)
+            streams.add(subscription)
+            SUBSCRIBERS.inc()
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            streams = self._subscribers.get(subscription.user_id)
+            if streams is None or subscription not in streams:
+                return
+            streams.discard(subscription)
+            if not streams:
+                del self._subscribers[subscription.user_id]
+            SUBSCRIBERS.dec()
+
+    def publish(self, session: SASession, owner_id, version: int,
+                changed: Iterable = (), deleted: Iterable = ()) -> None:
+        """
+        Queue a change event on the session's transaction.
+
+        changed holds TodoTaskRead-compatible objects, deleted task ids. Nothing
+        is delivered unless the transaction commits.
+        """
+        owner_id = str(owner_id)
+        if self.backend.process_local and owner_id not in self._subscribers:
+            # Nobody here is listening; skip the serialization entirely
+            return
+
+        task_event = _encode(
+            owner_id, "tasks", version,
+            changed=[TodoTaskRead.model_validate(task).model_dump(mode="json") for task in changed],
+            deleted=[str(task_id) for task_id in deleted],
+        )
+        self.backend.publish(session, task_event)
+        EVENTS_PUBLISHED.inc()
+
+    def publish_resync(self, session: SASession, owner_id, version: int) -> None:
+        """
+        Queue a "resync" event on the session's transaction, for changes too
+        large to carry inline (e.g. a bulk import); clients catch up through
+        GET /tasks/changes.
+        """
+        owner_id = str(owner_id)
+        if self.backend.process_local and owner_id not in self._subscribers:
+            return
+        self.backend.publish(session, _encode(owner_id, "resync", version))
+        EVENTS_PUBLISHED.inc()
+
+    def dispatch(self, task_event: TaskEvent) -> None:
+        """Hand a committed event to the owner's subscribers; safe to call from any thread"""
+        with self._lock:
+            streams = list(self._subscribers.get(task_event.owner_id, ()))
+        for subscription in streams:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._deliver, task_event)
+            except RuntimeError:
+                # The subscriber's loop has shut down
+                subscription.close()
+
+
+def _create_backend():
+    if TASK_EVENTS_BACKEND == "postgres":
+        from src.database import DATABASE_URL
+
+        return PostgresNotifyBackend(DATABASE_URL)
+    return LocalBackend()
+
+
+task_events = TaskEventBus(_create_backend())
+
+
+# --- Local delivery ---
+# Events held on a session are dispatched only once its transaction commits.
+
+@event.listens_for(SASession, "after_commit")
+def _dispatch_committed_events(session) -> None:
+    for task_event in session.info.pop("task_events", ()):
+        task_events.dispatch(task_event)
+
+
+@event.listens_for(SASession, "after_rollback")
+def _discard_events(session) -> None:
+    session.info.pop("task_events", None)
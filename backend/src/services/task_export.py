@@ -0,0 +1,115 @@
+"""
+Streaming export of a user's whole task list as NDJSON or CSV.
+
+Rows are read through a server-side cursor (yield_per, which implies
+stream_results) in batches of TASK_EXPORT_BATCH_SIZE and encoded one batch
+at a time. Memory use is therefore bounded by the batch size, not by the
+number of tasks. Each batch becomes one chunk of the response body, so the
+client starts receiving data as soon as the first batch is read.
+"""
+import csv
+import io
+from typing import AsyncIterator, Dict, Iterable, Iterator, List
+
+from pydantic import TypeAdapter
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.config import settings
+from src.models.todo_task import TodoTask, TodoTaskRow
+from src.services.task_service import TASK_READ_COLUMNS
+
+# Rows fetched from the database cursor per round trip (and per response chunk)
+TASK_EXPORT_BATCH_SIZE = settings.task_export_batch_size
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+CSV_COLUMNS = list(TodoTaskRow.__annotations__)
+
+_row_adapter = TypeAdapter(TodoTaskRow)
+
+
+def _export_statement(user_id: str, batch_size: int):
+    return (
+        select(*TASK_READ_COLUMNS)
+        .where(TodoTask.owner_id == user_id)
+        .order_by(TodoTask.created_at, TodoTask.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+
+def iter_task_batches(user_id: str, db_session: Session,
+                      batch_size: int = TASK_EXPORT_BATCH_SIZE) -> Iterator[List[Dict]]:
+    """Yield the user's tasks, oldest first, as lists of TodoTaskRow dicts"""
+    result = db_session.execute(_export_statement(user_id, batch_size))
+    try:
+        for partition in result.partitions():
+            yield [row._asdict() for row in partition]
+    finally:
+        # Releases the server-side cursor if the client disconnects mid-export
+        result.close()
+
+
+async def aiter_task_batches(user_id: str, db_session: AsyncSession,
+                             batch_size: int = TASK_EXPORT_BATCH_SIZE) -> AsyncIterator[List[Dict]]:
+    """Async counterpart of iter_task_batches, for an AsyncSession"""
+    result = await db_session.stream(_export_statement(user_id, batch_size))
+    try:
+        async for partition in result.partitions():
+            yield [row._asdict() for row in partition]
+    finally:
+        await result.close()
+
+
+def encode_ndjson(batch: Iterable[Dict]) -> bytes:
+    """One JSON object per line, each terminated by a newline"""
+    return b"".join(_row_adapter.dump_json(row) + b"\n" for row in batch)
+
+
+def csv_header() -> bytes:
+    return _csv_lines([CSV_COLUMNS])
+
+
+def encode_csv(batch: Iterable[Dict]) -> bytes:
+    """CSV rows in CSV_COLUMNS order; values are formatted as in the JSON output"""
+    rows = []
+    for row in batch:
+        values = _row_adapter.dump_python(row, mode="json")
+        rows.append([_csv_value(values[column]) for column in CSV_COLUMNS])
+    return _csv_lines(rows)
+
+
+def _csv_value(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _csv_lines(rows) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue().encode()
+
+
+def export_stream(user_id: str, db_session: Session, export_format: str,
+                  batch_size: int = TASK_EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    """Encoded response body chunks; Starlette iterates sync generators in the threadpool"""
+    if export_format == "csv":
+        yield csv_header()
+    encode = encode_csv if export_format == "csv" else encode_ndjson
+    for batch in iter_task_batches(user_id, db_session, batch_size):
+        yield encode(batch)
+
+
+async def aexport_stream(user_id: str, db_session: AsyncSession, export_format: str,
+                         batch_size: int = TASK_EXPORT_BATCH_SIZE) -> AsyncIterator[bytes]:
+    if export_format == "csv":
+        yield csv_header()
+    encode = encode_csv if export_format == "csv" else encode_ndjson
+    async for batch in aiter_task_batches(user_id, db_session, batch_size):
+        yield encode(batch)
@@ -0,0 +1,221 @@
+"""
+Streaming bulk import of tasks from NDJSON or CSV.
+
+The request body is parsed as it arrives: complete lines are cut from each
+chunk and only a partial line (at most TASK_IMPORT_MAX_LINE_BYTES) is
+carried over to the next one. Parsed records are handed to
+TaskService.import_tasks in batches of TASK_IMPORT_BATCH_SIZE, each
+validated and loaded in its own transaction, so memory stays bounded
+however large the upload is. A failed line is reported with its line
+number and never stops the import.
+"""
+import csv
+import json
+from typing import AsyncIterator, List, Optional, Tuple
+
+from sqlmodel import Session
+
+from src.config import settings
+from src.database import run_db
+from src.models.todo_task import TaskImportError, TaskImportResponse
+from src.services.task_service import TaskService
+
+# Records validated and inserted per transaction
+TASK_IMPORT_BATCH_SIZE = settings.task_import_batch_size
+# Longest accepted line (or CSV record); longer ones are reported and skipped
+TASK_IMPORT_MAX_LINE_BYTES = settings.task_import_max_line_bytes
+# Line errors listed in the response; the rest are only counted
+TASK_IMPORT_MAX_ERRORS = settings.task_import_max_errors
+
+# (line number, task fields, parse error); exactly one of the last two is set
+Record = Tuple[int, Optional[dict], Optional[str]]
+
+
+class _LineSplitter:
+    """Cuts a byte stream into numbered lines with a bounded carry-over buffer"""
+
+    def __init__(self, max_line_bytes: int):
+        self.max_line_bytes = max_line_bytes
+        self._buffer = b""
+        self._line = 0
+        # Set while discarding the rest of an overlong line
+        self._overlong = False
+
+    def feed(self, chunk: bytes) -> List[Tuple[int, Optional[bytes]]]:
+        """Complete lines as (line number, content); content is None for an overlong line"""
+        lines = []
+        *complete, self._buffer = (self._buffer + chunk).split(b"\n")
+        for content in complete:
+            self._line += 1
+            if self._overlong:
+                self._overlong = False
+                lines.append((self._line, None))
+            else:
+                lines.append((self._line, None if len(content) > self.max_line_bytes else content))
+        if len(self._buffer) > self.max_line_bytes:
+            self._buffer, self._overlong = b"", True
+        return lines
+
+    def close(self) -> List[Tuple[int, Optional[bytes]]]:
+        if not (self._buffer or self._overlong):
+            return []
+        self._line += 1
+        content, self._buffer = self._buffer, b""
+        return [(self._line, None if self._overlong else content)]
+
+
+def _decode(content: bytes, line: int) -> str:
+    # utf-8-sig drops a byte order mark at the start of the file
+    return content.decode("utf-8-sig" if line == 1 else "utf-8").rstrip("\r")
+
+
+class NdjsonParser:
+    """One JSON object per line; blank lines are skipped"""
+
+    def __init__(self, max_line_bytes: int = TASK_IMPORT_MAX_LINE_BYTES):
+        self._lines = _LineSplitter(max_line_bytes)
+
+    def feed(self, chunk: bytes) -> List[Record]:
+        return [record for record in map(self._parse, self._lines.feed(chunk)) if record]
+
+    def close(self) -> List[Record]:
+        return [record for record in map(self._parse, self._lines.close()) if record]
+
+    def _parse(self, numbered: Tuple[int, Optional[bytes]]) -> Optional[Record]:
+        line, content = numbered
+        if content is None:
+            return line, None, f"line exceeds {self._lines.max_line_bytes} bytes"
+        try:
+            text = _decode(content, line)
+            if not text.strip():
+                return None
+            data = json.loads(text)
+        except UnicodeDecodeError:
+            return line, None, "line is not valid UTF-8"
+        except ValueError as e:
+            return line, None, f"invalid JSON: {e}"
+        if not isinstance(data, dict):
+            return line, None, "expected a JSON object"
+        return line, data, None
+
+
+class CsvParser:
+    """
+    CSV with a header row naming TodoTaskCreate fields; unknown columns are
+    ignored and empty cells take the field's default.
+
+    Quoted fields may span lines: physical lines are joined until the quotes
+    in the record balance, then the record is parsed on its own.
+    """
+
+    def __init__(self, max_line_bytes: int = TASK_IMPORT_MAX_LINE_BYTES):
+        self._lines = _LineSplitter(max_line_bytes)
+        self._header: Optional[List[str]] = None
+        self._pending: List[str] = []
+        self._pending_line = 0
+        self._pending_size = 0
+
+    def feed(self, chunk: bytes) -> List[Record]:
+        return self._parse_lines(self._lines.feed(chunk))
+
+    def close(self) -> List[Record]:
+        records = self._parse_lines(self._lines.close())
+        if self._pending:
+            records.append((self._pending_line, None, "unterminated quoted field"))
+            self._pending = []
+        return records
+
+    def _parse_lines(self, lines: List[Tuple[int, Optional[bytes]]]) -> List[Record]:
+        records = []
+        for line, content in lines:
+            if content is None:
+                if self._pending:
+                    records.append((self._pending_line, None, "unterminated quoted field"))
+                    self._pending = []
+                records.append((line, None, f"line exceeds {self._lines.max_line_bytes} bytes"))
+                continue
+            try:
+                text = _decode(content, line)
+            except UnicodeDecodeError:
+                records.append((line, None, "line is not valid UTF-8"))
+                continue
+
+            if not self._pending:
+                self._pending_line, self._pending_size = line, 0
+            self._pending.append(text)
+            self._pending_size += len(content)
+            if self._pending_size > self._lines.max_line_bytes:
+                records.append((self._pending_line, None, f"record exceeds {self._lines.max_line_bytes} bytes"))
+                self._pending = []
+                continue
+            # An odd number of quotes means a quoted field continues on the next line
+            record_text = "\n".join(self._pending)
+            if record_text.count('"') % 2:
+                continue
+            self._pending = []
+
+            record = self._parse_record(self._pending_line, record_text)
+            if record is not None:
+                records.append(record)
+        return records
+
+    def _parse_record(self, line: int, text: str) -> Optional[Record]:
+        if not text.strip():
+            return None
+        try:
+            values = next(csv.reader([text], strict=True))
+        except csv.Error as e:
+            if self._header is None:
+                raise ValueError(f"Invalid CSV header: {e}")
+            return line, None, f"invalid CSV: {e}"
+
+        if self._header is None:
+            self._header = [name.strip() for name in values]
+            if "title" not in self._header:
+                raise ValueError("CSV header must include a title column")
+            return None
+        if len(values) != len(self._header):
+            return line, None, f"expected {len(self._header)} fields, got {len(values)}"
+        return line, {name: value for name, value in zip(self._header, values) if value != ""}, None
+
+
+PARSERS = {"ndjson": NdjsonParser, "csv": CsvParser}
+
+
+async def import_stream(chunks: AsyncIterator[bytes], import_format: str, owner_id: str,
+                        db_session: Session, batch_size: Optional[int] = None,
+                        max_errors: Optional[int] = None) -> TaskImportResponse:
+    """
+    Parse an upload as it streams in and import it batch by batch.
+
+    batch_size and max_errors default to TASK_IMPORT_BATCH_SIZE and
+    TASK_IMPORT_MAX_ERRORS. Raises ValueError, before anything is imported,
+    for a CSV upload whose header is unusable.
+    """
+    batch_size = batch_size or TASK_IMPORT_BATCH_SIZE
+    max_errors = TASK_IMPORT_MAX_ERRORS if max_errors is None else max_errors
+    parser = PARSERS[import_format]()
+    imported, failed = 0, 0
+    errors: List[TaskImportError] = []
+    pending: List[Record] = []
+
+    async def flush(records: List[Record]) -> None:
+        nonlocal imported, failed
+        count, batch_errors = await run_db(
+            db_session, lambda session: TaskService.import_tasks(records, owner_id, session)
+        )
+        imported += count
+        failed += len(batch_errors)
+        errors.extend(batch_errors[:max(0, max_errors - len(errors))])
+
+    async for chunk in chunks:
+        pending.extend(parser.feed(chunk))
+        while len(pending) >= batch_size:
+            await flush(pending[:batch_size])
+            pending = pending[batch_size:]
+    pending.extend(parser.close())
+    if pending:
+        await flush(pending)
+
+    return TaskImportResponse(imported=imported, failed=failed, errors=errors,
+                              errors_truncated=failed > len(errors))
@@ -0,0 +1,132 @@
+"""
+Cache of encoded GET /tasks/ pages, keyed by the user's task list version.
+
+Every TaskService mutation bumps the owner's version (UserTaskState) in the
+same transaction, so an entry's key changes whenever its content could, and
+nothing ever needs invalidating: a repeat read costs the version lookup the
+endpoint already does for its ETag plus a copy of the cached bytes.
+Entries for old versions are never read again and age out.
+
+Storage is pluggable, as for the /auth/me cache:
+
+- InProcessBackend (default): an LRU bounded by the total size of the
+  cached pages (TASK_LIST_CACHE_MAX_BYTES; 0 disables caching).
+- RedisBackend (TASK_LIST_CACHE_BACKEND=redis): shared by every worker;
+  entries expire after TASK_LIST_CACHE_TTL_SECONDS.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from src.config import settings
+from src.metrics import Counter, Gauge, register_collector
+from src.services.user_cache import REDIS_URL, RedisBackend
+
+TASK_LIST_CACHE_BACKEND = settings.task_list_cache_backend
+TASK_LIST_CACHE_MAX_BYTES = settings.task_list_cache_max_bytes
+TASK_LIST_CACHE_TTL_SECONDS = settings.task_list_cache_ttl_seconds
+
+# Rough per-entry bookkeeping (key, tuple, OrderedDict node) counted against the budget
+ENTRY_OVERHEAD_BYTES = 200
+
+CACHE_HITS = Counter("task_list_cache_hits_total", "Task list pages served from the encoded page cache")
+CACHE_MISSES = Counter("task_list_cache_misses_total", "Task list pages loaded and encoded")
+CACHE_BYTES = Gauge("task_list_cache_bytes", "Bytes held by the in-process task list cache")
+
+
+class InProcessBackend:
+    """LRU bounded by total entry size, local to this worker process"""
+
+    blocking = False
+
+    def __init__(self, max_bytes: int = TASK_LIST_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ex: float) -> None:
+        cost = len(key) + len(value) + ENTRY_OVERHEAD_BYTES
+        # A page bigger than the whole budget would only flush everything else
+        if cost > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(key) + len(previous) + ENTRY_OVERHEAD_BYTES
+            self._entries[key] = value
+            self.size += cost
+            while self.size > self.max_bytes:
+                old_key, old_value = self._entries.popitem(last=False)
+                self.size -= len(old_key) + len(old_value) + ENTRY_OVERHEAD_BYTES
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            value = self._entries.pop(key, None)
+            if value is not None:
+                self.size -= len(key) + len(value) + ENTRY_OVERHEAD_BYTES
+
+
+class TaskListCache:
+    def __init__(self, backend, ttl: float = TASK_LIST_CACHE_TTL_SECONDS):
+        self.backend = backend
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(user_id, version: int, params: tuple) -> str:
+        digest = hashlib.sha256(repr(params).encode()).hexdigest()[:16]
+        return f"tasks:list:{user_id}:{version}:{digest}"
+
+    async def get(self, user_id, version: int, params: tuple) -> Optional[Tuple[bytes, Optional[str]]]:
+        """The encoded page and its next-page cursor, or None on a miss"""
+        if self.backend is None:
+            return None
+        value = await self._call(self.backend.get, self._key(user_id, version, params))
+        if value is None:
+            CACHE_MISSES.inc()
+            return None
+        CACHE_HITS.inc()
+        # "<cursor>\n<body>"; cursors are URL-safe base64, so never contain a newline
+        cursor, _, body = value.partition(b"\n")
+        return body, cursor.decode() or None
+
+    async def set(self, user_id, version: int, params: tuple, body: bytes, next_cursor: Optional[str]) -> None:
+        if self.backend is None:
+            return
+        value = (next_cursor or "").encode() + b"\n" + body
+        await self._call(self.backend.set, self._key(user_id, version, params), value, self.ttl)
+
+    async def _call(self, fn, *args):
+        if self.backend.blocking:
+            return await run_in_threadpool(fn, *args)
+        return fn(*args)
+
+
+def _create_backend():
+    if TASK_LIST_CACHE_BACKEND == "redis":
+        # Optional dependency, only needed for the shared backend
+        import redis
+
+        return RedisBackend(redis.Redis.from_url(REDIS_URL))
+    if TASK_LIST_CACHE_MAX_BYTES <= 0:
+        return None
+    return InProcessBackend()
+
+
+task_list_cache = TaskListCache(_create_backend())
+
+
+@register_collector
+def _collect_cache_size() -> None:
+    if isinstance(task_list_cache.backend, InProcessBackend):
+        CACHE_BYTES.set(task_list_cache.backend.size)
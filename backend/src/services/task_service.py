@@ -1,22 +1,274 @@
 from sqlmodel import Session, select
-from typing import List, Optional
-from src.models.todo_task import TodoTask, TodoTaskCreate, TodoTaskUpdate
+from sqlalchemy import case, column, delete, func, insert, literal_column, table, text, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from pydantic import ValidationError
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+import base64
+import json
+import re
+import time
+import uuid
+from src.config import settings
+from src.database import utcnow
+from src.services.read_routing import mark_written
+from src.services.singleflight import forget_on_commit
+from src.services.task_events import task_events
+from src.models.todo_task import (
+    TodoTask, TodoTaskCreate, TodoTaskRead, TodoTaskUpdate,
+    TaskBatchOperation, TaskBatchResult, TaskImportError, TaskPriorityCounts, TaskSummary,
+    TaskTombstone, UserTaskState,
+)
+
+# Largest number of operations accepted by one POST /tasks/batch request
+TASK_BATCH_MAX_SIZE = settings.task_batch_max_size
+# How long deletions are remembered for the change feed; older cursors must resync
+TASK_TOMBSTONE_RETENTION_DAYS = settings.task_tombstone_retention_days
+
+# Sort orders accepted by get_tasks_page, mapped to the keyset column.
+# A leading "-" means descending; the task id is always the tie-breaker.
+TASK_SORT_COLUMNS = {
+    "created_at": TodoTask.created_at,
+    "updated_at": TodoTask.updated_at,
+    "title": TodoTask.title,
+}
+
+# Priorities with their own UserTaskState counter
+TASK_PRIORITIES = ("low", "medium", "high")
+TASK_COUNTERS = ("task_count", "completed_count") + tuple(f"{priority}_priority_count" for priority in TASK_PRIORITIES)
+
+# Columns selected when a task list is serialized straight from rows (TodoTaskRead's fields)
+TASK_READ_COLUMNS = tuple(getattr(TodoTask, name) for name in TodoTaskRead.model_fields)
+
+def _encode_cursor(sort: str, task: TodoTask) -> str:
+    """Build an opaque cursor pointing just past the given task"""
+    value = getattr(task, sort.lstrip("-"))
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps({"s": sort, "v": value, "id": str(task.id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def _decode_cursor(cursor: str, sort: str):
+    """Decode a cursor produced by _encode_cursor, validating it against the sort order"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if data["s"] != sort:
+            raise ValueError("Cursor does not match the requested sort order")
+        value = data["v"]
+        if sort.lstrip("-") != "title":
+            value = datetime.fromisoformat(value)
+        return value, uuid.UUID(data["id"])
+    except ValueError:
+        raise
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+def _encode_changes_cursor(version: int) -> str:
+    raw = json.dumps({"v": version, "t": int(time.time())}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def _decode_changes_cursor(cursor: str) -> Tuple[int, int]:
+    """Return the (version, issued-at unix time) encoded in a change feed cursor"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return int(data["v"]), int(data["t"])
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+def _encode_search_cursor(query: str, score: float, task_id) -> str:
+    raw = json.dumps({"q": query, "r": score, "id": str(task_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def _decode_search_cursor(cursor: str, query: str) -> Tuple[float, uuid.UUID]:
+    """Return the (score, task id) of the last result of the previous page"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if data["q"] != query:
+            raise ValueError("Cursor does not match the search query")
+        return float(data["r"]), uuid.UUID(data["id"])
+    except ValueError:
+        raise
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+def _search_statement(dialect: str, query: str):
+    """
+    Select TASK_READ_COLUMNS plus a relevance "score" (higher is better) for
+    the tasks matching query, or None when the query has nothing to match.
+    """
+    if dialect == "postgresql":
+        # websearch_to_tsquery accepts any user input ("quoted phrases", -exclusions, or)
+        # Same text search configuration as the generated column (migration 0005)
+        tsquery = func.websearch_to_tsquery(literal_column("'english'::regconfig"), query)
+        search_vector = literal_column("todotask.search_vector")
+        score = func.ts_rank_cd(search_vector, tsquery)
+        return select(*TASK_READ_COLUMNS, score.label("score")).where(search_vector.op("@@")(tsquery))
+
+    # FTS5 query syntax would reject stray quotes and operators, so match
+    # each word of the input as a quoted term
+    terms = re.findall(r"\w+", query)
+    if not terms:
+        return None
+    fts = table("todotask_fts", column("rowid"))
+
+    def matches(column_index: int):
+        # highlight() marks each matched term (after stemming) in one column of this row
+        marked = func.highlight(literal_column("todotask_fts"), column_index, func.char(1), "")
+        return func.coalesce(func.length(marked) - func.length(func.replace(marked, func.char(1), "")), 0)
+
+    # Not bm25: its statistics span every user's rows, so another user's writes
+    # would shift scores between page requests and break the (score, id) cursor.
+    # Title matches weigh 2.5x description matches, close to Postgres' default
+    # A/B weights (1.0 and 0.4); like ts_rank_cd, only the row itself counts.
+    score = 2.5 * matches(0) + matches(1)
+    return (
+        select(*TASK_READ_COLUMNS, score.label("score"))
+        .join_from(TodoTask, fts, fts.c.rowid == literal_column("todotask.rowid"))
+        .where(literal_column("todotask_fts").op("MATCH")(" ".join(f'"{term}"' for term in terms)))
+    )
+
+class ChangeCursorExpired(Exception):
+    """The cursor predates the tombstone retention window; the client must do a full resync"""
+
+def _count_deltas(tasks: Iterable[Tuple[bool, str]], sign: int = 1,
+                  deltas: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """Add sign to each counter that a (completed, priority) pair falls under"""
+    deltas = {} if deltas is None else deltas
+    for completed, priority in tasks:
+        counters = ["task_count"]
+        if completed:
+            counters.append("completed_count")
+        if priority in TASK_PRIORITIES:
+            counters.append(f"{priority}_priority_count")
+        for counter in counters:
+            deltas[counter] = deltas.get(counter, 0) + sign
+    return deltas
+
+def _task_count_changes(task_id, owner_id, new_values: Optional[dict]) -> Dict[str, Any]:
+    """
+    Counter changes for updating one task to new_values (None: deleting it),
+    as scalar subqueries on the task's current row; 0 when there is no such task.
+
+    They are evaluated by _bump_version's upsert once it holds the owner's
+    counters row lock, which every mutation of the owner's tasks takes first,
+    so the row cannot change between this read and the task statement.
+    FOR UPDATE (Postgres) makes the read see the latest committed row.
+    """
+    def flags(completed, priority) -> Dict[str, Any]:
+        """1 for each counter (completed, priority) falls under, as SQL or plain ints"""
+        def flag(value, expected):
+            if isinstance(value, (bool, str)):
+                return int(value == expected)
+            return case((value == expected, 1), else_=0)
+        return {"completed_count": flag(completed, True),
+                **{f"{priority_}_priority_count": flag(priority, priority_) for priority_ in TASK_PRIORITIES}}
+
+    old = flags(TodoTask.completed, TodoTask.priority)
+    if new_values is None:
+        changes = {"task_count": -1, **{counter: -flag for counter, flag in old.items()}}
+    else:
+        new = flags(new_values.get("completed", TodoTask.completed), new_values.get("priority", TodoTask.priority))
+        changed = ({"completed_count"} if "completed" in new_values else set()) | (
+            {f"{priority}_priority_count" for priority in TASK_PRIORITIES} if "priority" in new_values else set()
+        )
+        changes = {counter: new[counter] - old[counter] for counter in changed}
+    return {
+        counter: func.coalesce(
+            select(change).where(TodoTask.id == task_id, TodoTask.owner_id == owner_id)
+            .with_for_update().scalar_subquery(),
+            0,
+        )
+        for counter, change in changes.items()
+    }
+
+def _bump_version(owner_id, db_session: Session, counts: Optional[Dict[str, int]] = None,
+                  changes: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Increment the owner's task list version inside the current transaction.
+
+    A single upsert creates the row on a user's first mutation. It also takes
+    the row lock that orders concurrent mutations of the same user, so it
+    runs before the task statement in every mutation. Counter changes ride
+    along in the same statement: counts known up front (tasks about to be
+    created), and changes computed from existing tasks (_task_count_changes),
+    which are only applied to an existing row, under its lock.
+    """
+    counts = {counter: delta for counter, delta in (counts or {}).items() if delta}
+    changes = changes or {}
+    # Engines for other dialects are refused when built (see database.check_dialect)
+    upsert = postgresql.insert if db_session.get_bind().dialect.name == "postgresql" else sqlite.insert
+    statement = upsert(UserTaskState).values(owner_id=owner_id, version=1, updated_at=utcnow(), **counts)
+    statement = statement.on_conflict_do_update(
+        index_elements=[UserTaskState.owner_id],
+        set_={
+            "version": UserTaskState.version + 1,
+            "updated_at": statement.excluded.updated_at,
+            **{counter: getattr(UserTaskState, counter) + counts.get(counter, 0) + changes.get(counter, 0)
+               for counter in counts.keys() | changes.keys()},
+        },
+    ).returning(UserTaskState.version)
+    version = db_session.execute(statement).scalar_one()
+    # Pin the owner's reads to the primary for a while once this commits, and
+    # stop later list reads from joining one that started before the write
+    mark_written(db_session, owner_id)
+    forget_on_commit(db_session, owner_id)
+    return version
+
+def _apply_count_deltas(owner_id, deltas: Dict[str, int], db_session: Session) -> None:
+    """Adjust the owner's counters after the task statements; _bump_version has locked the row"""
+    changes = {counter: getattr(UserTaskState, counter) + delta for counter, delta in deltas.items() if delta}
+    if changes:
+        db_session.execute(
+            update(UserTaskState)
+            .where(UserTaskState.owner_id == owner_id)
+            .values(**changes)
+            .execution_options(synchronize_session=False)
+        )
+
+def _validation_message(error: ValidationError) -> str:
+    """One-line summary of a ValidationError: "field: message" for each error"""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'record'}: {detail['msg']}" for detail in error.errors()
+    )
+
+def _copy_tasks(db_session: Session, rows: List[dict]) -> None:
+    """Load rows with COPY FROM STDIN on the session's own connection (psycopg 3 only)"""
+    columns = list(rows[0])
+    driver_connection = db_session.connection().connection.driver_connection
+    with driver_connection.cursor() as cursor:
+        with cursor.copy(f"COPY {TodoTask.__tablename__} ({', '.join(columns)}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row([row[column] for column in columns])
 
 class TaskService:
     @staticmethod
     def create_task(task_create: TodoTaskCreate, owner_id: str, db_session: Session) -> TodoTask:
         """Create a new task for the specified user"""
-        db_task = TodoTask(
+        now = datetime.now(timezone.utc)
+        version = _bump_version(owner_id, db_session,
+                                _count_deltas([(task_create.completed, task_create.priority)]))
+
+        # INSERT ... RETURNING hands back the stored row in the same round trip
+        statement = insert(TodoTask).values(
+            id=uuid.uuid4(),
             title=task_create.title,
             description=task_create.description,
             completed=task_create.completed,
             priority=task_create.priority,
-            owner_id=owner_id
-        )
+            owner_id=owner_id,
+            created_at=now,
+            updated_at=now,
+            version=version,
+        ).returning(TodoTask)
+        db_task = db_session.execute(statement).scalars().one()
+        task_events.publish(db_session, owner_id, version, changed=[db_task])
 
-        db_session.add(db_task)
+        # Detach before commit so the returned row is not expired and re-selected
+        db_session.expunge(db_task)
         db_session.commit()
-        db_session.refresh(db_task)
 
         return db_task
 
@@ -27,6 +279,113 @@ class TaskService:
         tasks = db_session.exec(statement).all()
         return tasks
 
+    @staticmethod
+    def get_tasks_page(user_id: str, db_session: Session, limit: int = 100,
+                       cursor: Optional[str] = None, completed: Optional[bool] = None,
+                       priority: Optional[str] = None,
+                       sort: str = "created_at", as_rows: bool = False) -> Tuple[List, Optional[str]]:
+        """
+        Get one page of a user's tasks using keyset pagination.
+
+        Pages are addressed by an opaque cursor encoding the (sort value, id) of
+        the last row returned, so every page is a bounded index range scan no
+        matter how deep it is. Returns the tasks and the cursor for the next
+        page, or None when there are no more rows.
+
+        With as_rows, only TASK_READ_COLUMNS are selected and each task is a
+        TodoTaskRow dict, skipping ORM object construction and identity-map
+        bookkeeping for callers that only serialize the page.
+        """
+        if sort.lstrip("-") not in TASK_SORT_COLUMNS:
+            raise ValueError(f"Unsupported sort order: {sort}")
+        descending = sort.startswith("-")
+        column = TASK_SORT_COLUMNS[sort.lstrip("-")]
+
+        statement = select(*TASK_READ_COLUMNS) if as_rows else select(TodoTask)
+        statement = statement.where(TodoTask.owner_id == user_id)
+        if completed is not None:
+            statement = statement.where(TodoTask.completed == completed)
+        if priority is not None:
+            statement = statement.where(TodoTask.priority == priority)
+
+        if cursor:
+            value, last_id = _decode_cursor(cursor, sort)
+            key = tuple_(column, TodoTask.id)
+            statement = statement.where(key < (value, last_id) if descending else key > (value, last_id))
+
+        if descending:
+            statement = statement.order_by(column.desc(), TodoTask.id.desc())
+        else:
+            statement = statement.order_by(column.asc(), TodoTask.id.asc())
+
+        # Fetch one extra row to learn whether another page exists
+        tasks = db_session.exec(statement.limit(limit + 1)).all()
+        next_cursor = None
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            next_cursor = _encode_cursor(sort, tasks[-1])
+        if as_rows:
+            return [row._asdict() for row in tasks], next_cursor
+        return list(tasks), next_cursor
+
+    @staticmethod
+    def search_tasks(user_id: str, db_session: Session, query: str, limit: int = 20,
+                     cursor: Optional[str] = None) -> Tuple[List[dict], Optional[str]]:
+        """
+        Full-text search over a user's task titles and descriptions.
+
+        Uses the tsvector column and its GIN index on Postgres and the FTS5
+        table on SQLite. Results are TodoTaskRow dicts, best match first
+        (ties broken by id), and are paginated with an opaque cursor over
+        (score, id) like get_tasks_page.
+        """
+        statement = _search_statement(db_session.get_bind().dialect.name, query)
+        if statement is None:
+            return [], None
+        score = statement.selected_columns.score
+        statement = statement.where(TodoTask.owner_id == user_id)
+        if cursor:
+            last_score, last_id = _decode_search_cursor(cursor, query)
+            statement = statement.where(tuple_(score, TodoTask.id) < (last_score, last_id))
+        statement = statement.order_by(score.desc(), TodoTask.id.desc()).limit(limit + 1)
+
+        rows = db_session.execute(statement).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_search_cursor(query, rows[-1].score, rows[-1].id)
+        return [{name: row._mapping[name] for name in TodoTaskRead.model_fields} for row in rows], next_cursor
+
+    @staticmethod
+    def get_task_list_state(user_id: str, db_session: Session) -> Tuple[int, Optional[datetime]]:
+        """Return the (version, last modified time) of a user's task list; (0, None) before any mutation"""
+        state = db_session.get(UserTaskState, uuid.UUID(str(user_id)))
+        if state is None:
+            return 0, None
+        return state.version, state.updated_at
+
+    @staticmethod
+    def get_task_summary(user_id: str, db_session: Session) -> Tuple[int, Optional[datetime], TaskSummary]:
+        """
+        Return the (version, last modified time, summary) of a user's tasks.
+
+        Read from the user's counters row, so the cost does not depend on how
+        many tasks the user has.
+        """
+        state = db_session.get(UserTaskState, uuid.UUID(str(user_id)))
+        counts = {counter: getattr(state, counter) if state else 0 for counter in TASK_COUNTERS}
+        summary = TaskSummary(
+            total=counts["task_count"],
+            open=counts["task_count"] - counts["completed_count"],
+            completed=counts["completed_count"],
+            by_priority=TaskPriorityCounts(**{
+                priority: counts[f"{priority}_priority_count"] for priority in TASK_PRIORITIES
+            }),
+        )
+        if state is None:
+            return 0, None, summary
+        return state.version, state.updated_at, summary
+
     @staticmethod
     def get_task_by_id_and_user(task_id: str, user_id: str, db_session: Session) -> Optional[TodoTask]:
         """Get a specific task that belongs to the specified user"""
@@ -39,39 +398,364 @@ class TaskService:
 
     @staticmethod
     def update_task(task_id: str, user_id: str, task_update: TodoTaskUpdate, db_session: Session) -> Optional[TodoTask]:
-        """Update a task that belongs to the specified user"""
-        statement = select(TodoTask).where(
-            TodoTask.id == task_id,
-            TodoTask.owner_id == user_id
+        """
+        Update a task that belongs to the specified user.
+
+        Issues a single owner-scoped UPDATE ... RETURNING; updated_at is set by
+        the database. When completed or priority change, the owner's counters
+        are adjusted by the version upsert itself. Returns None when no such
+        task exists for the user.
+        """
+        update_data = task_update.model_dump(exclude_unset=True)
+        changes = None
+        if {"completed", "priority"} & update_data.keys():
+            changes = _task_count_changes(task_id, user_id, update_data)
+        version = _bump_version(user_id, db_session, changes=changes)
+        statement = (
+            update(TodoTask)
+            .where(TodoTask.id == task_id, TodoTask.owner_id == user_id)
+            .values(**update_data, updated_at=utcnow(), version=version)
+            .returning(TodoTask)
+            .execution_options(synchronize_session=False)
         )
-        db_task = db_session.exec(statement).first()
+        db_task = db_session.execute(statement).scalars().first()
 
         if not db_task:
+            # Undo the version bump
+            db_session.rollback()
             return None
 
-        # Update the task with provided values
-        update_data = task_update.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_task, field, value)
-
-        db_session.add(db_task)
+        task_events.publish(db_session, user_id, version, changed=[db_task])
+        db_session.expunge(db_task)
         db_session.commit()
-        db_session.refresh(db_task)
 
         return db_task
 
     @staticmethod
     def delete_task(task_id: str, user_id: str, db_session: Session) -> bool:
-        """Delete a task that belongs to the specified user"""
-        statement = select(TodoTask).where(
-            TodoTask.id == task_id,
-            TodoTask.owner_id == user_id
+        """
+        Delete a task that belongs to the specified user with a single DELETE ... RETURNING id.
+
+        A tombstone is written in the same transaction so the change feed can
+        report the deletion; the owner's counters are adjusted by the version upsert.
+        """
+        version = _bump_version(user_id, db_session, changes=_task_count_changes(task_id, user_id, None))
+        statement = (
+            delete(TodoTask)
+            .where(TodoTask.id == task_id, TodoTask.owner_id == user_id)
+            .returning(TodoTask.id)
+            .execution_options(synchronize_session=False)
         )
-        db_task = db_session.exec(statement).first()
+        deleted = db_session.execute(statement).first()
 
-        if not db_task:
+        if deleted is None:
+            db_session.rollback()
+            return False
+
+        db_session.execute(insert(TaskTombstone).values(
+            task_id=deleted.id, owner_id=user_id, version=version, deleted_at=utcnow()
+        ))
+        task_events.publish(db_session, user_id, version, deleted=[deleted.id])
+        db_session.commit()
+        return True
+
+    @staticmethod
+    def apply_batch(operations: List[TaskBatchOperation], owner_id: str,
+                    db_session: Session) -> List[TaskBatchResult]:
+        """
+        Apply a mixed batch of creates, updates and deletes in one transaction.
+
+        Work is done set-based rather than per item: all creates go out as a
+        multi-row INSERT ... RETURNING, updates sharing the same field values
+        become one UPDATE ... WHERE id IN (...) RETURNING, and all deletes one
+        DELETE ... WHERE id IN (...) RETURNING id. Every statement is scoped to
+        owner_id, so ids belonging to other users come back as not_found.
+        Items that fail validation are reported as invalid without aborting
+        the rest of the batch.
+        """
+        if len(operations) > TASK_BATCH_MAX_SIZE:
+            raise ValueError(f"A batch may contain at most {TASK_BATCH_MAX_SIZE} operations")
+
+        results: Dict[int, TaskBatchResult] = {}
+        creates: List[Tuple[int, dict]] = []
+        updates: Dict[tuple, List[Tuple[int, uuid.UUID]]] = {}
+        deletes: List[Tuple[int, uuid.UUID]] = []
+        seen_ids = set()
+        now = datetime.now(timezone.utc)
+
+        for index, operation in enumerate(operations):
+            def invalid(error: str):
+                results[index] = TaskBatchResult(index=index, op=operation.op, status="invalid",
+                                                 id=operation.id, error=error)
+
+            if operation.op != "create":
+                if operation.id is None:
+                    invalid("id is required")
+                    continue
+                if operation.id in seen_ids:
+                    invalid("task id appears more than once in the batch")
+                    continue
+                seen_ids.add(operation.id)
+
+            try:
+                if operation.op == "create":
+                    task_create = TodoTaskCreate.model_validate(operation.data or {})
+                    creates.append((index, dict(
+                        task_create.model_dump(),
+                        id=uuid.uuid4(), owner_id=owner_id, created_at=now, updated_at=now,
+                    )))
+                elif operation.op == "update":
+                    task_update = TodoTaskUpdate.model_validate(operation.data or {})
+                    values = task_update.model_dump(exclude_unset=True)
+                    if not values:
+                        invalid("no fields to update")
+                        continue
+                    updates.setdefault(tuple(sorted(values.items())), []).append((index, operation.id))
+                else:
+                    deletes.append((index, operation.id))
+            except ValidationError as e:
+                invalid(_validation_message(e))
+
+        if not (creates or updates or deletes):
+            return [results[index] for index in range(len(operations))]
+        version = _bump_version(owner_id, db_session, _count_deltas(
+            (values["completed"], values["priority"]) for _, values in creates
+        ))
+        # Counter changes from updates and deletes, applied after the task statements
+        deltas: Dict[str, int] = {}
+        counted_ids = [task_id for values, targets in updates.items()
+                       if {"completed", "priority"} & dict(values).keys() for _, task_id in targets]
+        previous = {}
+        if counted_ids:
+            previous = {row.id: (row.completed, row.priority) for row in db_session.execute(
+                select(TodoTask.id, TodoTask.completed, TodoTask.priority)
+                .where(TodoTask.owner_id == owner_id, TodoTask.id.in_(counted_ids))
+            )}
+
+        if creates:
+            rows = db_session.execute(
+                insert(TodoTask).returning(TodoTask, sort_by_parameter_order=True),
+                [dict(values, version=version) for _, values in creates],
+            ).scalars().all()
+            for (index, _), task in zip(creates, rows):
+                results[index] = TaskBatchResult(index=index, op="create", status="created", id=task.id,
+                                                 task=TodoTaskRead.model_validate(task))
+
+        for values, targets in updates.items():
+            rows = db_session.execute(
+                update(TodoTask)
+                .where(TodoTask.owner_id == owner_id, TodoTask.id.in_([task_id for _, task_id in targets]))
+                .values(**dict(values), updated_at=utcnow(), version=version)
+                .returning(TodoTask)
+                .execution_options(synchronize_session=False)
+            ).scalars().all()
+            updated = {task.id: task for task in rows}
+            for task in rows:
+                if task.id in previous:
+                    _count_deltas([previous[task.id]], -1, deltas)
+                    _count_deltas([(task.completed, task.priority)], 1, deltas)
+            for index, task_id in targets:
+                task = updated.get(task_id)
+                results[index] = TaskBatchResult(
+                    index=index, op="update", status="updated" if task else "not_found", id=task_id,
+                    task=TodoTaskRead.model_validate(task) if task else None,
+                )
+
+        if deletes:
+            deleted_rows = db_session.execute(
+                delete(TodoTask)
+                .where(TodoTask.owner_id == owner_id, TodoTask.id.in_([task_id for _, task_id in deletes]))
+                .returning(TodoTask.id, TodoTask.completed, TodoTask.priority)
+                .execution_options(synchronize_session=False)
+            ).all()
+            _count_deltas(((row.completed, row.priority) for row in deleted_rows), -1, deltas)
+            deleted = {row.id for row in deleted_rows}
+            for index, task_id in deletes:
+                results[index] = TaskBatchResult(index=index, op="delete", id=task_id,
+                                                 status="deleted" if task_id in deleted else "not_found")
+            if deleted:
+                # Database clock, as in delete_task, so prune_tombstones ages both alike
+                db_session.execute(insert(TaskTombstone).values(deleted_at=utcnow()), [
+                    {"task_id": task_id, "owner_id": owner_id, "version": version} for task_id in deleted
+                ])
+
+        _apply_count_deltas(owner_id, deltas, db_session)
+        task_events.publish(
+            db_session, owner_id, version,
+            changed=[r.task for r in results.values() if r.task is not None],
+            deleted=[r.id for r in results.values() if r.status == "deleted"],
+        )
+        db_session.commit()
+        return [results[index] for index in range(len(operations))]
+
+    @staticmethod
+    def import_tasks(records: List[Tuple[int, Optional[dict], Optional[str]]], owner_id: str,
+                     db_session: Session) -> Tuple[int, List[TaskImportError]]:
+        """
+        Validate and insert one batch of parsed import records in one transaction.
+
+        Each record is (line, data, parse error). Records that failed to parse
+        or do not validate as TodoTaskCreate are returned as errors; the rest
+        are loaded with COPY on Postgres (psycopg 3) and an executemany INSERT
+        elsewhere, under a single version bump. Subscribers get one "resync"
+        event rather than every imported task. Returns the number of tasks
+        inserted and the errors.
+        """
+        errors: List[TaskImportError] = []
+        rows: List[dict] = []
+        now = datetime.now(timezone.utc)
+        for line, data, parse_error in records:
+            if parse_error is not None:
+                errors.append(TaskImportError(line=line, error=parse_error))
+                continue
+            try:
+                task_create = TodoTaskCreate.model_validate(data)
+            except ValidationError as e:
+                errors.append(TaskImportError(line=line, error=_validation_message(e)))
+                continue
+            rows.append(dict(task_create.model_dump(), id=uuid.uuid4(), owner_id=owner_id,
+                             created_at=now, updated_at=now))
+
+        if not rows:
+            return 0, errors
+        version = _bump_version(owner_id, db_session,
+                                _count_deltas((row["completed"], row["priority"]) for row in rows))
+        for row in rows:
+            row["version"] = version
+
+        bind = db_session.get_bind()
+        if bind.dialect.name == "postgresql" and bind.dialect.driver == "psycopg":
+            _copy_tasks(db_session, rows)
+        else:
+            db_session.execute(insert(TodoTask), rows)
+
+        task_events.publish_resync(db_session, owner_id, version)
+        db_session.commit()
+        return len(rows), errors
+
+    @staticmethod
+    def get_changes(user_id: str, db_session: Session, since: Optional[str] = None,
+                    limit: int = 500) -> Tuple[List[TodoTask], List[uuid.UUID], str, bool]:
+        """
+        Return what changed in a user's task list since a change feed cursor.
+
+        Every mutation stamps the rows it touches (or the tombstones it writes)
+        with the owner's new list version, and the version row lock serializes a
+        user's mutations, so "version > cursor" is an exact delta. The version
+        is read first and results are bounded by it, so nothing committed
+        concurrently can be skipped. A page never splits one version (a batch
+        shares a single version), so it may exceed limit by up to one batch.
+
+        Without a cursor the feed starts from the full current task list.
+        Returns (changed tasks, deleted task ids, next cursor, has_more).
+        """
+        if since:
+            after, issued_at = _decode_changes_cursor(since)
+            if issued_at < time.time() - TASK_TOMBSTONE_RETENTION_DAYS * 86400:
+                raise ChangeCursorExpired("Cursor is older than the deletion history; resync required")
+        else:
+            # Tasks created before the change feed existed carry version 0
+            after = -1
+
+        current, _ = TaskService.get_task_list_state(user_id, db_session)
+        if after >= current:
+            return [], [], _encode_changes_cursor(max(after, current)), False
+
+        def window(model, upper: int, lower: int = after, row_limit: Optional[int] = limit + 1):
+            statement = (
+                select(model)
+                .where(model.owner_id == user_id, model.version > lower, model.version <= upper)
+                .order_by(model.version)
+            )
+            if row_limit is not None:
+                statement = statement.limit(row_limit)
+            return list(db_session.exec(statement).all())
+
+        tasks = window(TodoTask, current)
+        # A fresh client has no local copies, so deletions are irrelevant to it
+        tombstones = window(TaskTombstone, current) if since else []
+
+        merged = sorted([t.version for t in tasks] + [t.version for t in tombstones])
+        if len(merged) <= limit and len(tasks) <= limit and len(tombstones) <= limit:
+            through, has_more = current, False
+        elif merged[limit] > merged[0]:
+            # Stop before the first version that did not fit; everything below it was fetched
+            through, has_more = merged[limit] - 1, True
+        else:
+            # A single version (one large batch) fills the page: return all of it
+            through, has_more = merged[0], True
+            tasks = window(TodoTask, through, row_limit=None)
+            tombstones = window(TaskTombstone, through, row_limit=None) if since else []
+
+        changed = [t for t in tasks if t.version <= through]
+        deleted = [t.task_id for t in tombstones if t.version <= through]
+        return changed, deleted, _encode_changes_cursor(through), has_more
+
+    @staticmethod
+    def repair_task_counts(db_session: Session, owner_id: Optional[str] = None) -> int:
+        """
+        Recompute task counters from the tasks and correct any that drifted.
+
+        Each owner is checked in its own short transaction holding the counters
+        row lock, so concurrent mutations are neither blocked for long nor
+        lost. Owners with tasks but no counters row get one (at version 0).
+        Returns the number of owners whose counters were corrected.
+        """
+        if owner_id is not None:
+            owners = [uuid.UUID(str(owner_id))]
+        else:
+            owners = db_session.execute(
+                select(TodoTask.owner_id).union(select(UserTaskState.owner_id))
+            ).scalars().all()
+
+        repaired = 0
+        for owner in owners:
+            state = db_session.exec(
+                select(UserTaskState).where(UserTaskState.owner_id == owner).with_for_update()
+            ).first()
+            grouped = db_session.execute(
+                select(TodoTask.completed, TodoTask.priority, func.count())
+                .where(TodoTask.owner_id == owner)
+                .group_by(TodoTask.completed, TodoTask.priority)
+            ).all()
+            actual = dict.fromkeys(TASK_COUNTERS, 0)
+            for completed, priority, count in grouped:
+                _count_deltas([(completed, priority)], count, actual)
+
+            stored = {counter: getattr(state, counter) for counter in TASK_COUNTERS} if state else None
+            if stored == actual or (state is None and not actual["task_count"]):
+                db_session.rollback()
+                continue
+            if state is None:
+                db_session.add(UserTaskState(owner_id=owner, **actual))
+            else:
+                for counter, value in actual.items():
+                    setattr(state, counter, value)
+            db_session.commit()
+            repaired += 1
+        return repaired
+
+    @staticmethod
+    def rebuild_search_index(db_session: Session) -> bool:
+        """
+        Re-index every task in SQLite's FTS5 table; returns False on Postgres,
+        whose generated search column cannot drift.
+
+        The index points at todotask's implicit rowid, which VACUUM may
+        renumber (the table has no INTEGER PRIMARY KEY), so run this after
+        every VACUUM.
+        """
+        if db_session.get_bind().dialect.name != "sqlite":
             return False
+        db_session.execute(text("INSERT INTO todotask_fts(todotask_fts) VALUES ('rebuild')"))
+        db_session.commit()
+        return True
 
-        db_session.delete(db_task)
+    @staticmethod
+    def prune_tombstones(db_session: Session,
+                         retention_days: int = TASK_TOMBSTONE_RETENTION_DAYS) -> int:
+        """Delete tombstones older than the retention window; returns the number removed"""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+        result = db_session.execute(delete(TaskTombstone).where(TaskTombstone.deleted_at < cutoff))
         db_session.commit()
-        return True
\ No newline at end of file
+        return result.rowcount
@@ -0,0 +1,125 @@
+"""
+In-process cache of verified JWT payloads.
+
+A polling client presents the same bearer token on every request, and
+re-parsing plus HMAC-verifying it each time is pure overhead. Verified
+payloads are kept in a bounded LRU keyed by a SHA-256 digest of the token
+(the raw token is never stored). An entry never outlives the token's own
+exp claim, and tokens without one are not cached.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set
+
+from src.config import settings
+from src.metrics import Counter, Gauge, register_collector
+
+JWT_CACHE_SIZE = settings.jwt_cache_size
+JWT_CACHE_TTL_SECONDS = settings.jwt_cache_ttl_seconds
+
+CACHE_HITS = Counter("jwt_cache_hits_total", "Bearer tokens served from the verified-JWT cache")
+CACHE_MISSES = Counter("jwt_cache_misses_total", "Bearer tokens that had to be verified")
+CACHE_ENTRIES = Gauge("jwt_cache_entries", "Entries in the verified-JWT cache")
+CACHE_HIT_RATIO = Gauge("jwt_cache_hit_ratio", "Share of bearer tokens served from the cache since startup")
+
+
+def _digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+class TokenCache:
+    def __init__(self, maxsize: int = JWT_CACHE_SIZE, ttl: float = JWT_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # digest -> (payload, expires_at as a unix timestamp)
+        self._entries: "OrderedDict[bytes, tuple]" = OrderedDict()
+        # user_id -> digests, so all of a user's tokens can be revoked at once
+        self._by_user: Dict[str, Set[bytes]] = {}
+
+    def get(self, token: str) -> Optional[dict]:
+        """Return the cached payload for a token, or None on a miss or expiry"""
+        if self.maxsize <= 0:
+            return None
+        key = _digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.time():
+                self._entries.move_to_end(key)
+                CACHE_HITS.inc()
+                return entry[0]
+            if entry is not None:
+                self._remove(key)
+        CACHE_MISSES.inc()
+        return None
+
+    def put(self, token: str, payload: dict) -> None:
+        """Cache a verified payload until min(now + ttl, exp)"""
+        exp = payload.get("exp")
+        if self.maxsize <= 0 or not isinstance(exp, (int, float)):
+            return
+        expires_at = min(time.time() + self.ttl, float(exp))
+        if expires_at <= time.time():
+            return
+
+        key = _digest(token)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (payload, expires_at)
+            user_id = payload.get("user_id")
+            if user_id is not None:
+                self._by_user.setdefault(str(user_id), set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+            CACHE_ENTRIES.set(len(self._entries))
+
+    def invalidate(self, token: str) -> None:
+        """Evict a single token, e.g. on logout"""
+        with self._lock:
+            self._remove(_digest(token))
+            CACHE_ENTRIES.set(len(self._entries))
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Revocation hook: evict every cached token belonging to a user"""
+        with self._lock:
+            for key in list(self._by_user.get(str(user_id), ())):
+                self._remove(key)
+            CACHE_ENTRIES.set(len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+            CACHE_ENTRIES.set(0)
+
+    def stats(self) -> dict:
+        hits, misses = CACHE_HITS.value(), CACHE_MISSES.value()
+        total = hits + misses
+        return {
+            "entries": len(self._entries),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+        }
+
+    def _remove(self, key: bytes) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        user_id = entry[0].get("user_id")
+        keys = self._by_user.get(str(user_id))
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_user[str(user_id)]
+
+
+token_cache = TokenCache()
+
+
+@register_collector
+def _collect_hit_ratio() -> None:
+    CACHE_HIT_RATIO.set(token_cache.stats()["hit_rate"])
@@ -0,0 +1,193 @@
+"""
+Read-through cache of encoded /auth/me user profiles.
+
+The frontend calls /auth/me on every page mount and route guard, so the
+encoded UserResponse JSON is cached per user id and served without
+touching the User table. Storage is pluggable:
+
+- InProcessBackend (default): a bounded LRU with per-entry TTL.
+- RedisBackend: any client exposing redis-py's get/set(ex=, nx=)/delete, so a
+  fake can stand in for it in tests.
+
+Entries are invalidated after any commit that updates or deletes a User
+row (see the ORM hooks at the bottom of this module).
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session as SASession
+from starlette.concurrency import run_in_threadpool
+
+from src.config import settings
+from src.metrics import Counter
+from src.models.user import User
+
+logger = logging.getLogger(__name__)
+
+USER_CACHE_BACKEND = settings.user_cache_backend
+USER_CACHE_TTL_SECONDS = settings.user_cache_ttl_seconds
+USER_CACHE_SIZE = settings.user_cache_size
+REDIS_URL = settings.redis_url
+
+# Invalidation replaces the entry with this empty marker instead of deleting it,
+# and readers only cache into an empty slot, so a profile loaded before the
+# commit cannot replace it; a read slower than the hold could still do so.
+INVALIDATED = b""
+INVALIDATION_HOLD_SECONDS = 10
+
+CACHE_HITS = Counter("user_cache_hits_total", "/auth/me profiles served from the cache")
+CACHE_MISSES = Counter("user_cache_misses_total", "/auth/me profiles loaded from the database")
+
+
+class InProcessBackend:
+    """Bounded LRU with per-entry TTL, local to this worker process"""
+
+    blocking = False
+
+    def __init__(self, maxsize: int = USER_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: str, value: bytes, ex: float, nx: bool = False) -> None:
+        with self._lock:
+            if nx:
+                entry = self._entries.get(key)
+                if entry is not None and entry[1] > time.monotonic():
+                    return
+            self._entries[key] = (value, time.monotonic() + ex)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class RedisBackend:
+    """Shared cache over a redis-py compatible client"""
+
+    # Network round trips are kept off the event loop
+    blocking = True
+
+    def __init__(self, client):
+        self.client = client
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes, ex: float, nx: bool = False) -> None:
+        # Redis expiry is in whole seconds
+        self.client.set(key, value, ex=max(1, int(ex)), nx=nx)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(key)
+
+
+class UserProfileCache:
+    def __init__(self, backend, ttl: float = USER_CACHE_TTL_SECONDS):
+        self.backend = backend
+        self.ttl = ttl
+        # key -> invalidation still running in the threadpool (blocking backends only)
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def _key(user_id) -> str:
+        return f"user:profile:{user_id}"
+
+    async def get(self, user_id) -> Optional[bytes]:
+        """Return the encoded profile for a user, or None on a miss"""
+        key = self._key(user_id)
+        await self._settle(key)
+        value = await self._call(self.backend.get, key)
+        if value == INVALIDATED:
+            value = None
+        (CACHE_HITS if value is not None else CACHE_MISSES).inc()
+        return value
+
+    async def set(self, user_id, value: bytes) -> None:
+        """Cache a profile unless the entry is present or was just invalidated"""
+        await self._call(self.backend.set, self._key(user_id), value, self.ttl, True)
+
+    def invalidate(self, user_id) -> None:
+        key = self._key(user_id)
+        args = (key, INVALIDATED, INVALIDATION_HOLD_SECONDS)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or not self.backend.blocking:
+            self.backend.set(*args)
+            return
+        # Committed on the event loop (async database mode): don't block it on
+        # the network; reads of this key in this process wait for it instead
+        future = self._pending[key] = loop.run_in_executor(None, self.backend.set, *args)
+        future.add_done_callback(lambda f: self._invalidated(key, f))
+
+    def _invalidated(self, key: str, future: asyncio.Future) -> None:
+        if self._pending.get(key) is future:
+            del self._pending[key]
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"Profile cache invalidation of {key} failed: {future.exception()}")
+
+    async def _settle(self, key: str) -> None:
+        pending = self._pending.get(key)
+        if pending is not None and pending.get_loop() is asyncio.get_running_loop():
+            await asyncio.wait([pending])
+
+    async def _call(self, fn, *args):
+        if self.backend.blocking:
+            return await run_in_threadpool(fn, *args)
+        return fn(*args)
+
+
+def _create_backend():
+    if USER_CACHE_BACKEND == "redis":
+        # Optional dependency, only needed for the shared backend
+        import redis
+
+        return RedisBackend(redis.Redis.from_url(REDIS_URL))
+    return InProcessBackend()
+
+
+user_cache = UserProfileCache(_create_backend())
+
+
+# --- Invalidation ---
+# User rows changed in a session are collected at flush time and invalidated
+# once the transaction commits (see INVALIDATED for reads racing the commit).
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _track_changed_user(mapper, connection, target) -> None:
+    session = SASession.object_session(target)
+    if session is not None:
+        session.info.setdefault("changed_user_ids", set()).add(target.id)
+
+
+@event.listens_for(SASession, "after_commit")
+def _invalidate_changed_users(session) -> None:
+    for user_id in session.info.pop("changed_user_ids", ()):
+        user_cache.invalidate(user_id)
+
+
+@event.listens_for(SASession, "after_rollback")
+def _discard_changed_users(session) -> None:
+    session.info.pop("changed_user_ids", None)
@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine
+
+from src.models.user import User
+from src.models.todo_task import TodoTask
+
+
+@pytest.fixture
+def sqlite_engine():
+    """In-memory SQLite engine with the application schema"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(sqlite_engine):
+    with Session(sqlite_engine) as session:
+        yield session
+
+
+@pytest.fixture
+def user(db_session):
+    db_user = User(email="owner@example.com", hashed_password="not-a-real-hash")
+    db_session.add(db_user)
+    db_session.commit()
+    db_session.refresh(db_user)
+    return db_user
+
+
+@pytest.fixture
+def client(sqlite_engine):
+    """TestClient whose requests use the in-memory SQLite database"""
+    from fastapi.testclient import TestClient
+    from src.database import get_db_session, get_replica_db_session
+    from src.main import app
+
+    def override_get_db_session():
+        with Session(sqlite_engine) as session:
+            yield session
+
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    app.dependency_overrides[get_replica_db_session] = override_get_db_session
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db_session, None)
+    app.dependency_overrides.pop(get_replica_db_session, None)
+
+
+@pytest.fixture
+def auth_headers(user):
+    from src.services.auth_service import AuthService
+
+    token = AuthService.create_access_token(data={"sub": user.email, "user_id": str(user.id)})
+    return {"Authorization": f"Bearer {token}"}
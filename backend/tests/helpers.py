@@ -0,0 +1,42 @@
+"""Helpers shared by several test modules"""
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+
+@contextmanager
+def count_statements(engine):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+class FakeRedis:
+    """Implements the subset of the redis-py client used by RedisBackend"""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        value, expires_at = self.store.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.store[key]
+            return None
+        return value
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and self.get(key) is not None:
+            return None
+        self.store[key] = (value, time.monotonic() + ex if ex else None)
+        return True
+
+    def delete(self, key):
+        self.store.pop(key, None)
@@ -0,0 +1,82 @@
+"""
+The API with DB_ASYNC_MODE on, against SQLite through aiosqlite.
+
+The mode is fixed when src.database is imported, so the API runs in a new
+interpreter (see _exercise_api) instead of this test process.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+async def _exercise_api() -> None:
+    """Drive the main endpoints in-process; run with DB_ASYNC_MODE=true"""
+    import json
+
+    import httpx
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.database import engine, get_db_session
+    from src.main import app
+
+    assert get_db_session.__name__ == "get_async_session"
+    async with app.router.lifespan_context(app):
+        # The sync engine only served the startup schema check
+        assert engine.pool.checkedin() == 0
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            registered = await client.post("/auth/register", json={"email": "async@example.com",
+                                                                   "password": "password123"})
+            assert registered.status_code == 200, registered.text
+            login = await client.post("/auth/login", json={"email": "async@example.com", "password": "password123"})
+            assert login.status_code == 200, login.text
+            headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+            assert (await client.get("/auth/me", headers=headers)).json()["email"] == "async@example.com"
+
+            created = await client.post("/tasks/", json={"title": "Async one"}, headers=headers)
+            assert created.status_code == 200, created.text
+            task_id = created.json()["id"]
+            batch = await client.post("/tasks/batch", headers=headers, json={"operations": [
+                {"op": "create", "data": {"title": f"Async batch {i}"}} for i in range(3)
+            ] + [{"op": "update", "id": task_id, "data": {"completed": True}}]})
+            assert [r["status"] for r in batch.json()["results"]] == ["created"] * 3 + ["updated"]
+
+            listed = await client.get("/tasks/", params={"limit": 2}, headers=headers)
+            assert len(listed.json()) == 2 and listed.headers["X-Next-Cursor"]
+            assert (await client.get("/tasks/summary", headers=headers)).json()["completed"] == 1
+            search = await client.get("/tasks/search", params={"q": "batch"}, headers=headers)
+            assert len(search.json()) == 3
+
+            # Server-side cursor through AsyncSession.stream (aexport_stream / aiter_task_batches)
+            export = await client.get("/tasks/export", headers=headers)
+            assert export.status_code == 200, export.text
+            exported = [json.loads(line) for line in export.text.splitlines()]
+            assert [task["title"] for task in exported][0] == "Async one" and len(exported) == 4
+
+            imported = await client.post("/tasks/import", content=export.content, headers=headers)
+            assert imported.json()["imported"] == 4, imported.text
+            cursor = (await client.get("/tasks/changes", headers=headers)).json()["cursor"]
+            assert (await client.delete(f"/tasks/{task_id}", headers=headers)).status_code == 200
+            changes = await client.get("/tasks/changes", params={"since": cursor}, headers=headers)
+            assert changes.json()["deleted"] == [task_id], changes.text
+
+        # The dependency really hands out AsyncSessions
+        session_dependency = get_db_session()
+        assert isinstance(await session_dependency.__anext__(), AsyncSession)
+        await session_dependency.aclose()
+
+
+def test_api_in_async_mode(tmp_path):
+    pytest.importorskip("aiosqlite")
+    env = dict(os.environ, DB_ASYNC_MODE="true", DATABASE_URL=f"sqlite:///{tmp_path / 'async.db'}",
+               PASSWORD_HASH_WORKERS="0", TASK_EVENTS_BACKEND="local", USER_CACHE_BACKEND="memory")
+    env.pop("DATABASE_REPLICA_URL", None)
+    snippet = "import asyncio; from tests.integration.test_async_mode import _exercise_api; asyncio.run(_exercise_api())"
+    result = subprocess.run([sys.executable, "-c", snippet], cwd=BACKEND_DIR, env=env,
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr[-4000:]
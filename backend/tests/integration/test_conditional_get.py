@@ -0,0 +1,56 @@
+from sqlalchemy import event
+
+
+def test_list_etag_roundtrip_and_invalidation(client, auth_headers, sqlite_engine):
+    client.post("/tasks/", json={"title": "One"}, headers=auth_headers)
+    first = client.get("/tasks/", headers=auth_headers)
+    etag = first.headers["ETag"]
+
+    statements = []
+    event.listen(sqlite_engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    cached = client.get("/tasks/", headers={**auth_headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+    # Only the version row was read
+    assert len(statements) == 1 and "todotask" not in statements[0]
+
+    client.post("/tasks/", json={"title": "Two"}, headers=auth_headers)
+    fresh = client.get("/tasks/", headers={**auth_headers, "If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert len(fresh.json()) == 2
+    assert fresh.headers["ETag"] != etag
+
+
+def test_list_etag_depends_on_query(client, auth_headers):
+    client.post("/tasks/", json={"title": "One"}, headers=auth_headers)
+    all_tasks = client.get("/tasks/", headers=auth_headers).headers["ETag"]
+    completed = client.get("/tasks/?completed=true", headers=auth_headers)
+    assert completed.headers["ETag"] != all_tasks
+
+    response = client.get("/tasks/?completed=true", headers={**auth_headers, "If-None-Match": all_tasks})
+    assert response.status_code == 200
+
+
+def test_list_if_modified_since(client, auth_headers):
+    client.post("/tasks/", json={"title": "One"}, headers=auth_headers)
+    last_modified = client.get("/tasks/", headers=auth_headers).headers["Last-Modified"]
+
+    response = client.get("/tasks/", headers={**auth_headers, "If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+    stale = client.get("/tasks/", headers={**auth_headers, "If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"})
+    assert stale.status_code == 200
+
+
+def test_task_detail_etag(client, auth_headers):
+    task_id = client.post("/tasks/", json={"title": "One"}, headers=auth_headers).json()["id"]
+    etag = client.get(f"/tasks/{task_id}", headers=auth_headers).headers["ETag"]
+
+    assert client.get(f"/tasks/{task_id}", headers={**auth_headers, "If-None-Match": etag}).status_code == 304
+
+    client.put(f"/tasks/{task_id}", json={"title": "Renamed"}, headers=auth_headers)
+    response = client.get(f"/tasks/{task_id}", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["title"] == "Renamed"
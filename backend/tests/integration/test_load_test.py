@@ -0,0 +1,42 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.load_test import compare, percentile
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def test_percentile_is_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([], 50) == 0.0
+
+
+def test_compare_flags_p95_regressions():
+    def report(p95):
+        return {"results": {"endpoints": {"list": {"p95_ms": p95}}}}
+
+    assert compare(report(11.0), report(10.0), threshold=0.2) == []
+    assert compare(report(13.0), report(10.0), threshold=0.2)[0]["endpoint"] == "list"
+
+
+def test_load_test_smoke(tmp_path):
+    output = tmp_path / "report.json"
+    env = dict(os.environ, DATABASE_URL="", PASSWORD_HASH_WORKERS="0")
+    subprocess.run(
+        [sys.executable, "-m", "benchmarks.load_test", "--users", "2", "--tasks", "5",
+         "--requests", "40", "--concurrency", "4", "--output", str(output)],
+        cwd=BACKEND_DIR, env=env, check=True, capture_output=True, timeout=120,
+    )
+
+    report = json.loads(output.read_text())
+    assert report["results"]["total_requests"] == 40
+    assert report["results"]["total_errors"] == 0
+    for stats in report["results"]["endpoints"].values():
+        assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"]
+        assert stats["sql_statements_per_request"] >= 0
@@ -0,0 +1,94 @@
+from sqlalchemy import event, inspect
+from sqlmodel import SQLModel, Session, create_engine
+
+from src.database import run_migrations
+from src.models.user import User
+from src.models.todo_task import TodoTask
+from src.services.task_service import TaskService
+
+
+def _migrated_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'plans.db'}")
+    run_migrations(bind=engine)
+    return engine
+
+
+def _seed(session):
+    user = User(email="plans@example.com", hashed_password="x")
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+    for i in range(50):
+        session.add(TodoTask(title=f"Task {i}", owner_id=user.id, completed=i % 2 == 0))
+    session.commit()
+    return user
+
+
+def _capture_selects(engine, fn):
+    """Run fn and return every SELECT it sent to the database"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+def _plan(engine, statement, parameters):
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+    return [row[-1] for row in rows]
+
+
+def test_migrations_create_task_indexes(tmp_path):
+    engine = _migrated_engine(tmp_path)
+    names = {ix["name"] for ix in inspect(engine).get_indexes("todotask")}
+    assert {"ix_todotask_owner_created_id", "ix_todotask_owner_completed_priority"} <= names
+
+
+def test_migrations_upgrade_legacy_create_all_schema(tmp_path):
+    """A database bootstrapped with create_all (no indexes, no alembic_version) is upgraded in place"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    tables = SQLModel.metadata.tables
+    SQLModel.metadata.create_all(engine, tables=[tables["user"], tables["todotask"]])
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_todotask_owner_created_id")
+        conn.exec_driver_sql("DROP INDEX ix_todotask_owner_completed_priority")
+        conn.exec_driver_sql("DROP INDEX ix_todotask_owner_version")
+        conn.exec_driver_sql("ALTER TABLE todotask DROP COLUMN version")
+
+    run_migrations(bind=engine)
+
+    names = {ix["name"] for ix in inspect(engine).get_indexes("todotask")}
+    assert "ix_todotask_owner_created_id" in names
+
+
+def test_owner_scoped_task_queries_use_indexes(tmp_path):
+    """Fails if a task query plan falls back to a full table scan of todotask"""
+    engine = _migrated_engine(tmp_path)
+    with Session(engine) as session:
+        user = _seed(session)
+        first_page, cursor = TaskService.get_tasks_page(user.id, session, limit=10)
+
+        calls = [
+            lambda: TaskService.get_tasks_page(user.id, session, limit=10),
+            lambda: TaskService.get_tasks_page(user.id, session, limit=10, cursor=cursor),
+            lambda: TaskService.get_tasks_page(user.id, session, completed=True, priority="medium"),
+            lambda: TaskService.get_task_by_id_and_user(first_page[0].id, user.id, session),
+            lambda: TaskService.get_tasks_by_user(user.id, session),
+            lambda: TaskService.get_changes(user.id, session, limit=10),
+            lambda: TaskService.search_tasks(user.id, session, "task", limit=10),
+        ]
+        for call in calls:
+            for statement, parameters in _capture_selects(engine, call):
+                if "todotask" not in statement:
+                    continue
+                plan = _plan(engine, statement, parameters)
+                # (a MATCH against the todotask_fts virtual table is not a scan of todotask)
+                assert not any(step.split()[:2] == ["SCAN", "todotask"] for step in plan), plan
@@ -0,0 +1,120 @@
+"""Replica routing, with two SQLite files standing in for a primary and a lagging replica"""
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import insert
+from sqlmodel import Session, create_engine
+
+from src.database import get_db_session, get_replica_db_session, run_migrations
+from src.models.todo_task import TodoTask
+from src.models.user import User
+from src.services.auth_service import AuthService
+from src.services.read_routing import RecentWriters
+
+
+@pytest.fixture
+def databases(tmp_path):
+    engines = {}
+    for name in ("primary", "replica"):
+        engines[name] = create_engine(f"sqlite:///{tmp_path / name}.db", connect_args={"check_same_thread": False})
+        run_migrations(bind=engines[name])
+    yield engines
+    for engine in engines.values():
+        engine.dispose()
+
+
+@pytest.fixture
+def writers(monkeypatch):
+    tracker = RecentWriters(window=60)
+    monkeypatch.setattr("src.services.read_routing.recent_writers", tracker)
+    monkeypatch.setattr("src.middleware.db_routing.recent_writers", tracker)
+    return tracker
+
+
+@pytest.fixture
+def replica_client(databases, writers):
+    from fastapi.testclient import TestClient
+    from src.main import app
+
+    def session_on(engine):
+        def dependency():
+            with Session(engine) as session:
+                yield session
+        return dependency
+
+    app.dependency_overrides[get_db_session] = session_on(databases["primary"])
+    app.dependency_overrides[get_replica_db_session] = session_on(databases["replica"])
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db_session, None)
+    app.dependency_overrides.pop(get_replica_db_session, None)
+
+
+def _add(engine, model, **values):
+    with Session(engine) as session:
+        session.execute(insert(model).values(**values))
+        session.commit()
+
+
+def _user_row():
+    now = datetime.now(timezone.utc)
+    return {"id": uuid.uuid4(), "email": f"{uuid.uuid4().hex[:8]}@example.com", "hashed_password": "x",
+            "is_active": True, "created_at": now, "updated_at": now}
+
+
+@pytest.fixture
+def user(databases):
+    row = _user_row()
+    _add(databases["primary"], User, **row)
+    _add(databases["replica"], User, **row)
+    return User(**row)
+
+
+@pytest.fixture
+def headers(user):
+    token = AuthService.create_access_token({"sub": user.email, "user_id": str(user.id)})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _task(user, title):
+    now = datetime.now(timezone.utc)
+    return {"id": uuid.uuid4(), "owner_id": user.id, "title": title, "completed": False,
+            "priority": "medium", "created_at": now, "updated_at": now}
+
+
+def test_reads_go_to_the_replica(replica_client, databases, user, headers):
+    _add(databases["replica"], TodoTask, **_task(user, "Only on replica"))
+    titles = [t["title"] for t in replica_client.get("/tasks/", headers=headers).json()]
+    assert titles == ["Only on replica"]
+
+
+def test_user_reads_their_own_writes(replica_client, databases, user, headers, writers):
+    created = replica_client.post("/tasks/", json={"title": "Just written"}, headers=headers).json()
+    assert writers.wrote_recently(user.id)
+
+    # The replica has not caught up, but this user's reads are pinned to the primary
+    titles = [t["title"] for t in replica_client.get("/tasks/", headers=headers).json()]
+    assert titles == ["Just written"]
+
+    # Once the window passes, reads return to the (still lagging) replica
+    writers.window = 0
+    assert replica_client.get("/tasks/", headers=headers).json() == []
+    # A single-row lookup missing on the replica falls back to the primary
+    response = replica_client.get(f"/tasks/{created['id']}", headers=headers)
+    assert response.status_code == 200
+
+
+def test_failed_write_does_not_pin_reads(replica_client, user, headers, writers):
+    response = replica_client.put(f"/tasks/{uuid.uuid4()}", json={"title": "x"}, headers=headers)
+    assert response.status_code == 404
+    assert not writers.wrote_recently(user.id)
+
+
+def test_profile_missing_on_replica_falls_back(replica_client, databases):
+    fresh = User(**_user_row())
+    _add(databases["primary"], User, **fresh.model_dump())
+    token = AuthService.create_access_token({"sub": fresh.email, "user_id": str(fresh.id)})
+
+    response = replica_client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert response.json()["email"] == fresh.email
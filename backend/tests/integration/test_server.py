@@ -0,0 +1,114 @@
+import os
+import re
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for(predicate, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return
+        time.sleep(0.1)
+    raise AssertionError("timed out")
+
+
+def _healthy(port) -> bool:
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/health/live", timeout=2) as response:
+            return response.status == 200
+    except OSError:
+        return False
+
+
+def test_supervisor_respawns_and_rolls_workers(tmp_path):
+    port = _free_port()
+    log_path = tmp_path / "server.log"
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{tmp_path / 'server.db'}", PASSWORD_HASH_WORKERS="0",
+               WORKER_GRACEFUL_TIMEOUT="5", SERVER_ALLOW_PROCESS_LOCAL_STATE="true")
+    with open(log_path, "w") as log:
+        supervisor = subprocess.Popen(
+            [sys.executable, "-m", "src.server", "--workers", "2", "--host", "127.0.0.1", "--port", str(port)],
+            cwd=BACKEND_DIR, env=env, stdout=log, stderr=subprocess.STDOUT,
+        )
+
+    def started():
+        return [int(pid) for pid in re.findall(r"Started worker (\d+)", log_path.read_text())]
+
+    def alive(pid) -> bool:
+        try:
+            os.kill(pid, 0)
+            return True
+        except ProcessLookupError:
+            return False
+
+    try:
+        _wait_for(lambda: _healthy(port) and len(started()) == 2)
+        first, second = started()
+        # Migrations ran once, in the supervisor, before the workers started
+        assert log_path.read_text().count("Applying database migrations") == 1
+
+        # A crashed worker is replaced
+        os.kill(first, signal.SIGKILL)
+        _wait_for(lambda: len(started()) == 3)
+        _wait_for(lambda: _healthy(port))
+
+        # Rolling restart: every worker replaced, with requests served throughout
+        failures, done = [], threading.Event()
+
+        def poll():
+            while not done.is_set():
+                if not _healthy(port):
+                    failures.append(time.monotonic())
+                time.sleep(0.02)
+
+        poller = threading.Thread(target=poll)
+        poller.start()
+        before = set(started())
+        supervisor.send_signal(signal.SIGHUP)
+        _wait_for(lambda: "Rolling restart complete" in log_path.read_text())
+        done.set()
+        poller.join()
+        assert failures == []
+        assert len(set(started()) - before) == 2
+        assert not any(alive(pid) for pid in before)
+
+        supervisor.send_signal(signal.SIGTERM)
+        assert supervisor.wait(timeout=30) == 0
+        assert not any(alive(pid) for pid in started())
+    finally:
+        if supervisor.poll() is None:
+            supervisor.kill()
+            supervisor.wait()
+
+
+def test_several_workers_need_shared_backends(tmp_path):
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{tmp_path / 'server.db'}",
+               TASK_EVENTS_BACKEND="local", USER_CACHE_BACKEND="memory", SERVER_ALLOW_PROCESS_LOCAL_STATE="false")
+    env.pop("WEB_CONCURRENCY", None)
+    result = subprocess.run(
+        [sys.executable, "-m", "src.server", "--workers", "2", "--port", str(_free_port())],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 2
+    assert "TASK_EVENTS_BACKEND=local, USER_CACHE_BACKEND=memory" in result.stderr
+
+    # Without --workers, process-local backends mean a single worker
+    snippet = "from src.server import default_workers; print(default_workers())"
+    result = subprocess.run([sys.executable, "-c", snippet], cwd=BACKEND_DIR, env=env,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "1"
@@ -0,0 +1,77 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import exc as sa_exc
+from sqlmodel import create_engine
+
+from src import database
+from src.config import Settings
+from src.database import ALEMBIC_INI, create_tables, head_revision, schema_is_current
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def test_settings_read_env_file_and_environment(tmp_path, monkeypatch):
+    env_file = tmp_path / ".env"
+    env_file.write_text("JWT_ALGORITHM=HS512\nTASK_BATCH_MAX_SIZE=50\nDB_ASYNC_MODE=yes\n")
+    monkeypatch.setenv("TASK_BATCH_MAX_SIZE", "7")
+
+    settings = Settings(_env_file=env_file)
+    assert settings.jwt_algorithm == "HS512"
+    # The environment wins over the file, as with load_dotenv()
+    assert settings.task_batch_max_size == 7
+    assert settings.db_async_mode is True
+
+
+def test_invalid_setting_fails_at_startup(monkeypatch):
+    monkeypatch.setenv("TASK_IMPORT_BATCH_SIZE", "lots")
+    with pytest.raises(ValueError):
+        Settings(_env_file=None)
+
+
+def test_head_revision_matches_alembic():
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    alembic_cfg = Config(ALEMBIC_INI)
+    alembic_cfg.set_main_option("script_location", str(Path(ALEMBIC_INI).parent / "migrations"))
+    assert head_revision() == ScriptDirectory.from_config(alembic_cfg).get_current_head()
+
+
+def test_current_schema_skips_alembic(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'startup.db'}")
+    assert not schema_is_current(engine)
+
+    create_tables(engine)
+    assert schema_is_current(engine)
+
+    def fail(bind=None):
+        raise AssertionError("migrations should not run on a current schema")
+
+    monkeypatch.setattr(database, "run_migrations", fail)
+    create_tables(engine)
+
+
+def test_startup_retries_then_gives_up(monkeypatch):
+    calls, sleeps = [], []
+
+    def unreachable(bind=None):
+        calls.append(bind)
+        raise sa_exc.OperationalError("SELECT 1", {}, Exception("connection refused"))
+
+    monkeypatch.setattr(database, "run_migrations", unreachable)
+    monkeypatch.setattr(database, "schema_is_current", lambda bind=None: False)
+    monkeypatch.setattr(database.time, "sleep", sleeps.append)
+    with pytest.raises(sa_exc.OperationalError):
+        create_tables(attempts=3)
+    assert len(calls) == 3 and sleeps == [1, 2]
+
+
+def test_app_import_defers_auth_libraries():
+    code = "import sys, src.main; print(sorted(m for m in ('jose', 'passlib') if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True,
+                            check=True, timeout=60, env=dict(os.environ, DATABASE_URL="sqlite://"))
+    assert result.stdout.strip() == "[]"
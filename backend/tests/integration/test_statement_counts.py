@@ -0,0 +1,92 @@
+"""
+Guards the number of SQL statements each task endpoint sends to the database.
+
+Mutations are the per-user version bump plus a single owner-scoped
+INSERT/UPDATE/DELETE ... RETURNING statement; a regression back to
+SELECT-then-write or commit-then-refresh shows up here as an extra statement.
+Changes to the per-user counters (GET /tasks/summary) ride along with the
+version bump.
+"""
+import time
+import uuid
+
+import pytest
+
+from tests.helpers import count_statements
+
+
+@pytest.fixture
+def task_id(client, auth_headers):
+    return client.post("/tasks/", json={"title": "Counted"}, headers=auth_headers).json()["id"]
+
+
+def test_create_is_one_task_statement(client, auth_headers, sqlite_engine):
+    with count_statements(sqlite_engine) as statements:
+        response = client.post("/tasks/", json={"title": "New"}, headers=auth_headers)
+    assert response.status_code == 200
+    assert len(statements) == 2
+
+
+def test_update_is_one_task_statement_and_bumps_updated_at(client, auth_headers, sqlite_engine, task_id):
+    before = client.get(f"/tasks/{task_id}", headers=auth_headers).json()
+    time.sleep(0.01)  # SQLite's clock has millisecond resolution
+
+    with count_statements(sqlite_engine) as statements:
+        response = client.put(f"/tasks/{task_id}", json={"title": "Renamed"}, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert len(statements) == 2
+    assert statements[1].lstrip().upper().startswith("UPDATE")
+    assert response.json()["title"] == "Renamed"
+    assert response.json()["priority"] == "medium"
+    assert response.json()["updated_at"] > before["updated_at"]
+
+
+def test_counted_field_update_is_one_task_statement(client, auth_headers, sqlite_engine, task_id):
+    # Completing a task moves it between counters; the version upsert adjusts them
+    with count_statements(sqlite_engine) as statements:
+        response = client.put(f"/tasks/{task_id}", json={"completed": True, "priority": "high"},
+                              headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json()["completed"] is True
+    assert len(statements) == 2
+    assert "usertaskstate" in statements[0].lower()
+    assert statements[1].lstrip().upper().startswith("UPDATE")
+    summary = client.get("/tasks/summary", headers=auth_headers).json()
+    assert summary["completed"] == 1 and summary["by_priority"] == {"low": 0, "medium": 0, "high": 1}
+
+
+def test_delete_is_one_task_statement(client, auth_headers, sqlite_engine, task_id):
+    # Plus the change feed tombstone; the version upsert adjusts the counters
+    with count_statements(sqlite_engine) as statements:
+        response = client.delete(f"/tasks/{task_id}", headers=auth_headers)
+    assert response.status_code == 200
+    assert len(statements) == 3
+    assert "tasktombstone" in statements[2].lower()
+    assert client.get("/tasks/summary", headers=auth_headers).json()["total"] == 0
+
+
+@pytest.mark.parametrize("method", ["put", "delete"])
+def test_missing_task_is_404_in_one_task_statement(client, auth_headers, sqlite_engine, method):
+    kwargs = {"json": {"title": "x"}} if method == "put" else {}
+    with count_statements(sqlite_engine) as statements:
+        response = getattr(client, method)(f"/tasks/{uuid.uuid4()}", headers=auth_headers, **kwargs)
+    assert response.status_code == 404
+    assert len(statements) == 2
+
+
+def test_reads_are_one_task_statement(client, auth_headers, sqlite_engine, task_id):
+    # The list also reads the version row for its ETag and cache key
+    with count_statements(sqlite_engine) as statements:
+        assert client.get("/tasks/", headers=auth_headers).status_code == 200
+    assert len(statements) == 2
+
+    # Unchanged since: served from the encoded page cache
+    with count_statements(sqlite_engine) as statements:
+        assert client.get("/tasks/", headers=auth_headers).status_code == 200
+    assert len(statements) == 1
+
+    with count_statements(sqlite_engine) as statements:
+        assert client.get(f"/tasks/{task_id}", headers=auth_headers).status_code == 200
+    assert len(statements) == 1
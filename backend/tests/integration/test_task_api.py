@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from src.database import run_db
+from src.models.todo_task import TodoTaskRead
+from src.models.user import User
+from src.services.task_service import TaskService
+
+
+def test_task_crud_round_trip(client, auth_headers):
+    created = client.post("/tasks/", json={"title": "Write tests", "priority": "high"},
+                          headers=auth_headers)
+    assert created.status_code == 200
+    task_id = created.json()["id"]
+
+    fetched = client.get(f"/tasks/{task_id}", headers=auth_headers)
+    assert fetched.json()["title"] == "Write tests"
+
+    updated = client.put(f"/tasks/{task_id}", json={"completed": True}, headers=auth_headers)
+    assert updated.json()["completed"] is True
+
+    deleted = client.delete(f"/tasks/{task_id}", headers=auth_headers)
+    assert deleted.status_code == 200
+    assert client.get(f"/tasks/{task_id}", headers=auth_headers).status_code == 404
+
+
+def test_task_list_is_paginated(client, auth_headers):
+    for i in range(5):
+        client.post("/tasks/", json={"title": f"Task {i}"}, headers=auth_headers)
+
+    first = client.get("/tasks/?limit=3", headers=auth_headers)
+    assert len(first.json()) == 3
+    cursor = first.headers["X-Next-Cursor"]
+
+    second = client.get("/tasks/", params={"limit": 3, "cursor": cursor}, headers=auth_headers)
+    assert len(second.json()) == 2
+    assert "X-Next-Cursor" not in second.headers
+    assert not {t["id"] for t in first.json()} & {t["id"] for t in second.json()}
+
+    assert client.get("/tasks/?cursor=garbage", headers=auth_headers).status_code == 400
+
+
+def test_task_list_json_matches_response_model(client, auth_headers, db_session, user):
+    """The column-row fast path serializes exactly as response_model=List[TodoTaskRead] would"""
+    client.post("/tasks/", json={"title": "With description", "description": "dé\"tails"}, headers=auth_headers)
+    client.post("/tasks/", json={"title": "Done", "completed": True, "priority": "low"}, headers=auth_headers)
+
+    response = client.get("/tasks/", headers=auth_headers)
+    assert response.headers["content-type"] == "application/json"
+
+    tasks, _ = TaskService.get_tasks_page(str(user.id), db_session)
+    expected = [TodoTaskRead.model_validate(task).model_dump(mode="json") for task in tasks]
+    assert json.loads(response.content) == expected
+    assert [list(task) for task in response.json()] == [list(TodoTaskRead.model_fields)] * 2
+
+
+@pytest.mark.asyncio
+async def test_run_db_offloads_sync_sessions(db_session, user):
+    """With a sync Session, run_db calls the function with that session in the threadpool"""
+    email = await run_db(db_session, lambda session: session.get(User, user.id).email)
+    assert email == user.email
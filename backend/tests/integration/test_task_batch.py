@@ -0,0 +1,91 @@
+import uuid
+from unittest.mock import patch
+
+from tests.helpers import count_statements
+
+
+def test_mixed_batch_reports_per_item_results(client, auth_headers):
+    existing = [client.post("/tasks/", json={"title": f"Old {i}"}, headers=auth_headers).json()
+                for i in range(3)]
+
+    response = client.post("/tasks/batch", headers=auth_headers, json={"operations": [
+        {"op": "create", "data": {"title": "New", "priority": "high"}},
+        {"op": "update", "id": existing[0]["id"], "data": {"completed": True}},
+        {"op": "update", "id": existing[1]["id"], "data": {"completed": True}},
+        {"op": "delete", "id": existing[2]["id"]},
+        {"op": "delete", "id": str(uuid.uuid4())},
+        {"op": "create", "data": {"title": ""}},
+    ]})
+
+    assert response.status_code == 200
+    statuses = [r["status"] for r in response.json()["results"]]
+    assert statuses == ["created", "updated", "updated", "deleted", "not_found", "invalid"]
+    assert response.json()["results"][0]["task"]["priority"] == "high"
+
+    tasks = {t["title"]: t for t in client.get("/tasks/", headers=auth_headers).json()}
+    assert set(tasks) == {"Old 0", "Old 1", "New"}
+    assert tasks["Old 0"]["completed"] and tasks["Old 1"]["completed"]
+
+
+def test_batch_is_set_based(client, auth_headers, sqlite_engine):
+    """500 creates cost a bounded number of statements, not one per task"""
+    with count_statements(sqlite_engine) as statements:
+        response = client.post("/tasks/batch", headers=auth_headers, json={
+            "operations": [{"op": "create", "data": {"title": f"Task {i}"}} for i in range(500)]
+        })
+
+    assert response.status_code == 200
+    inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+    assert len(inserts) <= 2
+
+
+def test_batch_size_limit(client, auth_headers):
+    with patch("src.api.task_router.TASK_BATCH_MAX_SIZE", 2):
+        response = client.post("/tasks/batch", headers=auth_headers, json={
+            "operations": [{"op": "create", "data": {"title": "x"}}] * 3
+        })
+    assert response.status_code == 413
+
+
+def test_batch_cannot_touch_other_users_tasks(client, auth_headers, db_session):
+    from src.models.user import User
+    from src.models.todo_task import TodoTask
+
+    other = User(email="other@example.com", hashed_password="x")
+    db_session.add(other)
+    db_session.commit()
+    foreign = TodoTask(title="Not yours", owner_id=other.id)
+    db_session.add(foreign)
+    db_session.commit()
+
+    response = client.post("/tasks/batch", headers=auth_headers, json={"operations": [
+        {"op": "update", "id": str(foreign.id), "data": {"title": "Mine now"}},
+        {"op": "delete", "id": str(foreign.id)},
+    ]})
+
+    assert [r["status"] for r in response.json()["results"]] == ["not_found", "invalid"]
+    db_session.refresh(foreign)
+    assert foreign.title == "Not yours"
+
+
+def test_null_for_required_field_is_invalid_item(client, auth_headers):
+    task = client.post("/tasks/", json={"title": "Keep"}, headers=auth_headers).json()
+
+    response = client.post("/tasks/batch", headers=auth_headers, json={"operations": [
+        {"op": "update", "id": task["id"], "data": {"title": None}},
+        {"op": "update", "id": str(uuid.uuid4()), "data": {"priority": None, "description": None}},
+        {"op": "create", "data": {"title": "Still created"}},
+    ]})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["status"] for r in results] == ["invalid", "invalid", "created"]
+    # Same "field: message" format as import errors
+    assert results[0]["error"] == "title: Value error, May be omitted but not null"
+    assert results[1]["error"] == "priority: Value error, May be omitted but not null"
+    titles = {t["title"] for t in client.get("/tasks/", headers=auth_headers).json()}
+    assert titles == {"Keep", "Still created"}
+
+    # A single update rejects it the same way instead of failing at the database
+    response = client.put(f"/tasks/{task['id']}", json={"completed": None}, headers=auth_headers)
+    assert response.status_code == 422
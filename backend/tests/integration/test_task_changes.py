@@ -0,0 +1,102 @@
+import base64
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from sqlalchemy import select
+
+from src.database import utcnow
+from src.models.todo_task import TaskBatchOperation, TaskTombstone, TodoTaskCreate
+from src.services.task_service import TaskService
+
+
+def _changes(client, headers, since=None, limit=None):
+    params = {}
+    if since is not None:
+        params["since"] = since
+    if limit is not None:
+        params["limit"] = limit
+    response = client.get("/tasks/changes", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_initial_sync_then_deltas(client, auth_headers):
+    a = client.post("/tasks/", json={"title": "A"}, headers=auth_headers).json()
+    b = client.post("/tasks/", json={"title": "B"}, headers=auth_headers).json()
+
+    initial = _changes(client, auth_headers)
+    assert {t["title"] for t in initial["changed"]} == {"A", "B"}
+    assert initial["deleted"] == [] and initial["has_more"] is False
+
+    # Nothing happened since
+    empty = _changes(client, auth_headers, since=initial["cursor"])
+    assert empty["changed"] == [] and empty["deleted"] == []
+
+    client.put(f"/tasks/{a['id']}", json={"completed": True}, headers=auth_headers)
+    client.delete(f"/tasks/{b['id']}", headers=auth_headers)
+    c = client.post("/tasks/", json={"title": "C"}, headers=auth_headers).json()
+
+    delta = _changes(client, auth_headers, since=initial["cursor"])
+    assert {t["id"] for t in delta["changed"]} == {a["id"], c["id"]}
+    assert delta["deleted"] == [b["id"]]
+    assert _changes(client, auth_headers, since=delta["cursor"])["changed"] == []
+
+
+def test_pages_never_split_a_version(client, auth_headers):
+    for i in range(3):
+        client.post("/tasks/", json={"title": f"Single {i}"}, headers=auth_headers)
+    client.post("/tasks/batch", headers=auth_headers, json={
+        "operations": [{"op": "create", "data": {"title": f"Batch {i}"}} for i in range(4)]
+    })
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        page = _changes(client, auth_headers, since=cursor, limit=2)
+        seen.extend(t["title"] for t in page["changed"])
+        cursor, pages = page["cursor"], pages + 1
+        if not page["has_more"]:
+            break
+
+    assert sorted(seen) == sorted([f"Single {i}" for i in range(3)] + [f"Batch {i}" for i in range(4)])
+    assert len(seen) == 7
+    assert pages >= 3
+
+
+def test_invalid_and_expired_cursors(client, auth_headers):
+    response = client.get("/tasks/changes", params={"since": "garbage"}, headers=auth_headers)
+    assert response.status_code == 400
+
+    old = json.dumps({"v": 0, "t": int(time.time()) - 400 * 86400}).encode()
+    stale = base64.urlsafe_b64encode(old).decode().rstrip("=")
+    response = client.get("/tasks/changes", params={"since": stale}, headers=auth_headers)
+    assert response.status_code == 410
+
+
+def test_prune_tombstones(db_session, user):
+    now = datetime.now(timezone.utc)
+    db_session.add(TaskTombstone(task_id=user.id, owner_id=user.id, version=1,
+                                 deleted_at=now - timedelta(days=60)))
+    db_session.commit()
+
+    assert TaskService.prune_tombstones(db_session, retention_days=30) == 1
+    assert TaskService.prune_tombstones(db_session, retention_days=30) == 0
+
+
+def test_tombstones_use_the_database_clock(db_session, user):
+    class SkewedClock(datetime):
+        """An application clock far behind the database's"""
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2000, 1, 1, tzinfo=tz)
+
+    tasks = [TaskService.create_task(TodoTaskCreate(title=f"Gone {i}"), user.id, db_session) for i in range(2)]
+    with patch("src.services.task_service.datetime", SkewedClock):
+        TaskService.delete_task(tasks[0].id, user.id, db_session)
+        TaskService.apply_batch([TaskBatchOperation(op="delete", id=tasks[1].id)], user.id, db_session)
+
+    database_now = db_session.execute(select(utcnow())).scalar_one()
+    deleted_at = db_session.execute(select(TaskTombstone.deleted_at)).scalars().all()
+    assert len(deleted_at) == 2
+    assert all(abs(database_now - stamp) < timedelta(minutes=1) for stamp in deleted_at)
@@ -0,0 +1,71 @@
+import csv
+import io
+import json
+
+from src.models.todo_task import TodoTaskRead
+from src.models.user import User
+from src.services.auth_service import AuthService
+from src.services.task_export import CSV_COLUMNS, iter_task_batches
+from src.services.task_service import TaskService
+
+
+def _create(client, headers, count):
+    client.post("/tasks/batch", headers=headers, json={"operations": [
+        {"op": "create", "data": {"title": f"Task {i}", "description": "a, \"quoted\"\nline" if i == 0 else None,
+                                  "completed": i % 2 == 0}}
+        for i in range(count)
+    ]})
+
+
+def test_ndjson_export_matches_task_list(client, auth_headers, db_session, user):
+    _create(client, auth_headers, 5)
+
+    response = client.get("/tasks/export", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="tasks.ndjson"'
+
+    lines = response.content.decode().splitlines()
+    tasks, _ = TaskService.get_tasks_page(str(user.id), db_session)
+    assert [json.loads(line) for line in lines] == [
+        TodoTaskRead.model_validate(task).model_dump(mode="json") for task in tasks
+    ]
+
+
+def test_csv_export(client, auth_headers):
+    _create(client, auth_headers, 3)
+
+    response = client.get("/tasks/export", params={"format": "csv"}, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+
+    # Tasks created in one batch share created_at, so order by title
+    rows = sorted(csv.DictReader(io.StringIO(response.text)), key=lambda row: row["title"])
+    assert list(rows[0]) == CSV_COLUMNS
+    assert [row["title"] for row in rows] == ["Task 0", "Task 1", "Task 2"]
+    assert rows[0]["description"] == "a, \"quoted\"\nline"
+    assert rows[1]["description"] == ""
+    assert [row["completed"] for row in rows] == ["true", "false", "true"]
+
+
+def test_export_is_scoped_to_the_user(client, auth_headers, db_session):
+    other = User(email="other@example.com", hashed_password="not-a-real-hash")
+    db_session.add(other)
+    db_session.commit()
+    token = AuthService.create_access_token(data={"sub": other.email, "user_id": str(other.id)})
+
+    _create(client, auth_headers, 2)
+    response = client.get("/tasks/export", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert response.content == b""
+
+
+def test_export_rejects_unknown_format(client, auth_headers):
+    assert client.get("/tasks/export", params={"format": "xml"}, headers=auth_headers).status_code == 422
+
+
+def test_export_reads_in_batches(client, auth_headers, db_session, user):
+    _create(client, auth_headers, 5)
+    batches = list(iter_task_batches(str(user.id), db_session, batch_size=2))
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert sorted(task["title"] for batch in batches for task in batch) == [f"Task {i}" for i in range(5)]
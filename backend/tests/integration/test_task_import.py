@@ -0,0 +1,119 @@
+import json
+
+from sqlmodel import select
+
+from src.models.todo_task import TodoTask
+from src.services.task_import import CsvParser, NdjsonParser
+
+
+def _titles(db_session, user):
+    db_session.expire_all()
+    return sorted(db_session.exec(select(TodoTask.title).where(TodoTask.owner_id == user.id)).all())
+
+
+def _ndjson(*records) -> bytes:
+    return b"".join((json.dumps(record) if isinstance(record, dict) else record).encode() + b"\n"
+                    for record in records)
+
+
+def test_ndjson_import_reports_bad_lines(client, auth_headers, db_session, user):
+    body = _ndjson(
+        {"title": "First", "priority": "high"},
+        "not json",
+        {"title": ""},
+        "",
+        {"title": "Second", "completed": True, "id": "ignored", "created_at": "ignored"},
+        "[1, 2]",
+    )
+    response = client.post("/tasks/import", content=body, headers=auth_headers)
+    assert response.status_code == 200, response.text
+    result = response.json()
+
+    assert result["imported"] == 2 and result["failed"] == 3
+    assert [error["line"] for error in result["errors"]] == [2, 3, 6]
+    assert result["errors"][0]["error"].startswith("invalid JSON")
+    assert result["errors"][1]["error"].startswith("title:")
+    assert result["errors"][2]["error"] == "expected a JSON object"
+    assert result["errors_truncated"] is False
+    assert _titles(db_session, user) == ["First", "Second"]
+
+
+def test_import_commits_in_batches(client, auth_headers, db_session, user, monkeypatch):
+    import src.services.task_import as task_import
+
+    monkeypatch.setattr(task_import, "TASK_IMPORT_BATCH_SIZE", 3)
+    calls = []
+    original = task_import.TaskService.import_tasks
+    monkeypatch.setattr(task_import.TaskService, "import_tasks",
+                        staticmethod(lambda records, *args: calls.append(len(records)) or original(records, *args)))
+
+    etag = client.get("/tasks/", headers=auth_headers).headers["ETag"]
+    body = _ndjson(*({"title": f"Task {i}"} for i in range(7)))
+    # Chunks split lines at arbitrary points
+    response = client.post("/tasks/import", content=(body[i:i + 5] for i in range(0, len(body), 5)),
+                           headers=auth_headers)
+    assert response.json()["imported"] == 7
+    assert calls == [3, 3, 1]
+    assert _titles(db_session, user) == [f"Task {i}" for i in range(7)]
+
+    # Each batch bumped the task list version
+    assert client.get("/tasks/", headers={**auth_headers, "If-None-Match": etag}).status_code == 200
+
+
+def test_csv_import_round_trips_an_export(client, auth_headers, db_session, user):
+    client.post("/tasks/", json={"title": "Multi", "description": "line one\nline \"two\""}, headers=auth_headers)
+    client.post("/tasks/", json={"title": "Plain", "completed": True, "priority": "low"}, headers=auth_headers)
+    exported = client.get("/tasks/export", params={"format": "csv"}, headers=auth_headers).content
+
+    response = client.post("/tasks/import", params={"format": "csv"}, content=exported, headers=auth_headers)
+    assert response.json() == {"imported": 2, "failed": 0, "errors": [], "errors_truncated": False}
+
+    tasks = db_session.exec(select(TodoTask).where(TodoTask.owner_id == user.id)).all()
+    assert len(tasks) == 4
+    assert sum(task.description == "line one\nline \"two\"" for task in tasks) == 2
+    assert sum(task.completed and task.priority == "low" for task in tasks) == 2
+
+
+def test_csv_import_errors(client, auth_headers):
+    body = b"title,priority,completed\nGood,high,true\nNot a bool,low,maybe\nToo,many,fields,here\n"
+    result = client.post("/tasks/import", params={"format": "csv"}, content=body, headers=auth_headers).json()
+    assert result["imported"] == 1
+    assert [(error["line"], error["error"].split(":")[0]) for error in result["errors"]] == [
+        (3, "completed"), (4, "expected 3 fields, got 4"),
+    ]
+
+    missing_title = client.post("/tasks/import", params={"format": "csv"}, content=b"name\nx\n",
+                                headers=auth_headers)
+    assert missing_title.status_code == 400
+
+
+def test_error_list_is_capped(client, auth_headers, monkeypatch):
+    import src.services.task_import as task_import
+
+    monkeypatch.setattr(task_import, "TASK_IMPORT_MAX_ERRORS", 2)
+    body = _ndjson(*(["{"] * 5))
+    result = client.post("/tasks/import", content=body, headers=auth_headers).json()
+    assert result["failed"] == 5
+    assert len(result["errors"]) == 2 and result["errors_truncated"] is True
+
+
+def test_ndjson_parser_bounds_overlong_lines():
+    parser = NdjsonParser(max_line_bytes=20)
+    records = parser.feed(b'{"title": "ok"}\n' + b"x" * 50)
+    records += parser.feed(b"y" * 50 + b'\n{"title": "after"}')
+    records += parser.close()
+    assert [(line, data, error is not None) for line, data, error in records] == [
+        (1, {"title": "ok"}, False), (2, None, True), (3, {"title": "after"}, False),
+    ]
+
+
+def test_csv_parser_joins_quoted_newlines_across_chunks():
+    parser = CsvParser()
+    records = parser.feed(b'\xef\xbb\xbftitle,description\r\nA,"one\r\n')
+    records += parser.feed(b'two"\r\nB,\r\nC,"never closed\n')
+    records += parser.close()
+    assert records == [
+        (2, {"title": "A", "description": "one\ntwo"}, None),
+        (4, {"title": "B"}, None),
+        (5, None, "unterminated quoted field"),
+    ]
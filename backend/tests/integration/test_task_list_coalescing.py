@@ -0,0 +1,89 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.database import get_db_session, get_replica_db_session
+from src.main import app
+from src.models.user import User
+from src.services.auth_service import AuthService
+from src.services.task_service import TaskService
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    # Separate connections per session, so reads and writes really overlap
+    engine = create_engine(f"sqlite:///{tmp_path / 'coalescing.db'}", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def async_client(file_engine):
+    def override_get_db_session():
+        with Session(file_engine) as session:
+            yield session
+
+    app.dependency_overrides[get_db_session] = override_get_db_session
+    app.dependency_overrides[get_replica_db_session] = override_get_db_session
+    yield httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+    app.dependency_overrides.pop(get_db_session, None)
+    app.dependency_overrides.pop(get_replica_db_session, None)
+
+
+@pytest.fixture
+def headers(file_engine):
+    with Session(file_engine) as session:
+        user = User(email="burst@example.com", hashed_password="x")
+        session.add(user)
+        session.commit()
+        token = AuthService.create_access_token(data={"sub": user.email, "user_id": str(user.id)})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def slow_pages(monkeypatch):
+    """Count list queries and keep each one in flight long enough to overlap"""
+    calls = []
+    original = TaskService.get_tasks_page
+
+    def get_tasks_page(*args, **kwargs):
+        calls.append(kwargs.get("limit"))
+        time.sleep(0.2)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(TaskService, "get_tasks_page", staticmethod(get_tasks_page))
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_burst_of_identical_reads_runs_one_query(async_client, headers, slow_pages):
+    async with async_client as client:
+        await client.post("/tasks/", json={"title": "Shared"}, headers=headers)
+        responses = await asyncio.gather(*[client.get("/tasks/", headers=headers) for _ in range(8)])
+        other_page = await client.get("/tasks/", params={"limit": 5}, headers=headers)
+
+    assert [response.status_code for response in responses] == [200] * 8
+    assert len({response.content for response in responses}) == 1
+    assert len({response.headers["ETag"] for response in responses}) == 1
+    assert [task["title"] for task in responses[0].json()] == ["Shared"]
+    # One query for the burst, one for the differently-parameterized read
+    assert slow_pages == [100, 5]
+    assert other_page.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_reads_after_a_write_do_not_join_an_older_flight(async_client, headers, slow_pages):
+    async with async_client as client:
+        stale = asyncio.create_task(client.get("/tasks/", headers=headers))
+        await asyncio.sleep(0.05)  # the first read is in flight
+        created = await client.post("/tasks/", json={"title": "New"}, headers=headers)
+        assert created.status_code == 200
+        fresh = await client.get("/tasks/", headers=headers)
+        await stale
+
+    assert [task["title"] for task in fresh.json()] == ["New"]
+    assert len(slow_pages) == 2
@@ -0,0 +1,149 @@
+import os
+
+from sqlmodel import Session, create_engine
+
+from src.database import ALEMBIC_INI, run_migrations
+from src.models.todo_task import TodoTask, TodoTaskCreate
+from src.models.user import User
+from src.services.task_service import TaskService
+
+
+def _search(client, headers, q, **params):
+    response = client.get("/tasks/search", params={"q": q, **params}, headers=headers)
+    assert response.status_code == 200, response.text
+    return response
+
+
+def _titles(response):
+    return [task["title"] for task in response.json()]
+
+
+def test_search_ranks_title_matches_first(client, auth_headers):
+    client.post("/tasks/", json={"title": "Call the plumber", "description": "kitchen sink leaking"},
+                headers=auth_headers)
+    client.post("/tasks/", json={"title": "Fix kitchen sink", "description": "buy washers"}, headers=auth_headers)
+    client.post("/tasks/", json={"title": "Groceries", "description": "milk, eggs"}, headers=auth_headers)
+
+    assert _titles(_search(client, auth_headers, "sink")) == ["Fix kitchen sink", "Call the plumber"]
+    # Stemming: "leaks" matches "leaking"
+    assert _titles(_search(client, auth_headers, "leaks")) == ["Call the plumber"]
+    # Every word must match
+    assert _titles(_search(client, auth_headers, "kitchen washers")) == ["Fix kitchen sink"]
+    # Stray FTS syntax is treated as plain words
+    assert _titles(_search(client, auth_headers, 'milk" (eggs*')) == ["Groceries"]
+    assert _search(client, auth_headers, "!!!").json() == []
+
+
+def test_search_follows_updates_and_deletes(client, auth_headers):
+    task = client.post("/tasks/", json={"title": "Renew passport"}, headers=auth_headers).json()
+    assert _titles(_search(client, auth_headers, "passport")) == ["Renew passport"]
+
+    client.put(f"/tasks/{task['id']}", json={"title": "Renew licence"}, headers=auth_headers)
+    assert _search(client, auth_headers, "passport").json() == []
+    assert _titles(_search(client, auth_headers, "licence")) == ["Renew licence"]
+
+    client.delete(f"/tasks/{task['id']}", headers=auth_headers)
+    assert _search(client, auth_headers, "licence").json() == []
+
+
+def test_search_is_scoped_and_paginated(client, auth_headers, db_session):
+    other = User(email="other@example.com", hashed_password="x")
+    db_session.add(other)
+    db_session.commit()
+    db_session.add(TodoTask(title="Report for someone else", owner_id=other.id))
+    db_session.commit()
+    client.post("/tasks/batch", headers=auth_headers, json={
+        "operations": [{"op": "create", "data": {"title": f"Report {i}"}} for i in range(5)]
+    })
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = _search(client, auth_headers, "report", **params)
+        seen.extend(_titles(response))
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert sorted(seen) == [f"Report {i}" for i in range(5)]
+
+    first = _search(client, auth_headers, "report", limit=2)
+    mismatched = client.get("/tasks/search", params={"q": "other", "cursor": first.headers["X-Next-Cursor"]},
+                            headers=auth_headers)
+    assert mismatched.status_code == 400
+
+
+def test_search_pages_are_stable_across_other_users_writes(client, auth_headers, db_session):
+    client.post("/tasks/batch", headers=auth_headers, json={"operations": [
+        {"op": "create", "data": {"title": f"Report {'draft ' * i}{i}", "description": "report " * (i % 3)}}
+        for i in range(6)
+    ]})
+    other = User(email="other@example.com", hashed_password="x")
+    db_session.add(other)
+    db_session.commit()
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = _search(client, auth_headers, "report", **params)
+        seen.extend(_titles(response))
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        # Another user's writes between page requests must not shift this user's ranking
+        db_session.add_all([TodoTask(title="Report " * 20, description="report draft", owner_id=other.id)
+                            for _ in range(20)])
+        db_session.commit()
+    assert sorted(seen) == sorted(_titles(_search(client, auth_headers, "report", limit=10)))
+    assert len(seen) == 6
+
+
+def test_search_revalidates_with_list_version(client, auth_headers):
+    client.post("/tasks/", json={"title": "Water plants"}, headers=auth_headers)
+    etag = _search(client, auth_headers, "plants").headers["ETag"]
+    cached = client.get("/tasks/search", params={"q": "plants"}, headers={**auth_headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+
+    client.post("/tasks/", json={"title": "Repot plants"}, headers=auth_headers)
+    fresh = client.get("/tasks/search", params={"q": "plants"}, headers={**auth_headers, "If-None-Match": etag})
+    assert fresh.status_code == 200 and len(fresh.json()) == 2
+
+
+def test_migration_indexes_existing_tasks(tmp_path):
+    """Tasks written before the search migration are found after it"""
+    from alembic import command
+    from alembic.config import Config
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'search.db'}")
+    run_migrations(bind=engine)
+    alembic_cfg = Config(ALEMBIC_INI)
+    alembic_cfg.set_main_option("script_location", os.path.join(os.path.dirname(ALEMBIC_INI), "migrations"))
+    with engine.begin() as conn:
+        alembic_cfg.attributes["connection"] = conn
+        command.downgrade(alembic_cfg, "0004_task_change_feed")
+
+    with Session(engine) as session:
+        user = User(email="search@example.com", hashed_password="x")
+        session.add(user)
+        session.commit()
+        session.add(TodoTask(title="Legacy entry", owner_id=user.id))
+        session.commit()
+
+        run_migrations(bind=engine)
+
+        rows, _ = TaskService.search_tasks(str(user.id), session, "legacy")
+        assert [row["title"] for row in rows] == ["Legacy entry"]
+
+
+def test_rebuild_repairs_index_after_rowid_renumbering(db_session, user):
+    from sqlalchemy import text
+
+    for title in ("Alpha report", "Beta report", "Gamma report"):
+        TaskService.create_task(TodoTaskCreate(title=title), user.id, db_session)
+    # What VACUUM may do to a table without an INTEGER PRIMARY KEY; no trigger sees it
+    db_session.execute(text("UPDATE todotask SET rowid = rowid + 100"))
+    db_session.commit()
+    assert TaskService.search_tasks(str(user.id), db_session, "beta")[0] == []
+
+    assert TaskService.rebuild_search_index(db_session) is True
+    rows, _ = TaskService.search_tasks(str(user.id), db_session, "beta")
+    assert [row["title"] for row in rows] == ["Beta report"]
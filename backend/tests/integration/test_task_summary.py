@@ -0,0 +1,153 @@
+from sqlalchemy import update
+from sqlmodel import select
+
+from src.maintenance import main as maintenance_main
+from src.models.todo_task import TodoTask, UserTaskState
+from src.services.task_service import TaskService
+
+
+def _summary(client, headers):
+    response = client.get("/tasks/summary", headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _counted(db_session, user):
+    """Summary computed the slow way, from the tasks themselves"""
+    db_session.expire_all()
+    tasks = db_session.exec(select(TodoTask).where(TodoTask.owner_id == user.id)).all()
+    completed = sum(task.completed for task in tasks)
+    return {
+        "total": len(tasks), "open": len(tasks) - completed, "completed": completed,
+        "by_priority": {p: sum(task.priority == p for task in tasks) for p in ("low", "medium", "high")},
+    }
+
+
+def test_summary_before_any_task(client, auth_headers):
+    assert _summary(client, auth_headers) == {
+        "total": 0, "open": 0, "completed": 0, "by_priority": {"low": 0, "medium": 0, "high": 0},
+    }
+
+
+def test_every_mutation_path_keeps_counters_exact(client, auth_headers, db_session, user):
+    a = client.post("/tasks/", json={"title": "A", "priority": "high"}, headers=auth_headers).json()
+    b = client.post("/tasks/", json={"title": "B", "completed": True, "priority": "low"}, headers=auth_headers).json()
+    assert _summary(client, auth_headers) == _counted(db_session, user)
+
+    client.put(f"/tasks/{a['id']}", json={"completed": True, "priority": "low"}, headers=auth_headers)
+    client.put(f"/tasks/{b['id']}", json={"title": "B2"}, headers=auth_headers)
+    assert _summary(client, auth_headers) == _counted(db_session, user)
+
+    client.delete(f"/tasks/{b['id']}", headers=auth_headers)
+    assert _summary(client, auth_headers) == _counted(db_session, user)
+
+    client.post("/tasks/batch", headers=auth_headers, json={"operations": [
+        {"op": "create", "data": {"title": "C", "priority": "medium"}},
+        {"op": "create", "data": {"title": "D", "completed": True}},
+        {"op": "update", "id": a["id"], "data": {"completed": False, "priority": "high"}},
+        {"op": "create", "data": {"title": ""}},  # invalid, not counted
+    ]})
+    assert _summary(client, auth_headers) == _counted(db_session, user)
+
+    client.post("/tasks/import", content=b'{"title": "E", "priority": "low"}\n{"title": "F", "completed": true}\n',
+                headers=auth_headers)
+    summary = _summary(client, auth_headers)
+    assert summary == _counted(db_session, user)
+    assert summary["total"] == 5
+
+    ids = [task["id"] for task in client.get("/tasks/", headers=auth_headers).json()]
+    client.post("/tasks/batch", headers=auth_headers,
+                json={"operations": [{"op": "delete", "id": task_id} for task_id in ids[:3]]})
+    assert _summary(client, auth_headers) == _counted(db_session, user)
+
+
+def test_failed_mutations_leave_counters_alone(client, auth_headers, db_session, user):
+    client.post("/tasks/", json={"title": "Only"}, headers=auth_headers)
+    before = _summary(client, auth_headers)
+    missing = "00000000-0000-0000-0000-000000000000"
+    assert client.put(f"/tasks/{missing}", json={"completed": True}, headers=auth_headers).status_code == 404
+    assert client.delete(f"/tasks/{missing}", headers=auth_headers).status_code == 404
+    assert _summary(client, auth_headers) == before
+
+
+def test_summary_revalidates_with_etag(client, auth_headers):
+    client.post("/tasks/", json={"title": "A"}, headers=auth_headers)
+    etag = client.get("/tasks/summary", headers=auth_headers).headers["ETag"]
+    assert client.get("/tasks/summary", headers={**auth_headers, "If-None-Match": etag}).status_code == 304
+    client.post("/tasks/", json={"title": "B"}, headers=auth_headers)
+    assert client.get("/tasks/summary", headers={**auth_headers, "If-None-Match": etag}).status_code == 200
+
+
+def test_repair_fixes_drift(client, auth_headers, db_session, user):
+    for i in range(3):
+        client.post("/tasks/", json={"title": f"T{i}", "completed": i == 0}, headers=auth_headers)
+    expected = _counted(db_session, user)
+
+    db_session.execute(update(UserTaskState).where(UserTaskState.owner_id == user.id)
+                       .values(task_count=99, completed_count=-1, high_priority_count=7))
+    db_session.commit()
+    assert _summary(client, auth_headers) != expected
+
+    assert TaskService.repair_task_counts(db_session) == 1
+    assert _summary(client, auth_headers) == expected
+    # Nothing left to fix
+    assert TaskService.repair_task_counts(db_session, str(user.id)) == 0
+
+
+def test_repair_creates_missing_counter_rows(db_session, user):
+    # Tasks inserted behind the service's back, e.g. by a manual data fix
+    db_session.add(TodoTask(title="Orphan", owner_id=user.id, priority="high"))
+    db_session.commit()
+
+    assert TaskService.repair_task_counts(db_session) == 1
+    _, _, summary = TaskService.get_task_summary(str(user.id), db_session)
+    assert summary.total == 1 and summary.by_priority.high == 1
+
+
+def test_repair_cli(monkeypatch, sqlite_engine, db_session, user):
+    import src.maintenance as maintenance
+
+    monkeypatch.setattr(maintenance, "engine", sqlite_engine)
+    db_session.add(TodoTask(title="Orphan", owner_id=user.id))
+    db_session.commit()
+
+    maintenance_main(["repair-task-counts"])
+    assert TaskService.get_task_summary(str(user.id), db_session)[2].total == 1
+
+
+def test_migration_backfills_counters(tmp_path):
+    """Tasks written before the counters migration are counted after it"""
+    import os
+
+    from alembic import command
+    from alembic.config import Config
+    from sqlmodel import Session, create_engine
+
+    from src.database import ALEMBIC_INI, run_migrations
+    from src.models.user import User
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'counters.db'}")
+    run_migrations(bind=engine)
+    alembic_cfg = Config(ALEMBIC_INI)
+    alembic_cfg.set_main_option("script_location", os.path.join(os.path.dirname(ALEMBIC_INI), "migrations"))
+    with engine.begin() as conn:
+        alembic_cfg.attributes["connection"] = conn
+        command.downgrade(alembic_cfg, "0005_task_search")
+        user_id = conn.exec_driver_sql(
+            "INSERT INTO user (id, email, hashed_password, is_active, created_at, updated_at) "
+            "VALUES ('0123456789abcdef0123456789abcdef', 'counters@example.com', 'x', 1, "
+            "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP) RETURNING id"
+        ).scalar()
+        for title, completed, priority in (("A", 1, "high"), ("B", 0, "high"), ("C", 0, "low")):
+            conn.exec_driver_sql(
+                "INSERT INTO todotask (id, title, completed, priority, owner_id, created_at, updated_at) "
+                f"VALUES (lower(hex(randomblob(16))), '{title}', {completed}, '{priority}', '{user_id}', "
+                "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            )
+
+    run_migrations(bind=engine)
+    with Session(engine) as session:
+        user = session.exec(select(User)).one()
+        _, _, summary = TaskService.get_task_summary(str(user.id), session)
+    assert (summary.total, summary.completed, summary.open) == (3, 1, 2)
+    assert (summary.by_priority.low, summary.by_priority.medium, summary.by_priority.high) == (1, 0, 2)
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import QueuePool
+
+from src.services.health import ReadinessProbe
+
+
+def _count_selects(engine):
+    statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    return statements
+
+
+@pytest.mark.asyncio
+async def test_concurrent_probes_share_one_cached_query(sqlite_engine):
+    probe = ReadinessProbe(sqlite_engine, cache_seconds=60)
+    statements = _count_selects(sqlite_engine)
+
+    reports = await asyncio.gather(*(probe.check() for _ in range(200)))
+
+    assert all(report["ready"] for report in reports)
+    assert statements == ["SELECT 1"]
+    assert (await probe.check())["database"]["cached"] is True
+
+
+@pytest.mark.asyncio
+async def test_unreachable_database_is_not_ready(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'missing' / 'db.sqlite'}")
+    report = await ReadinessProbe(engine).check()
+    assert report["ready"] is False
+    assert report["reasons"] == ["database unavailable"]
+    assert "OperationalError" in report["database"]["error"]
+
+
+@pytest.mark.asyncio
+async def test_slow_database_times_out(sqlite_engine, monkeypatch):
+    probe = ReadinessProbe(sqlite_engine, timeout=0.05)
+
+    async def hang():
+        await asyncio.sleep(5)
+
+    monkeypatch.setattr(probe, "_select_one", hang)
+    report = await probe.check()
+    assert report["ready"] is False
+    assert "timed out" in report["database"]["error"]
+
+
+@pytest.mark.asyncio
+async def test_saturated_pool_sheds_traffic(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=QueuePool,
+                           pool_size=1, max_overflow=0)
+    probe = ReadinessProbe(engine, cache_seconds=60)
+    assert (await probe.check())["ready"] is True
+
+    with engine.connect():
+        report = await probe.check()
+    assert report["reasons"] == ["connection pool saturated"]
+    assert report["pool"] == {"checked_out": 1, "capacity": 1, "saturation": 1.0}
+    engine.dispose()
+
+
+def test_probe_endpoints(client, sqlite_engine, monkeypatch):
+    probe = ReadinessProbe(sqlite_engine)
+    monkeypatch.setattr("src.api.health_router.readiness_probe", probe)
+
+    assert client.get("/health/live").json() == {"status": "healthy"}
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+
+    probe.draining = True
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["reasons"] == ["shutting down"]
@@ -0,0 +1,63 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from src import metrics
+from src.database import instrument_engine, QUERY_SECONDS
+from src.metrics import Counter, Histogram, exposition
+
+
+@pytest.fixture
+def scratch_metrics():
+    """Metrics created in a test are removed from the registry afterwards"""
+    registered = len(metrics.REGISTRY)
+    yield
+    del metrics.REGISTRY[registered:]
+
+
+def test_exposition_format(scratch_metrics):
+    requests = Counter("test_requests_total", "Requests", ["path"])
+    latency = Histogram("test_latency_seconds", "Latency", buckets=(0.1, 1.0))
+    requests.labels(path='/a"b').inc(2)
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5)
+
+    text_format = exposition()
+    assert "# TYPE test_requests_total counter" in text_format
+    assert 'test_requests_total{path="/a\\"b"} 2' in text_format
+    assert 'test_latency_seconds_bucket{le="0.1"} 1' in text_format
+    assert 'test_latency_seconds_bucket{le="1.0"} 2' in text_format
+    assert 'test_latency_seconds_bucket{le="+Inf"} 3' in text_format
+    assert "test_latency_seconds_count 3" in text_format
+
+
+def test_metrics_endpoint_labels_routes_by_template(client, auth_headers):
+    task_id = client.post("/tasks/", json={"title": "Measured"}, headers=auth_headers).json()["id"]
+    client.get(f"/tasks/{task_id}", headers=auth_headers)
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'http_request_duration_seconds_count{method="GET",route="/tasks/{task_id}"}' in response.text
+    assert 'http_requests_total{method="POST",route="/tasks/",status="200"}' in response.text
+    assert task_id not in response.text
+    assert "threadpool_threads_limit" in response.text
+
+
+def test_metrics_token(client, monkeypatch):
+    monkeypatch.setattr("src.api.metrics_router.METRICS_TOKEN", "scrape-secret")
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"}).status_code == 200
+
+
+def test_query_durations_by_operation():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine, "test")
+    before = QUERY_SECONDS.count(engine="test", operation="select")
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with pytest.raises(Exception):
+            conn.execute(text("SELECT * FROM missing_table"))
+        conn.execute(text("SELECT 2"))
+    assert QUERY_SECONDS.count(engine="test", operation="select") == before + 2
+    engine.dispose()
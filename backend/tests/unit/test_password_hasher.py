@@ -0,0 +1,57 @@
+import asyncio
+import pytest
+
+from src.services.password_hasher import (
+    HASH_REJECTED,
+    HASH_SECONDS,
+    MIN_ARGON2_MEMORY_COST,
+    MIN_ARGON2_TIME_COST,
+    PasswordHasher,
+    PasswordHasherBusy,
+    calibrate_argon2,
+)
+
+# Cheap parameters keep the tests fast; production uses calibrated or passlib defaults
+FAST_PARAMS = {"time_cost": 1, "memory_cost": 1024, "parallelism": 1}
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(workers=1, max_pending=4, params=FAST_PARAMS)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_on_process_pool(hasher):
+    before = HASH_SECONDS.count(operation="verify")
+
+    hashed = await hasher.hash("correct horse")
+
+    assert hashed.startswith("$argon2")
+    assert await hasher.verify("correct horse", hashed) is True
+    assert await hasher.verify("wrong horse", hashed) is False
+    assert await hasher.verify("anything", "not-a-hash") is False
+    assert HASH_SECONDS.count(operation="verify") == before + 3
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_new_work():
+    hasher = PasswordHasher(workers=0, max_pending=1, params=FAST_PARAMS)
+    rejected = HASH_REJECTED.value()
+
+    results = await asyncio.gather(
+        *(hasher.hash("password") for _ in range(3)), return_exceptions=True
+    )
+
+    assert sum(isinstance(r, PasswordHasherBusy) for r in results) == 2
+    assert HASH_REJECTED.value() == rejected + 2
+
+
+def test_calibration_respects_floor_and_budget():
+    generous = calibrate_argon2(1.0, {"time_cost": 2, "memory_cost": MIN_ARGON2_MEMORY_COST, "parallelism": 1})
+    assert generous["time_cost"] > MIN_ARGON2_TIME_COST
+
+    impossible = calibrate_argon2(0.0, {"time_cost": 2, "memory_cost": 4 * MIN_ARGON2_MEMORY_COST, "parallelism": 1})
+    assert impossible["time_cost"] == MIN_ARGON2_TIME_COST
+    assert impossible["memory_cost"] == MIN_ARGON2_MEMORY_COST
@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from src.services.singleflight import SingleFlight, forget_on_commit, task_list_flights
+
+
+def _loader(calls, result="page", gate=None, error=None):
+    async def load():
+        calls.append(1)
+        number = len(calls)
+        if gate is not None:
+            await gate.wait()
+        if error is not None:
+            raise error
+        return f"{result}-{number}"
+    return load
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_load():
+    flights, calls, gate = SingleFlight(), [], asyncio.Event()
+    waiting = [asyncio.create_task(flights.do("u1", ("list", 100), _loader(calls, gate=gate))) for _ in range(5)]
+    await asyncio.sleep(0)
+    gate.set()
+    assert await asyncio.gather(*waiting) == ["page-1"] * 5
+    assert len(calls) == 1
+    assert flights.in_flight("u1") == 0
+
+    # Finished flights are not cached
+    assert await flights.do("u1", ("list", 100), _loader(calls)) == "page-2"
+
+
+@pytest.mark.asyncio
+async def test_different_keys_and_users_do_not_share():
+    flights, calls, gate = SingleFlight(), [], asyncio.Event()
+    waiting = [
+        asyncio.create_task(flights.do("u1", ("list", 100), _loader(calls, gate=gate))),
+        asyncio.create_task(flights.do("u1", ("list", 50), _loader(calls, gate=gate))),
+        asyncio.create_task(flights.do("u2", ("list", 100), _loader(calls, gate=gate))),
+    ]
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(*waiting)
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter():
+    flights, calls, gate = SingleFlight(), [], asyncio.Event()
+    waiting = [asyncio.create_task(flights.do("u1", "k", _loader(calls, gate=gate, error=ValueError("bad cursor"))))
+               for _ in range(3)]
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(*waiting, return_exceptions=True)
+    assert [str(result) for result in results] == ["bad cursor"] * 3
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_forget_detaches_the_flight_from_later_callers():
+    flights, calls, first_gate, second_gate = SingleFlight(), [], asyncio.Event(), asyncio.Event()
+    before = asyncio.create_task(flights.do("u1", "k", _loader(calls, gate=first_gate)))
+    await asyncio.sleep(0)
+
+    flights.forget("u1")  # a write committed
+    after = asyncio.create_task(flights.do("u1", "k", _loader(calls, gate=second_gate)))
+    await asyncio.sleep(0)
+    first_gate.set()
+    second_gate.set()
+    assert await before == "page-1"
+    assert await after == "page-2"
+    assert flights.in_flight("u1") == 0
+
+
+@pytest.mark.asyncio
+async def test_waiters_take_over_when_the_leader_is_cancelled():
+    flights, calls, gate = SingleFlight(), [], asyncio.Event()
+    leader = asyncio.create_task(flights.do("u1", "k", _loader(calls, gate=gate)))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flights.do("u1", "k", _loader(calls, gate=gate)))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    gate.set()
+    assert await follower == "page-2"
+    assert leader.cancelled()
+
+
+def test_commits_forget_the_owners_flights(db_session, monkeypatch):
+    forgotten = []
+    monkeypatch.setattr(task_list_flights, "forget", forgotten.append)
+
+    db_session.connection()  # begin a transaction
+    forget_on_commit(db_session, "u1")
+    db_session.rollback()
+    db_session.commit()
+    assert forgotten == []
+
+    forget_on_commit(db_session, "u1")
+    db_session.commit()
+    assert forgotten == ["u1"]
@@ -0,0 +1,149 @@
+import asyncio
+import json
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.api.task_router import _sse_stream
+from src.models.todo_task import TodoTaskCreate, TodoTaskUpdate
+from src.services.task_events import (
+    NOTIFY_MAX_PAYLOAD, LocalBackend, PostgresNotifyBackend, TaskEventBus, TooManyConnections, task_events, _encode,
+)
+from src.services.task_service import TaskService
+
+
+@pytest.mark.asyncio
+async def test_connections_per_user_are_capped():
+    bus = TaskEventBus(LocalBackend(), max_connections_per_user=2)
+    first, second = bus.subscribe("u1"), bus.subscribe("u1")
+    with pytest.raises(TooManyConnections):
+        bus.subscribe("u1")
+    bus.subscribe("u2")  # other users are unaffected
+
+    first.close()
+    bus.subscribe("u1")
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_gets_resync_instead_of_backlog():
+    bus = TaskEventBus(LocalBackend(), queue_size=3)
+    subscription = bus.subscribe("u1")
+
+    for version in range(1, 11):
+        bus.dispatch(_encode("u1", "tasks", version))
+    await asyncio.sleep(0)
+
+    # The backlog is replaced by one resync and later events are discarded until it is read
+    resync = await subscription.get(timeout=0.1)
+    assert resync.type == "resync"
+    assert await subscription.get(timeout=0.05) is None
+
+    bus.dispatch(_encode("u1", "tasks", 11))
+    await asyncio.sleep(0)
+    assert (await subscription.get(timeout=0.1)).version == 11
+    subscription.close()
+
+
+@pytest.mark.asyncio
+async def test_mutations_publish_after_commit_only(db_session, user):
+    subscription = task_events.subscribe(user.id)
+    try:
+        task = TaskService.create_task(TodoTaskCreate(title="Pushed"), user.id, db_session)
+        await asyncio.sleep(0)
+        created = await subscription.get(timeout=0.1)
+        body = json.loads(created.data)
+        assert body["changed"][0]["title"] == "Pushed" and body["deleted"] == []
+
+        # A missing task rolls back, so nothing is published
+        assert TaskService.update_task(str(user.id), user.id, TodoTaskUpdate(title="x"), db_session) is None
+        await asyncio.sleep(0)
+        assert await subscription.get(timeout=0.05) is None
+
+        TaskService.delete_task(task.id, user.id, db_session)
+        await asyncio.sleep(0)
+        deleted = json.loads((await subscription.get(timeout=0.1)).data)
+        assert deleted["deleted"] == [str(task.id)]
+        assert deleted["version"] == body["version"] + 1
+    finally:
+        subscription.close()
+
+
+@pytest.mark.asyncio
+async def test_sse_stream_formats_events_and_heartbeats(monkeypatch):
+    monkeypatch.setattr("src.api.task_router.TASK_EVENTS_HEARTBEAT_SECONDS", 0.01)
+    bus = TaskEventBus(LocalBackend())
+    subscription = bus.subscribe("u1")
+    stream = _sse_stream(subscription)
+
+    assert (await stream.__anext__()).startswith("retry:")
+    assert await stream.__anext__() == ": keepalive\n\n"
+    bus.dispatch(_encode("u1", "tasks", 7, changed=[], deleted=[]))
+    chunk = await stream.__anext__()
+    assert chunk.startswith("event: tasks\nid: 7\ndata: {")
+
+    await stream.aclose()
+    assert "u1" not in bus._subscribers
+
+
+def test_event_stream_over_cap_is_429(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(task_events, "max_connections_per_user", 0)
+    response = client.get("/tasks/events", headers=auth_headers)
+    assert response.status_code == 429
+
+
+def test_event_stream_accepts_events_token_in_query(client, auth_headers, monkeypatch):
+    # With the cap at 0 an authenticated request ends in 429 instead of streaming
+    monkeypatch.setattr(task_events, "max_connections_per_user", 0)
+    issued = client.post("/tasks/events/token", headers=auth_headers).json()
+    assert issued["expires_in"] == 60
+
+    assert client.get("/tasks/events", params={"token": issued["token"]}).status_code == 429
+    assert client.get("/tasks/events").status_code == 401
+
+    # Regular access tokens stay out of URLs, and events tokens only open the stream
+    access_token = auth_headers["Authorization"].split()[1]
+    assert client.get("/tasks/events", params={"token": access_token}).status_code == 401
+    assert client.get("/tasks/", headers={"Authorization": f"Bearer {issued['token']}"}).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_import_publishes_one_resync(db_session, user):
+    subscription = task_events.subscribe(user.id)
+    try:
+        records = [(line, {"title": f"Imported {line}"}, None) for line in range(1, 51)]
+        assert TaskService.import_tasks(records, user.id, db_session) == (50, [])
+        await asyncio.sleep(0)
+        event = await subscription.get(timeout=0.1)
+        assert event.type == "resync" and json.loads(event.data)["version"] == event.version
+        assert await subscription.get(timeout=0.05) is None
+    finally:
+        subscription.close()
+
+
+def test_notify_payload_stays_under_postgres_limit():
+    backend = PostgresNotifyBackend("postgresql+psycopg://localhost/todo")
+    session = MagicMock()
+
+    def sent_payload(task_event):
+        session.reset_mock()
+        backend.publish(session, task_event)
+        statement = session.execute.call_args.args[0]
+        channel, payload = statement.compile().params.values()
+        assert channel == "task_events"
+        return payload
+
+    # Quote-heavy titles just under the limit would double in size if the event were re-escaped
+    owner_id = "3f2c9a4e-0000-4000-8000-000000000001"
+    changed = [{"title": '"' * 60} for _ in range(55)]
+    near_limit = _encode(owner_id, "tasks", 3, changed=changed, deleted=[])
+    assert len(near_limit.data) > NOTIFY_MAX_PAYLOAD - 600
+    payload = sent_payload(near_limit)
+    assert len(payload.encode()) <= NOTIFY_MAX_PAYLOAD
+    assert payload == f"{owner_id}\n{near_limit.data}"
+
+    # Over the limit: a resync is sent instead
+    over_limit = _encode(owner_id, "tasks", 4, changed=changed * 2, deleted=[])
+    owner, _, data = sent_payload(over_limit).partition("\n")
+    assert owner == owner_id
+    assert json.loads(data) == {"type": "resync", "version": 4}
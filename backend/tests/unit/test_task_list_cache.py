@@ -0,0 +1,78 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.services.task_list_cache import ENTRY_OVERHEAD_BYTES, InProcessBackend, TaskListCache, task_list_cache
+from src.services.task_service import TaskService
+from src.services.user_cache import RedisBackend
+from tests.helpers import FakeRedis
+
+PARAMS = (100, None, None, None, "created_at")
+
+
+@pytest.fixture(params=["memory", "redis"])
+def list_cache(request):
+    """Swap the application cache for a fresh one on each backend"""
+    backend = InProcessBackend(max_bytes=1 << 20) if request.param == "memory" else RedisBackend(FakeRedis())
+    previous = task_list_cache.backend
+    task_list_cache.backend = backend
+    yield task_list_cache
+    task_list_cache.backend = previous
+
+
+@pytest.mark.asyncio
+async def test_entries_are_keyed_by_version_and_params(list_cache):
+    await list_cache.set("u1", 3, PARAMS, b"[1]", "next-cursor")
+    assert await list_cache.get("u1", 3, PARAMS) == (b"[1]", "next-cursor")
+    assert await list_cache.get("u1", 4, PARAMS) is None
+    assert await list_cache.get("u1", 3, (50,) + PARAMS[1:]) is None
+    assert await list_cache.get("u2", 3, PARAMS) is None
+
+    await list_cache.set("u1", 4, PARAMS, b"[]", None)
+    assert await list_cache.get("u1", 4, PARAMS) == (b"[]", None)
+
+
+@pytest.mark.asyncio
+async def test_in_process_backend_evicts_least_recent_under_budget():
+    entry = 1000
+    cache = TaskListCache(InProcessBackend(max_bytes=3 * (entry + 60 + ENTRY_OVERHEAD_BYTES)))
+    for version in range(3):
+        await cache.set("u1", version, PARAMS, b"x" * entry, None)
+    assert await cache.get("u1", 0, PARAMS) is not None  # now the most recent
+
+    await cache.set("u1", 3, PARAMS, b"x" * entry, None)
+    assert await cache.get("u1", 1, PARAMS) is None
+    assert await cache.get("u1", 0, PARAMS) is not None
+    assert cache.backend.size <= cache.backend.max_bytes
+
+    # A page larger than the whole budget is not cached and evicts nothing
+    await cache.set("u1", 4, PARAMS, b"x" * (10 * entry), None)
+    assert await cache.get("u1", 4, PARAMS) is None
+    assert await cache.get("u1", 3, PARAMS) is not None
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_never_hits():
+    cache = TaskListCache(None)
+    await cache.set("u1", 1, PARAMS, b"[]", None)
+    assert await cache.get("u1", 1, PARAMS) is None
+
+
+def test_repeat_list_reads_skip_the_query(client, auth_headers, list_cache):
+    for title in ("A", "B", "C"):
+        client.post("/tasks/", json={"title": title}, headers=auth_headers)
+
+    with patch.object(TaskService, "get_tasks_page", wraps=TaskService.get_tasks_page) as load:
+        first = client.get("/tasks/", params={"limit": 2}, headers=auth_headers)
+        second = client.get("/tasks/", params={"limit": 2}, headers=auth_headers)
+        assert load.call_count == 1
+        assert second.content == first.content
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert second.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+
+        # Any mutation bumps the version, so the next read misses
+        task_id = first.json()[0]["id"]
+        client.put(f"/tasks/{task_id}", json={"title": "A2"}, headers=auth_headers)
+        third = client.get("/tasks/", params={"limit": 2}, headers=auth_headers)
+        assert load.call_count == 2
+        assert "A2" in [task["title"] for task in third.json()]
@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+
+from src.models.todo_task import TodoTask
+from src.services.task_service import TaskService
+
+
+def _seed_tasks(db_session, owner_id, count):
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for i in range(count):
+        db_session.add(TodoTask(
+            title=f"Task {i:03d}",
+            owner_id=owner_id,
+            completed=i % 2 == 0,
+            priority=["low", "medium", "high"][i % 3],
+            # Pairs of tasks share a timestamp so the id tie-breaker is exercised
+            created_at=base + timedelta(minutes=i // 2),
+            updated_at=base + timedelta(minutes=i // 2),
+        ))
+    db_session.commit()
+
+
+def _walk(db_session, owner_id, **kwargs):
+    seen, cursor = [], None
+    while True:
+        page, cursor = TaskService.get_tasks_page(owner_id, db_session, cursor=cursor, **kwargs)
+        seen.extend(page)
+        if cursor is None:
+            return seen
+
+
+def test_pages_cover_every_task_exactly_once(db_session, user):
+    """Walking the cursor chain returns each task once, in keyset order"""
+    _seed_tasks(db_session, user.id, 25)
+
+    tasks = _walk(db_session, user.id, limit=4)
+
+    assert len(tasks) == 25
+    assert len({t.id for t in tasks}) == 25
+    keys = [(t.created_at, t.id.hex) for t in tasks]
+    assert keys == sorted(keys)
+
+
+def test_descending_sort_and_filters(db_session, user):
+    _seed_tasks(db_session, user.id, 30)
+
+    tasks = _walk(db_session, user.id, limit=3, sort="-created_at",
+                  completed=True, priority="high")
+
+    assert tasks
+    assert all(t.completed and t.priority == "high" for t in tasks)
+    keys = [(t.created_at, t.id.hex) for t in tasks]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_last_page_has_no_cursor(db_session, user):
+    _seed_tasks(db_session, user.id, 3)
+
+    tasks, next_cursor = TaskService.get_tasks_page(user.id, db_session, limit=3)
+
+    assert len(tasks) == 3
+    assert next_cursor is None
+
+
+def test_cursor_is_bound_to_sort_order(db_session, user):
+    _seed_tasks(db_session, user.id, 5)
+    _, next_cursor = TaskService.get_tasks_page(user.id, db_session, limit=2)
+
+    with pytest.raises(ValueError):
+        TaskService.get_tasks_page(user.id, db_session, cursor=next_cursor, sort="title")
+
+    with pytest.raises(ValueError):
+        TaskService.get_tasks_page(user.id, db_session, cursor="not-a-cursor")
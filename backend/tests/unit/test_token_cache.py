@@ -0,0 +1,63 @@
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.middleware.auth_middleware import get_current_user_from_token
+from src.services.auth_service import AuthService
+from src.services.token_cache import TokenCache, token_cache
+
+
+def _payload(user_id="u1", exp_in=600):
+    return {"sub": f"{user_id}@example.com", "user_id": user_id, "exp": time.time() + exp_in}
+
+
+def test_hit_after_put_and_miss_for_unknown_token():
+    cache = TokenCache(maxsize=10, ttl=60)
+    cache.put("token-a", _payload())
+
+    assert cache.get("token-a")["user_id"] == "u1"
+    assert cache.get("token-b") is None
+
+
+def test_entries_never_outlive_exp_claim():
+    cache = TokenCache(maxsize=10, ttl=3600)
+    cache.put("expired", _payload(exp_in=-1))
+    cache.put("no-exp", {"sub": "a@example.com", "user_id": "u1"})
+
+    assert cache.get("expired") is None
+    assert cache.get("no-exp") is None
+
+    cache.put("short", _payload(exp_in=0.05))
+    time.sleep(0.1)
+    assert cache.get("short") is None
+
+
+def test_lru_eviction_and_user_revocation():
+    cache = TokenCache(maxsize=2, ttl=60)
+    cache.put("t1", _payload("u1"))
+    cache.put("t2", _payload("u2"))
+    cache.get("t1")  # t1 is now most recently used
+    cache.put("t3", _payload("u1"))
+
+    assert cache.get("t2") is None
+    assert cache.get("t1") is not None
+
+    cache.invalidate_user("u1")
+    assert cache.get("t1") is None
+    assert cache.get("t3") is None
+
+
+def test_middleware_verifies_each_token_once():
+    token_cache.clear()
+    token = AuthService.create_access_token({"sub": "c@example.com", "user_id": "u9"},
+                                           expires_delta=timedelta(minutes=5))
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    with patch.object(AuthService, "verify_token", wraps=AuthService.verify_token) as verify:
+        for _ in range(5):
+            assert get_current_user_from_token(credentials)["user_id"] == "u9"
+
+    assert verify.call_count == 1
+    token_cache.clear()
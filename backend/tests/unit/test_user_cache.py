@@ -0,0 +1,84 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.services.auth_service import AuthService
+from src.services.user_cache import InProcessBackend, RedisBackend, UserProfileCache, user_cache
+from tests.helpers import FakeRedis
+
+
+@pytest.fixture(params=["memory", "redis"])
+def profile_cache(request):
+    """Swap the application cache for a fresh one on each backend"""
+    backend = InProcessBackend(maxsize=100) if request.param == "memory" else RedisBackend(FakeRedis())
+    previous = user_cache.backend
+    user_cache.backend = backend
+    yield user_cache
+    user_cache.backend = previous
+
+
+@pytest.mark.asyncio
+async def test_in_process_backend_expires_and_evicts():
+    cache = UserProfileCache(InProcessBackend(maxsize=2), ttl=0.05)
+    await cache.set("a", b"1")
+    await cache.set("b", b"2")
+    await cache.set("c", b"3")
+
+    assert await cache.get("a") is None  # evicted by size
+    assert await cache.get("c") == b"3"
+    time.sleep(0.1)
+    assert await cache.get("c") is None  # expired
+
+
+def test_me_is_served_from_cache(client, auth_headers, profile_cache):
+    with patch.object(AuthService, "get_user_by_id", wraps=AuthService.get_user_by_id) as load:
+        first = client.get("/auth/me", headers=auth_headers)
+        second = client.get("/auth/me", headers=auth_headers)
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert load.call_count == 1
+
+
+def test_committed_user_change_invalidates_profile(client, auth_headers, profile_cache, db_session, user):
+    assert client.get("/auth/me", headers=auth_headers).json()["first_name"] is None
+
+    user.first_name = "Ada"
+    db_session.add(user)
+    db_session.commit()
+
+    assert client.get("/auth/me", headers=auth_headers).json()["first_name"] == "Ada"
+
+
+@pytest.mark.asyncio
+async def test_profile_loaded_before_commit_is_not_recached(profile_cache):
+    assert await profile_cache.get("u1") is None
+    # The row changes and commits while this reader is still loading the old one
+    profile_cache.invalidate("u1")
+    await profile_cache.set("u1", b'{"first_name": null}')
+
+    assert await profile_cache.get("u1") is None
+
+
+@pytest.mark.asyncio
+async def test_blocking_invalidation_runs_off_the_event_loop():
+    calls = []
+
+    class SlowRedis(FakeRedis):
+        def set(self, key, value, ex=None, nx=False):
+            calls.append(threading.get_ident())
+            time.sleep(0.05)
+            return super().set(key, value, ex, nx)
+
+    cache = UserProfileCache(RedisBackend(SlowRedis()))
+    await cache.set("u1", b"old")
+    calls.clear()
+
+    # As from an after_commit hook running on the loop (async database mode)
+    cache.invalidate("u1")
+    assert calls == [] or calls[0] != threading.get_ident()
+    # A read in this process waits for the invalidation to land
+    assert await cache.get("u1") is None
+    assert len(calls) == 1 and calls[0] != threading.get_ident()
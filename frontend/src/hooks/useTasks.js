@@ -59,13 +59,19 @@ const useTasks = () => {
     while (retries < maxRetries) {
       try {
         console.log(`Fetching tasks from backend (attempt ${retries + 1}/${maxRetries})...`);
-        const response = await apiClient.get('/tasks/');
-        console.log('Full response:', response);
-        console.log('Response data:', response.data);
-        console.log('Type of response.data:', typeof response.data);
-
-        // Safely extract tasks array from response
-        const tasksArray = getTasksArray(response.data);
+        // The list endpoint is paginated; follow X-Next-Cursor until the last page
+        let tasksArray = [];
+        let cursor = null;
+        do {
+          const response = await apiClient.get('/tasks/', {
+            params: cursor ? { limit: 500, cursor } : { limit: 500 },
+          });
+          console.log('Response data:', response.data);
+
+          // Safely extract tasks array from response
+          tasksArray = tasksArray.concat(getTasksArray(response.data));
+          cursor = response.headers?.['x-next-cursor'] || null;
+        } while (cursor);
         console.log('Extracted tasks array:', tasksArray);
 
         // Remove duplicates by ID to ensure unique keys